@@ -0,0 +1 @@
+"""Benchmarks for the verification pipeline (run with python -m verification.bench)."""
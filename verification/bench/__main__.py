@@ -0,0 +1,91 @@
+"""
+Run the pipeline benchmarks.
+
+Usage:
+    python -m verification.bench                       # Benchmark all scaffolds
+    python -m verification.bench dijkstra bfs          # Benchmark specific scaffolds
+    python -m verification.bench --save                # Write a new baseline
+    python -m verification.bench --compare             # Fail if slower than the baseline
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from ..config import get_settings
+from .pipeline import STAGES, compare, run_benchmarks
+
+
+def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the verification pipeline")
+    parser.add_argument("scaffolds", nargs="*", help="Scaffolds to benchmark (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions of each stage (default: 5)")
+    parser.add_argument(
+        "--latency-ms", type=float, default=50.0,
+        help="Simulated LLM latency for the throughput run (default: 50)",
+    )
+    parser.add_argument(
+        "--jitter-ms", type=float, default=0.0,
+        help="Maximum random latency added to each simulated call (default: 0)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int,
+        help="Maximum in-flight calls (default: VERIFY_PARALLEL_LLM_CALLS)",
+    )
+    parser.add_argument(
+        "--baseline", type=Path,
+        default=get_settings().get_results_path() / "bench" / "baseline.json",
+        help="Baseline file (default: verification_results/bench/baseline.json)",
+    )
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="Exit non-zero on regressions against the baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2,
+        help="Allowed relative slowdown before a stage counts as regressed (default: 0.2)",
+    )
+    args = parser.parse_args()
+
+    report = run_benchmarks(
+        scaffolds=args.scaffolds or None,
+        repeat=args.repeat,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        concurrency=args.concurrency,
+    )
+
+    print(f"{'Scaffold':<22}" + "".join(f"{stage:>14}" for stage in STAGES))
+    for name, stages in report["scaffolds"].items():
+        print(f"{name:<22}" + "".join(f"{stages[stage]:>14.3f}" for stage in STAGES))
+    throughput = report["throughput"]
+    print(f"\nRunner: {throughput['test_cases']} test cases in {throughput['wall_ms']:.0f} ms "
+          f"({throughput['cases_per_second']:.1f}/s at {throughput['latency_ms']:.0f} ms latency, "
+          f"{throughput['concurrency']} in parallel), {throughput['pass_rate']:.1%} passed")
+
+    status = 0
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"\nNo baseline at {args.baseline} (create one with --save)")
+            return 1
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regressions against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            status = 1
+        else:
+            print(f"\nNo regressions against {args.baseline}")
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
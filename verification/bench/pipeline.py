@@ -0,0 +1,271 @@
+"""
+End-to-end pipeline benchmarks.
+
+Times each stage of verifying a scaffold without calling a real model:
+test generation, prompt building, response parsing and validation, plus
+the throughput of the full runner against a replay provider serving
+synthesized correct answers with configurable latency. Results are
+written as a JSON baseline that later runs are compared against.
+
+The bench runners never use the response cache: the synthesized answers
+must not be served to real runs, and cache hits would fake the throughput.
+"""
+
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ..config import get_settings
+from ..generators.base import TestCase
+from ..llm.base import LLMResponse
+from ..llm.replay import Cassette, ReplayProfile, ReplayProvider
+from ..llm.response_parser import IncrementalResponseParser
+from ..registry import SCAFFOLD_REGISTRY, get_all_generators, get_validator_for_scaffold
+from ..runner import ScaffoldJob, VerificationRunner
+
+
+# Expected-value keys holding the answer for each FINAL_* field, in order of preference
+FIELD_KEYS: dict[str, list[str]] = {
+    "FINAL_ANSWER": ["value", "order"],
+    "FINAL_DISTANCES": ["distances", "distance_matrix"],
+    "FINAL_WEIGHT": ["total_weight"],
+    "FINAL_GRID": ["solution"],
+    "FINAL_OPERATIONS": ["min_operations"],
+    "FINAL_MINIMUM": ["minimum_value"],
+}
+
+# Stage timings compared between runs (lower is better)
+STAGES = ["generate_ms", "prompt_ms", "parse_ms", "validate_ms"]
+
+
+def synthesize_answer(test_case: TestCase) -> str:
+    """
+    Build a response containing the correct FINAL_* answer for a test case.
+
+    Args:
+        test_case: Test case to answer.
+
+    Returns:
+        Response text in the output format the prompt asks for.
+    """
+    expected = test_case.expected if isinstance(test_case.expected, dict) else {"value": test_case.expected}
+    lines = ["Following the scaffold step by step.", ""]
+
+    for name in IncrementalResponseParser(test_case.scaffold).required:
+        key = name[len("FINAL_"):].lower()
+        candidates = FIELD_KEYS.get(name, []) + [key, f"{key}s", "value"]
+        value = next((expected[k] for k in candidates if k in expected), None)
+        if value is None and name == "FINAL_DISTANCE" and "path" in expected:
+            value = len(expected["path"]) - 1
+        if value is None:
+            value = 0
+        lines.append(f"{name}: {value if isinstance(value, str) else json.dumps(value)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> float:
+    """
+    Time a function.
+
+    Args:
+        fn: Function to call.
+        repeat: Number of calls.
+
+    Returns:
+        Median time per call in milliseconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def bench_scaffold(runner: VerificationRunner, job: ScaffoldJob, repeat: int) -> dict[str, Any]:
+    """
+    Time the offline stages of verifying one scaffold.
+
+    Args:
+        runner: Runner used to build requests and evaluate responses.
+        job: Scaffold job to benchmark.
+        repeat: Number of timed repetitions of each stage.
+
+    Returns:
+        Median milliseconds for generating the suite and, per test case,
+        building the prompt, parsing the answer and validating it.
+    """
+    generator = get_all_generators()[job.scaffold]
+    scaffold_path = runner._find_scaffold_file(job.scaffold)
+    cases = job.test_suite.test_cases
+    answers = [synthesize_answer(case) for case in cases]
+    parsed = [runner.response_parser.parse(answer, case.scaffold) for case, answer in zip(cases, answers)]
+
+    def validate_all() -> None:
+        for case, answer in zip(cases, parsed):
+            if answer.is_valid:
+                job.validator.validate(case.expected, answer.answer)
+
+    per_case = len(cases) or 1
+    return {
+        "test_cases": len(cases),
+        "generate_ms": measure(generator.generate_suite, repeat),
+        "prompt_ms": measure(lambda: [runner.build_request(scaffold_path, c) for c in cases], repeat) / per_case,
+        "parse_ms": measure(
+            lambda: [runner.response_parser.parse(a, c.scaffold) for c, a in zip(cases, answers)], repeat,
+        ) / per_case,
+        "validate_ms": measure(validate_all, repeat) / per_case,
+    }
+
+
+def record_answers(runner: VerificationRunner, jobs: list[ScaffoldJob], cassette_path: Path) -> None:
+    """
+    Write a cassette answering every test case correctly.
+
+    Args:
+        runner: Runner used to build the requests.
+        jobs: Scaffold jobs to answer.
+        cassette_path: Cassette file to write.
+    """
+    cassette = Cassette(cassette_path)
+    model = runner.llm.default_model
+    for job in jobs:
+        scaffold_path = runner._find_scaffold_file(job.scaffold)
+        for case in job.test_suite.test_cases:
+            cassette.record(
+                runner.build_request(scaffold_path, case),
+                model,
+                LLMResponse(content=synthesize_answer(case), model=model),
+            )
+
+
+async def bench_throughput(
+    jobs: list[ScaffoldJob],
+    cassette_path: Path,
+    latency_ms: float,
+    jitter_ms: float,
+    concurrency: int,
+) -> dict[str, Any]:
+    """
+    Run every job through the runner against a replay provider.
+
+    Args:
+        jobs: Scaffold jobs to run.
+        cassette_path: Cassette answering every test case (see record_answers()).
+        latency_ms: Simulated latency of each LLM call.
+        jitter_ms: Maximum random latency added to each call.
+        concurrency: Maximum in-flight calls.
+
+    Returns:
+        Wall time, test cases per second and pass rate of the run.
+    """
+    provider = ReplayProvider(cassette_path, ReplayProfile(latency_ms=latency_ms, jitter_ms=jitter_ms))
+    runner = VerificationRunner(provider, max_concurrency=concurrency, cache=False)
+    start = time.perf_counter()
+    results = await runner.run_jobs(jobs)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    total = sum(r.total_tests for r in results)
+    passed = sum(r.passed_tests for r in results)
+    return {
+        "test_cases": total,
+        "wall_ms": wall_ms,
+        "cases_per_second": total / (wall_ms / 1000) if wall_ms else 0.0,
+        "pass_rate": passed / total if total else 0.0,
+        "latency_ms": latency_ms,
+        "jitter_ms": jitter_ms,
+        "concurrency": concurrency,
+    }
+
+
+def run_benchmarks(
+    scaffolds: list[str] | None = None,
+    repeat: int = 5,
+    latency_ms: float = 50.0,
+    jitter_ms: float = 0.0,
+    concurrency: int | None = None,
+) -> dict[str, Any]:
+    """
+    Benchmark every stage of the pipeline.
+
+    Args:
+        scaffolds: Scaffolds to benchmark (default: all with a generator).
+        repeat: Number of timed repetitions of each offline stage.
+        latency_ms: Simulated latency of each LLM call in the throughput run.
+        jitter_ms: Maximum random latency added to each simulated call.
+        concurrency: Maximum in-flight calls. Uses settings.parallel_llm_calls if not provided.
+
+    Returns:
+        Benchmark report: environment, per-scaffold stage timings and runner throughput.
+    """
+    settings = get_settings()
+    generators = get_all_generators()
+    names = scaffolds or [s for group in SCAFFOLD_REGISTRY.values() for s in group if s in generators]
+    jobs = [
+        ScaffoldJob(name, generators[name].generate_suite(), get_validator_for_scaffold(name))
+        for name in names
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cassette_path = Path(tmp) / "bench.jsonl"
+        runner = VerificationRunner(ReplayProvider(cassette_path), cache=False)
+        per_scaffold = {job.scaffold: bench_scaffold(runner, job, repeat) for job in jobs}
+        record_answers(runner, jobs, cassette_path)
+        throughput = asyncio.run(bench_throughput(
+            jobs, cassette_path, latency_ms, jitter_ms, concurrency or settings.parallel_llm_calls,
+        ))
+
+    return {
+        "created_at": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "scaffolds": per_scaffold,
+        "throughput": throughput,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.2) -> list[str]:
+    """
+    Find stages that got slower, or answers that stopped passing, since a baseline.
+
+    Args:
+        current: Report from run_benchmarks().
+        baseline: Earlier report to compare against.
+        threshold: Allowed relative slowdown (0.2 = 20%).
+
+    Returns:
+        Description of each regression (empty if none).
+    """
+    regressions = []
+    for name, stages in current["scaffolds"].items():
+        before = baseline.get("scaffolds", {}).get(name)
+        if not before:
+            continue
+        for stage in STAGES:
+            if before.get(stage, 0) > 0 and stages[stage] > before[stage] * (1 + threshold):
+                regressions.append(
+                    f"{name} {stage}: {before[stage]:.3f} -> {stages[stage]:.3f} ms "
+                    f"(+{stages[stage] / before[stage] - 1:.0%})"
+                )
+
+    now = current["throughput"]["cases_per_second"]
+    then = baseline.get("throughput", {}).get("cases_per_second", 0)
+    if then > 0 and now < then / (1 + threshold):
+        regressions.append(f"throughput: {then:.1f} -> {now:.1f} cases/s ({now / then - 1:.0%})")
+
+    # Synthesized answers are fixed, so a lower pass rate means parsing or validation changed
+    now = current["throughput"]["pass_rate"]
+    then = baseline.get("throughput", {}).get("pass_rate", 0)
+    if now < then:
+        regressions.append(f"pass rate: {then:.1%} -> {now:.1%}")
+    return regressions
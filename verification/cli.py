@@ -8,20 +8,28 @@ Usage:
     python -m verification.cli verify --category graph  # Verify category
     python -m verification.cli report              # Generate reports from results
     python -m verification.cli list                # List available scaffolds
+    python -m verification.cli cache stats         # Response cache usage (also prune, compact)
 """
 
 import argparse
 import asyncio
 import json
 import sys
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from .config import get_settings, Settings
+from .dashboard import Dashboard
+from .llm.batch import BatchBackend
+from .journal import RunJournal, list_runs
+from .llm.cache import ResponseCache
+from .llm.claude import ClaudeProvider
+from .llm.providers import PROVIDER_REGISTRY, get_provider
+from .llm.replay import REPLAY_PROFILES, RecordingProvider, ReplayProvider
 from .registry import get_all_generators, get_validator_for_scaffold, SCAFFOLD_REGISTRY
-from .runner import VerificationRunner, ScaffoldResults
+from .runner import ScaffoldJob, ScaffoldResults, VerificationRunner
 from .reports.generator import get_report_generator
+from .tracing import RecordingTracer, set_tracer
 
 
 def print_header(text: str) -> None:
@@ -39,6 +47,46 @@ def print_progress(current: int, total: int, name: str, status: str) -> None:
     print(f"\r[{bar}] {current}/{total} {name}: {status}", end="", flush=True)
 
 
+def format_bytes(size: float) -> str:
+    """Format a byte count for display."""
+    for unit in ["B", "KB", "MB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def model_dir_name(model: str) -> str:
+    """Directory name for a model's results and reports."""
+    return model.replace("/", "_")
+
+
+def print_model_matrix(results: list[ScaffoldResults], models: list[str]) -> None:
+    """Print pass rates as a scaffold x model table."""
+    matrix: dict[str, dict[str, ScaffoldResults]] = {}
+    for r in results:
+        matrix.setdefault(r.scaffold, {})[r.model] = r
+
+    width = max(len(m) for m in [*models, "100.0%"]) + 2
+    print("\n" + "-" * (25 + width * len(models)))
+    print(f"{'Scaffold':<25}" + "".join(f"{m:>{width}}" for m in models))
+    print("-" * (25 + width * len(models)))
+
+    for scaffold in sorted(matrix):
+        row = matrix[scaffold]
+        cells = [f"{row[m].pass_rate * 100:.1f}%" if m in row else "-" for m in models]
+        print(f"{scaffold:<25}" + "".join(f"{c:>{width}}" for c in cells))
+
+    print("-" * (25 + width * len(models)))
+    for model in models:
+        model_results = [r for r in results if r.model == model]
+        total = sum(r.total_tests for r in model_results)
+        passed = sum(r.passed_tests for r in model_results)
+        certified = sum(1 for r in model_results if r.pass_rate >= 0.9)
+        rate = passed / total * 100 if total else 0.0
+        print(f"{model}: {passed}/{total} passed ({rate:.1f}%), {certified}/{len(model_results)} certified")
+
+
 def print_results_table(results: list[ScaffoldResults]) -> None:
     """Print results as a formatted table."""
     print("\n" + "-" * 70)
@@ -78,12 +126,8 @@ class VerificationCLI:
 
         print(f"\nTotal: {sum(len(s) for s in SCAFFOLD_REGISTRY.values())} scaffolds")
 
-    async def verify_scaffold(
-        self,
-        scaffold_name: str,
-        runner: VerificationRunner,
-    ) -> ScaffoldResults | None:
-        """Verify a single scaffold."""
+    def build_job(self, scaffold_name: str) -> ScaffoldJob | None:
+        """Generate the test suite for a scaffold and pair it with its validator."""
         generators = get_all_generators()
 
         if scaffold_name not in generators:
@@ -96,27 +140,60 @@ class VerificationCLI:
         # Generate test suite
         test_suite = generator.generate_suite()
 
-        # Run verification
-        results = await runner.run_test_suite(
-            scaffold_name=scaffold_name,
-            test_suite=test_suite,
-            validator=validator,
-        )
+        return ScaffoldJob(scaffold_name, test_suite, validator)
+
+    def data_dir(self, model: str | None = None) -> Path:
+        """Directory holding result JSON; model matrix runs keep one per model."""
+        if model:
+            return self.results_dir / "data" / "models" / model_dir_name(model)
+        return self.results_dir / "data"
 
-        # Save results
-        results_file = self.results_dir / "data" / f"{scaffold_name}.json"
+    def save_results(self, results: ScaffoldResults, by_model: bool = False) -> Path:
+        """Save a scaffold's results to the data directory."""
+        results_file = self.data_dir(results.model if by_model else None) / f"{results.scaffold}.json"
         results_file.parent.mkdir(parents=True, exist_ok=True)
         with open(results_file, "w") as f:
             json.dump(results.to_dict(), f, indent=2, default=str)
+        return results_file
 
-        return results
+    def load_results(self, scaffold_name: str, model: str | None = None) -> ScaffoldResults | None:
+        """Load a scaffold's saved results from the data directory, if any."""
+        results_file = self.data_dir(model) / f"{scaffold_name}.json"
+        if not results_file.exists():
+            return None
+        try:
+            with open(results_file) as f:
+                return ScaffoldResults.from_dict(json.load(f))
+        except Exception as e:
+            print(f"Warning: Could not load {results_file}: {e}")
+            return None
 
     async def verify_all(
         self,
         scaffolds: list[str] | None = None,
         category: str | None = None,
+        batch: bool = False,
+        resume: str | None = None,
+        incremental: bool = False,
+        models: list[str] | None = None,
+        record: Path | None = None,
     ) -> list[ScaffoldResults]:
-        """Verify multiple scaffolds."""
+        """Verify multiple scaffolds, optionally against several models at once."""
+        # Open the run journal; a resumed run repeats the original run's settings
+        journal = RunJournal(resume) if resume else RunJournal.new()
+        if resume:
+            if not journal.exists:
+                print(f"Error: No run '{resume}' found")
+                runs = list_runs()
+                if runs:
+                    print(f"Available: {', '.join(p.stem for p in runs)}")
+                return []
+            if not scaffolds and not category:
+                scaffolds = journal.header.get("scaffolds")
+            self.settings.current_mode = journal.header.get("mode", self.settings.current_mode)
+            self.settings.provider = journal.header.get("provider", self.settings.provider)
+            models = models or journal.header.get("models")
+
         # Determine which scaffolds to verify
         if scaffolds:
             to_verify = scaffolds
@@ -129,31 +206,157 @@ class VerificationCLI:
         else:
             to_verify = [s for scaffolds in SCAFFOLD_REGISTRY.values() for s in scaffolds]
 
+        provider = get_provider()
+
         print_header(f"Verifying {len(to_verify)} Scaffolds")
-        print(f"Model: {self.settings.active_model}")
-        print(f"Mode: {self.settings.current_mode}")
-
-        # Check API key
-        if not self.settings.anthropic_api_key:
-            print("\nError: ANTHROPIC_API_KEY not set")
-            print("Set it via environment variable or .env file:")
-            print("  export VERIFY_ANTHROPIC_API_KEY=your_key")
+        print(f"Provider: {provider.provider_name}")
+        if models:
+            print(f"Models: {', '.join(models)}")
+        else:
+            print(f"Model: {provider.default_model}")
+            print(f"Mode: {self.settings.current_mode}")
+        if resume:
+            print(f"Resuming run {journal.run_id} ({journal.completed_count} test cases already done)")
+        else:
+            print(f"Run ID: {journal.run_id} (continue an interrupted run with --resume {journal.run_id})")
+        if self.settings.max_cost_usd or self.settings.max_run_tokens:
+            limits = []
+            if self.settings.max_cost_usd:
+                limits.append(f"${self.settings.max_cost_usd:.2f}")
+            if self.settings.max_run_tokens:
+                limits.append(f"{self.settings.max_run_tokens:,} tokens")
+            print(f"Budget: {' / '.join(limits)}")
+
+        # Check the provider can be used
+        if not provider.is_available():
+            if isinstance(provider, ClaudeProvider):
+                print("\nError: ANTHROPIC_API_KEY not set")
+                print("Set it via environment variable or .env file:")
+                print("  export VERIFY_ANTHROPIC_API_KEY=your_key")
+            elif isinstance(provider, ReplayProvider):
+                print(f"\nError: No recorded responses in {provider.cassette.path}")
+                print("Record some first with --record CASSETTE")
+            else:
+                print(f"\nError: Provider '{provider.provider_name}' is not available "
+                      f"(check that httpx is installed and the base URL is set)")
             return []
+        if batch and not isinstance(provider, ClaudeProvider):
+            print("\nError: --batch requires the anthropic provider")
+            return []
+        if record:
+            if batch:
+                print("\nError: --record cannot be combined with --batch")
+                return []
+            provider = RecordingProvider(provider, record)
+            print(f"Recording responses to {record}")
 
-        runner = VerificationRunner()
-        all_results = []
-
-        for i, scaffold_name in enumerate(to_verify, 1):
-            print(f"\n[{i}/{len(to_verify)}] Verifying: {scaffold_name}")
-
+        # Generate every test suite up front so all cases share one queue
+        jobs = []
+        for scaffold_name in to_verify:
             try:
-                results = await self.verify_scaffold(scaffold_name, runner)
-                if results:
-                    all_results.append(results)
-                    status = "PASS" if results.pass_rate >= 0.9 else "PARTIAL" if results.pass_rate >= 0.5 else "FAIL"
-                    print(f"  Result: {results.passed_tests}/{results.total_tests} passed ({results.pass_rate*100:.1f}%) - {status}")
+                job = self.build_job(scaffold_name)
+                if job:
+                    jobs.append(job)
             except Exception as e:
-                print(f"  Error: {e}")
+                print(f"  Error generating tests for {scaffold_name}: {e}")
+
+        # Each suite is generated once and shared by every model's job
+        if models:
+            jobs = [
+                ScaffoldJob(job.scaffold, job.test_suite, job.validator, model)
+                for job in jobs
+                for model in models
+            ]
+
+        runner = VerificationRunner(provider)
+        try:
+            # Reuse stored results for scaffolds whose inputs have not changed
+            reused: dict[tuple[str, str], ScaffoldResults] = {}
+            if incremental:
+                for job in jobs:
+                    previous = self.load_results(job.scaffold, job.model or None)
+                    if (
+                        previous is not None
+                        and previous.fingerprint == runner.fingerprint(job)
+                        and all(r.error is None for r in previous.test_results)
+                    ):
+                        reused[(job.scaffold, job.model)] = previous
+                jobs = [job for job in jobs if (job.scaffold, job.model) not in reused]
+                print(f"\nIncremental: {len(reused)} scaffolds unchanged, {len(jobs)} to verify")
+
+            total_cases = sum(len(job.test_suite.test_cases) for job in jobs)
+            if batch:
+                print(f"\nSubmitting {total_cases} test cases across {len(jobs)} scaffolds "
+                      f"as one Message Batches job (this can take a while)")
+            else:
+                print(f"\nRunning {total_cases} test cases across {len(jobs)} scaffolds "
+                      f"({self.settings.parallel_llm_calls} in parallel)")
+
+            completed = 0
+            # Batch runs finish all at once, so there is nothing to show live
+            dashboard = Dashboard(runner, total_cases) if self.settings.show_dashboard and not batch else None
+            emit = dashboard.log if dashboard else print
+
+            def on_complete(results: ScaffoldResults) -> None:
+                nonlocal completed
+                completed += 1
+                try:
+                    self.save_results(results, by_model=bool(models))
+                except Exception as e:
+                    emit(f"  Error saving {results.scaffold}: {e}")
+                status = "PASS" if results.pass_rate >= 0.9 else "PARTIAL" if results.pass_rate >= 0.5 else "FAIL"
+                name = f"{results.scaffold} [{results.model}]" if models else results.scaffold
+                emit(f"[{completed}/{len(jobs)}] {name}: {results.passed_tests}/{results.total_tests} "
+                     f"passed ({results.pass_rate*100:.1f}%) - {status} [{runner.cost_tracker.format()}]")
+
+            journal.start(
+                scaffolds=to_verify,
+                mode=self.settings.current_mode,
+                provider=provider.provider_name,
+                model=provider.default_model,
+                models=models,
+            )
+            if batch:
+                fresh = await runner.run_jobs_batch(
+                    jobs, BatchBackend(runner.llm), on_complete=on_complete, journal=journal,
+                )
+            else:
+                if dashboard:
+                    dashboard.start()
+                try:
+                    fresh = await runner.run_jobs(
+                        jobs,
+                        on_complete=on_complete,
+                        journal=journal,
+                        on_result=dashboard.record if dashboard else None,
+                    )
+                finally:
+                    if dashboard:
+                        await dashboard.stop()
+        finally:
+            await runner.aclose()
+
+        cost = runner.cost_tracker
+        print(f"\nCost: {cost.format()} over {cost.calls} API calls")
+        if cost.exceeded:
+            print(f"Warning: Budget reached; {cost.refused} test cases were not sent and are reported as errors")
+            print(f"Raise the budget and continue with --resume {journal.run_id}")
+
+        # Keep the requested scaffold order across reused and fresh results
+        by_key = {**reused, **{(r.scaffold, job.model): r for job, r in zip(jobs, fresh)}}
+        all_results = [
+            by_key[(name, model)]
+            for name in to_verify
+            for model in (models or [""])
+            if (name, model) in by_key
+        ]
+
+        if models:
+            if all_results:
+                print_header("Model Comparison")
+                print_model_matrix(all_results, models)
+                self.generate_model_reports(all_results)
+            return all_results
 
         # Print summary
         if all_results:
@@ -174,12 +377,12 @@ class VerificationCLI:
 
         return all_results
 
-    def generate_reports(self, results: list[ScaffoldResults]) -> None:
+    def generate_reports(self, results: list[ScaffoldResults], reports_dir: Path | None = None) -> None:
         """Generate certification reports."""
         print_header("Generating Reports")
 
         report_gen = get_report_generator()
-        reports_dir = self.results_dir / "reports"
+        reports_dir = reports_dir or self.results_dir / "reports"
         reports_dir.mkdir(parents=True, exist_ok=True)
 
         # Individual scaffold reports
@@ -195,10 +398,54 @@ class VerificationCLI:
 
         print(f"\nReports saved to: {reports_dir}")
 
-    def load_existing_results(self) -> list[ScaffoldResults]:
+    def generate_model_reports(self, results: list[ScaffoldResults]) -> None:
+        """Generate per-model certification reports and a model comparison report."""
+        models = list(dict.fromkeys(r.model for r in results))
+        for model in models:
+            self.generate_reports(
+                [r for r in results if r.model == model],
+                self.results_dir / "reports" / model_dir_name(model),
+            )
+
+        comparison_path = self.results_dir / "reports" / "MODEL_COMPARISON.md"
+        get_report_generator().generate_model_comparison(results, comparison_path)
+        print(f"\nModel comparison saved to: {comparison_path}")
+
+    def manage_cache(
+        self,
+        action: str,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        """Show statistics for, prune, or compact the LLM response cache."""
+        cache = ResponseCache()
+
+        if action == "prune":
+            evicted = cache.prune(max_entries=max_entries, max_bytes=max_bytes)
+            print(f"Evicted {evicted} cached responses")
+        elif action == "compact":
+            before = cache.stats()["file_bytes"]
+            cache.compact()
+            after = cache.stats()["file_bytes"]
+            print(f"Compacted cache: {format_bytes(before)} -> {format_bytes(after)}")
+
+        stats = cache.stats()
+        cache.close()
+
+        print_header("Response Cache")
+        print(f"Path:     {stats['path']}")
+        print(f"Entries:  {stats['entries']}"
+              + (f" / {stats['max_entries']}" if stats["max_entries"] else ""))
+        print(f"Size:     {format_bytes(stats['bytes'])}"
+              + (f" / {format_bytes(stats['max_bytes'])}" if stats["max_bytes"] else "")
+              + f" ({format_bytes(stats['file_bytes'])} on disk)")
+        for model, count in stats["by_model"].items():
+            print(f"  {model:<40} {count}")
+
+    def load_existing_results(self, data_dir: Path | None = None) -> list[ScaffoldResults]:
         """Load results from previous runs."""
         results = []
-        data_dir = self.results_dir / "data"
+        data_dir = data_dir or self.results_dir / "data"
 
         if not data_dir.exists():
             return results
@@ -208,66 +455,7 @@ class VerificationCLI:
                 with open(json_file) as f:
                     data = json.load(f)
 
-                from .runner import ScaffoldResults, TestResult
-                from .generators.base import TestCase
-                from .validators.base import ValidationResult
-
-                # Parse timestamps
-                started_at = datetime.fromisoformat(data.get("started_at", datetime.now().isoformat()))
-                completed_at = datetime.fromisoformat(data.get("completed_at", datetime.now().isoformat())) if data.get("completed_at") else None
-
-                sr = ScaffoldResults(
-                    scaffold=data["scaffold"],
-                    model=data["model"],
-                    started_at=started_at,
-                    completed_at=completed_at,
-                )
-
-                # Reconstruct TestResult objects from JSON
-                test_results = []
-                for r in data.get("results", []):
-                    # Determine tier from test case ID (e.g., "bfs_simple_01" -> "simple")
-                    test_id = r.get("test_case_id", "unknown")
-                    tier = "standard"
-                    for t in ["simple", "standard", "edge"]:
-                        if f"_{t}_" in test_id:
-                            tier = t
-                            break
-
-                    # Create TestCase
-                    test_case = TestCase(
-                        id=test_id,
-                        scaffold=data["scaffold"],
-                        tier=tier,
-                        input={},
-                        expected=r.get("validation", {}).get("expected", {}),
-                        description=f"Test case {test_id}",
-                    )
-
-                    # Create ValidationResult
-                    validation_data = r.get("validation", {})
-                    validation_result = None
-                    if validation_data:
-                        validation_result = ValidationResult(
-                            is_valid=validation_data.get("is_valid", False),
-                            score=validation_data.get("score", 0.0),
-                            message=validation_data.get("message", ""),
-                            expected=validation_data.get("expected"),
-                            actual=validation_data.get("actual"),
-                            details=validation_data.get("details", {}),
-                        )
-
-                    # Create TestResult
-                    test_result = TestResult(
-                        test_case=test_case,
-                        validation_result=validation_result,
-                        error=r.get("error"),
-                        duration_ms=r.get("duration_ms", 0.0),
-                    )
-                    test_results.append(test_result)
-
-                sr.test_results = test_results
-                results.append(sr)
+                results.append(ScaffoldResults.from_dict(data))
 
             except Exception as e:
                 print(f"Warning: Could not load {json_file}: {e}")
@@ -287,7 +475,16 @@ Examples:
   python -m verification.cli verify dijkstra bfs     # Verify specific scaffolds
   python -m verification.cli verify --category graph # Verify a category
   python -m verification.cli verify --mode cert      # Use certification model (Opus)
+  python -m verification.cli verify --resume RUN_ID  # Continue an interrupted run
+  python -m verification.cli verify --incremental    # Only re-verify changed scaffolds
+  python -m verification.cli verify --models a,b     # Compare models side by side
+  python -m verification.cli verify --provider openai --base-url http://localhost:8000/v1
+                                                     # Verify against a local model server
+  python -m verification.cli verify --record run.jsonl  # Record responses to a cassette
+  python -m verification.cli verify --replay run.jsonl  # Replay them offline
+  python -m verification.cli verify --trace trace.json  # Record a timeline (open in ui.perfetto.dev)
   python -m verification.cli report                  # Regenerate reports
+  python -m verification.cli cache stats             # Show response cache usage
         """
     )
 
@@ -315,10 +512,115 @@ Examples:
         default="dev",
         help="Mode: 'dev' uses Haiku (faster/cheaper), 'cert' uses Opus (final certification)"
     )
+    verify_parser.add_argument(
+        "--provider",
+        choices=sorted(PROVIDER_REGISTRY),
+        help="LLM provider to verify against (default: VERIFY_PROVIDER, 'anthropic'); "
+             "'openai' talks to any OpenAI-compatible server"
+    )
+    verify_parser.add_argument(
+        "--base-url",
+        help="Base URL of the OpenAI-compatible server (default: VERIFY_OPENAI_BASE_URL)"
+    )
+    verify_parser.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        type=Path,
+        help="Append every LLM response to a cassette file for later offline replay "
+             "(disables the response cache so every test case is recorded)"
+    )
+    verify_parser.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        type=Path,
+        help="Serve responses from a recorded cassette instead of calling an API"
+    )
+    verify_parser.add_argument(
+        "--replay-profile",
+        choices=sorted(REPLAY_PROFILES),
+        help="Latency/error profile injected into replayed responses (default: VERIFY_REPLAY_PROFILE, 'instant')"
+    )
+    verify_parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        type=Path,
+        help="Write a Chrome trace of the run (test cases, LLM calls, parsing, validation) "
+             "for chrome://tracing or https://ui.perfetto.dev"
+    )
+    verify_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit all test cases as one Message Batches job (slower to finish, cheaper; "
+             "intended for --mode cert runs)"
+    )
+    verify_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached LLM responses and call the API for every test case"
+    )
+    verify_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream responses and stop each one as soon as its FINAL_* answer is complete"
+    )
+    verify_parser.add_argument(
+        "--no-dashboard",
+        action="store_true",
+        help="Only print a line per finished scaffold instead of the live progress dashboard"
+    )
+    verify_parser.add_argument(
+        "--models",
+        help="Comma-separated models to verify side by side (e.g. "
+             "claude-3-haiku-20240307,claude-3-opus-20240229); overrides --mode"
+    )
+    verify_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip scaffolds whose markdown, tests, validator and model are unchanged "
+             "since their saved results, and reuse those results in reports"
+    )
+    verify_parser.add_argument(
+        "--max-cost",
+        type=float,
+        metavar="USD",
+        help="Stop sending requests once the run's cost would exceed this budget "
+             "(default: VERIFY_MAX_COST_USD, no limit)"
+    )
+    verify_parser.add_argument(
+        "--max-tokens",
+        type=int,
+        metavar="N",
+        help="Stop sending requests once the run's token usage would exceed this budget "
+             "(default: VERIFY_MAX_RUN_TOKENS, no limit)"
+    )
+    verify_parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Continue an interrupted run, skipping test cases it already finished"
+    )
 
     # Report command
     report_parser = subparsers.add_parser("report", help="Generate reports from existing results")
 
+    # Cache command
+    cache_parser = subparsers.add_parser("cache", help="Inspect or maintain the LLM response cache")
+    cache_parser.add_argument(
+        "action",
+        choices=["stats", "prune", "compact"],
+        help="'stats' shows usage, 'prune' evicts least recently used entries "
+             "down to the budget, 'compact' reclaims unused space on disk"
+    )
+    cache_parser.add_argument(
+        "--max-entries",
+        type=int,
+        help="Entry budget for prune (default: VERIFY_CACHE_MAX_ENTRIES)"
+    )
+    cache_parser.add_argument(
+        "--max-bytes",
+        type=int,
+        help="Byte budget for prune (default: VERIFY_CACHE_MAX_BYTES)"
+    )
+
     args = parser.parse_args()
 
     if not args.command:
@@ -334,19 +636,63 @@ Examples:
         # Update mode if specified
         if hasattr(args, "mode"):
             cli.settings.current_mode = args.mode
+        if args.no_cache:
+            cli.settings.enable_cache = False
+        if args.stream:
+            cli.settings.stream_responses = True
+        if args.no_dashboard:
+            cli.settings.show_dashboard = False
+        if args.provider:
+            cli.settings.provider = args.provider
+        if args.base_url:
+            cli.settings.openai_base_url = args.base_url
+        if args.record:
+            cli.settings.enable_cache = False
+        if args.replay:
+            # Cached responses would hide the replayed ones
+            cli.settings.provider = "replay"
+            cli.settings.cassette_path = args.replay.resolve()
+            cli.settings.enable_cache = False
+        if args.replay_profile:
+            cli.settings.replay_profile = args.replay_profile
+        if args.max_cost is not None:
+            cli.settings.max_cost_usd = args.max_cost
+        if args.max_tokens is not None:
+            cli.settings.max_run_tokens = args.max_tokens
+        if args.trace:
+            tracer = RecordingTracer()
+            set_tracer(tracer)
 
         asyncio.run(cli.verify_all(
             scaffolds=args.scaffolds if args.scaffolds else None,
             category=args.category,
+            batch=args.batch,
+            resume=args.resume,
+            incremental=args.incremental,
+            models=[m.strip() for m in args.models.split(",") if m.strip()] if args.models else None,
+            record=args.record,
         ))
+        if args.trace:
+            tracer.export_chrome(args.trace)
+            print(f"Trace written to {args.trace} ({len(tracer.spans)} spans)")
 
     elif args.command == "report":
         results = cli.load_existing_results()
+        model_results = [
+            r
+            for model_dir in sorted((cli.results_dir / "data" / "models").glob("*"))
+            for r in cli.load_existing_results(model_dir)
+        ]
         if results:
             cli.generate_reports(results)
-        else:
+        if model_results:
+            cli.generate_model_reports(model_results)
+        if not results and not model_results:
             print("No existing results found. Run 'verify' first.")
 
+    elif args.command == "cache":
+        cli.manage_cache(args.action, max_entries=args.max_entries, max_bytes=args.max_bytes)
+
 
 if __name__ == "__main__":
     main()
@@ -27,6 +27,24 @@ class Settings(BaseSettings):
         description="Anthropic API key for Claude access",
     )
 
+    # LLM Provider
+    provider: str = Field(
+        default="anthropic",
+        description="LLM provider to verify against ('anthropic' or 'openai' for OpenAI-compatible servers)",
+    )
+    openai_base_url: str = Field(
+        default="http://localhost:8000/v1",
+        description="Base URL of the OpenAI-compatible server (e.g., local llama.cpp or vLLM)",
+    )
+    openai_api_key: str = Field(
+        default="",
+        description="API key for the OpenAI-compatible server (local servers usually need none)",
+    )
+    openai_model: str = Field(
+        default="local-model",
+        description="Model name to request from the OpenAI-compatible server",
+    )
+
     # Model Selection
     dev_model: str = Field(
         default="claude-3-haiku-20240307",
@@ -60,6 +78,36 @@ class Settings(BaseSettings):
         le=600,
         description="Timeout for LLM API calls in seconds",
     )
+    connect_timeout_seconds: float = Field(
+        default=10.0,
+        ge=1.0,
+        le=120.0,
+        description="Timeout for establishing a connection to the LLM API",
+    )
+    pool_timeout_seconds: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=600.0,
+        description="Timeout waiting for a free connection from the pool",
+    )
+
+    # HTTP Connection Pool
+    http_max_connections: int = Field(
+        default=0,
+        ge=0,
+        le=200,
+        description="Maximum open connections to the LLM API (0 = sized to parallel_llm_calls)",
+    )
+    http_keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=600.0,
+        description="How long idle connections are kept open for reuse",
+    )
+    http2: bool = Field(
+        default=False,
+        description="Use HTTP/2 for LLM API calls (requires the h2 package)",
+    )
 
     # Retry Configuration
     max_retries: int = Field(
@@ -75,6 +123,18 @@ class Settings(BaseSettings):
         description="Initial delay between retries (exponential backoff)",
     )
 
+    # Budget
+    max_cost_usd: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Stop sending requests once a run's estimated cost would exceed this (0 for no limit)",
+    )
+    max_run_tokens: int = Field(
+        default=0,
+        ge=0,
+        description="Stop sending requests once a run's token usage would exceed this (0 for no limit)",
+    )
+
     # Paths
     scaffolds_dir: Path = Field(
         default=Path("scaffolds"),
@@ -103,7 +163,44 @@ class Settings(BaseSettings):
         description="Maximum parallel LLM API calls",
     )
 
+    rate_limit_requests_per_minute: int = Field(
+        default=0,
+        ge=0,
+        description="Cap on LLM requests per minute (0 = use the limit reported by the API)",
+    )
+    rate_limit_tokens_per_minute: int = Field(
+        default=0,
+        ge=0,
+        description="Cap on LLM tokens per minute (0 = use the limit reported by the API)",
+    )
+    stream_responses: bool = Field(
+        default=False,
+        description="Stream responses and stop once every FINAL_* answer field is complete",
+    )
+    show_dashboard: bool = Field(
+        default=True,
+        description="Show a live progress dashboard while test cases run",
+    )
+    dashboard_refresh_seconds: float = Field(
+        default=1.0,
+        ge=0.1,
+        le=60.0,
+        description="Seconds between dashboard updates (output that is not a terminal updates every 30s)",
+    )
+
+    # Batch Execution
+    batch_poll_interval_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=3600.0,
+        description="Seconds between status checks when running via Message Batches",
+    )
+
     # Caching
+    enable_prompt_cache: bool = Field(
+        default=True,
+        description="Mark the system prompt and scaffold instructions as a cacheable prompt prefix",
+    )
     enable_cache: bool = Field(
         default=True,
         description="Enable caching of LLM responses to avoid redundant calls",
@@ -112,6 +209,30 @@ class Settings(BaseSettings):
         default=Path("verification_results/cache"),
         description="Directory for caching LLM responses",
     )
+    cache_max_entries: int = Field(
+        default=20000,
+        ge=0,
+        description="Maximum cached responses before LRU eviction (0 for unlimited)",
+    )
+    cache_max_bytes: int = Field(
+        default=512 * 1024 * 1024,
+        ge=0,
+        description="Maximum total size of cached responses in bytes (0 for unlimited)",
+    )
+
+    # Record/Replay
+    cassette_path: Path = Field(
+        default=Path("verification_results/cassettes/cassette.jsonl"),
+        description="Cassette file that recorded responses are written to and replayed from",
+    )
+    replay_profile: str = Field(
+        default="instant",
+        description="Latency/error profile for replayed responses (instant, recorded, fast, flaky)",
+    )
+    replay_seed: int = Field(
+        default=0,
+        description="Seed for the jitter and errors injected into replayed responses",
+    )
 
     @property
     def active_model(self) -> str:
@@ -130,6 +251,18 @@ class Settings(BaseSettings):
             return self.results_dir
         return Path(__file__).parent.parent / self.results_dir
 
+    def get_cache_path(self) -> Path:
+        """Get absolute path to LLM response cache directory."""
+        if self.cache_dir.is_absolute():
+            return self.cache_dir
+        return Path(__file__).parent.parent / self.cache_dir
+
+    def get_cassette_path(self) -> Path:
+        """Get absolute path to the record/replay cassette."""
+        if self.cassette_path.is_absolute():
+            return self.cassette_path
+        return Path(__file__).parent.parent / self.cassette_path
+
     def ensure_directories(self) -> None:
         """Create required directories if they don't exist."""
         dirs = [
@@ -139,8 +272,7 @@ class Settings(BaseSettings):
             self.get_results_path() / "data",
         ]
         if self.enable_cache:
-            dirs.append(self.cache_dir if self.cache_dir.is_absolute()
-                       else Path(__file__).parent.parent / self.cache_dir)
+            dirs.append(self.get_cache_path())
         for d in dirs:
             d.mkdir(parents=True, exist_ok=True)
 
@@ -0,0 +1,206 @@
+"""
+Live progress dashboard for verification runs.
+
+While run_jobs() works through its queue, the dashboard shows how many
+requests are in flight, completed/total test cases, request and token
+throughput, rolling latency percentiles, the pass rate so far, the
+running cost and an ETA. It redraws from its own asyncio task between
+awaits and never blocks, so a throttled run (throughput falling, queue
+time rising) or a hung one (no result for a long time) shows up within
+seconds. When output is not a terminal it prints one status line every
+PLAIN_INTERVAL_SECONDS instead of redrawing.
+"""
+
+import asyncio
+import sys
+import time
+from collections import deque
+from typing import TextIO
+
+from .config import get_settings
+from .runner import TestResult, VerificationRunner, percentile
+
+# Seconds between status lines when output is not a terminal
+PLAIN_INTERVAL_SECONDS = 30.0
+
+# Throughput is measured over results from the last this many seconds
+RATE_WINDOW_SECONDS = 30.0
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration for display (e.g., '45s', '4m12s', '1h05m')."""
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+
+
+def format_latency(ms: float) -> str:
+    """Format a latency for display (e.g., '850ms', '1.2s')."""
+    return f"{ms:.0f}ms" if ms < 1000 else f"{ms / 1000:.1f}s"
+
+
+class Dashboard:
+    """Periodically redrawn summary of a run in progress."""
+
+    def __init__(
+        self,
+        runner: VerificationRunner,
+        total: int,
+        stream: TextIO | None = None,
+        refresh_seconds: float | None = None,
+        window: int = 200,
+    ):
+        """
+        Initialize the dashboard.
+
+        Args:
+            runner: Runner executing the test cases (for in-flight calls and cost).
+            total: Number of test cases the run will execute.
+            stream: Where to draw. Uses stdout if not provided.
+            refresh_seconds: Seconds between redraws. Uses
+                settings.dashboard_refresh_seconds if not provided.
+            window: Number of most recent results latency percentiles are taken over.
+        """
+        self.runner = runner
+        self.total = total
+        self.stream = stream or sys.stdout
+        self.interactive = self.stream.isatty()
+        refresh_seconds = refresh_seconds or get_settings().dashboard_refresh_seconds
+        self.refresh_seconds = refresh_seconds if self.interactive else max(refresh_seconds, PLAIN_INTERVAL_SECONDS)
+
+        self.completed = 0
+        self.passed = 0
+        self.errors = 0
+        self.started_at = time.perf_counter()
+        self.last_result_at = self.started_at
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._recent: deque[tuple[float, int]] = deque()
+        self._drawn_lines = 0
+        self._task: asyncio.Task | None = None
+
+    def record(self, result: TestResult) -> None:
+        """
+        Count a finished test case (pass as run_jobs(on_result=...)).
+
+        Args:
+            result: The test case's result.
+        """
+        now = time.perf_counter()
+        self.completed += 1
+        self.passed += result.passed
+        self.errors += result.error is not None
+        self.last_result_at = now
+
+        response = result.llm_response
+        tokens = response.total_tokens if response and not response.cached else 0
+        self._recent.append((now, tokens))
+        if result.error is None:
+            self._latencies.append(result.duration_ms)
+
+    def stats(self) -> dict[str, float]:
+        """
+        Current figures shown by the dashboard.
+
+        Returns:
+            Dictionary of progress, throughput, latency and ETA figures.
+        """
+        now = time.perf_counter()
+        while self._recent and self._recent[0][0] < now - RATE_WINDOW_SECONDS:
+            self._recent.popleft()
+
+        elapsed = now - self.started_at
+        window = min(elapsed, RATE_WINDOW_SECONDS)
+        requests_per_second = len(self._recent) / window if window > 0 else 0.0
+        # Fall back to the whole run's rate while the window is empty (e.g., a stall)
+        rate = requests_per_second or (self.completed / elapsed if elapsed > 0 else 0.0)
+        remaining = self.total - self.completed
+        latencies = list(self._latencies)
+
+        return {
+            "completed": self.completed,
+            "total": self.total,
+            "in_flight": self.runner.in_flight,
+            "requests_per_second": requests_per_second,
+            "tokens_per_second": sum(t for _, t in self._recent) / window if window > 0 else 0.0,
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "pass_rate": self.passed / self.completed if self.completed else 0.0,
+            "errors": self.errors,
+            "elapsed_seconds": elapsed,
+            "idle_seconds": now - self.last_result_at,
+            "eta_seconds": remaining / rate if rate > 0 else float("inf"),
+        }
+
+    def render(self) -> list[str]:
+        """Build the dashboard's lines."""
+        s = self.stats()
+        fraction = s["completed"] / s["total"] if s["total"] else 1.0
+        bar_width = 30
+        filled = int(bar_width * fraction)
+        bar = "#" * filled + "-" * (bar_width - filled)
+        eta = format_duration(s["eta_seconds"]) if s["eta_seconds"] != float("inf") else "?"
+
+        return [
+            f"[{bar}] {s['completed']}/{s['total']} cases ({fraction:.0%}), "
+            f"elapsed {format_duration(s['elapsed_seconds'])}, ETA {eta}",
+            f"In flight: {s['in_flight']}/{self.runner.max_concurrency}  "
+            f"Throughput: {s['requests_per_second']:.2f} req/s, {s['tokens_per_second']:,.0f} tok/s  "
+            f"Last result: {format_duration(s['idle_seconds'])} ago",
+            f"Latency (last {len(self._latencies)}): p50 {format_latency(s['p50_ms'])}  "
+            f"p95 {format_latency(s['p95_ms'])}  p99 {format_latency(s['p99_ms'])}",
+            f"Pass rate: {s['pass_rate']:.1%} ({self.passed}/{s['completed']}, {s['errors']} errors)  "
+            f"Cost: {self.runner.cost_tracker.format()}",
+        ]
+
+    def _clear(self) -> None:
+        """Erase the last drawn frame."""
+        if self._drawn_lines:
+            self.stream.write(f"\x1b[{self._drawn_lines}F\x1b[J")
+            self._drawn_lines = 0
+
+    def draw(self) -> None:
+        """Redraw the dashboard (or print a status line when not on a terminal)."""
+        lines = self.render()
+        if self.interactive:
+            self._clear()
+            self.stream.write("\n".join(lines) + "\n")
+            self._drawn_lines = len(lines)
+        else:
+            self.stream.write(" | ".join(lines) + "\n")
+        self.stream.flush()
+
+    def log(self, line: str) -> None:
+        """Print a line above the dashboard without garbling it."""
+        if self.interactive:
+            self._clear()
+            self.stream.write(line + "\n")
+            self.draw()
+        else:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    async def _refresh(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            self.draw()
+
+    def start(self) -> None:
+        """Start redrawing in the background (call from within the event loop)."""
+        if self.interactive:
+            self.draw()
+        self._task = asyncio.create_task(self._refresh())
+
+    async def stop(self) -> None:
+        """Stop redrawing and leave the final figures on screen."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.draw()
@@ -0,0 +1,150 @@
+"""
+Run journal for resumable verification runs.
+
+Each run appends one JSON line per finished test case to
+verification_results/runs/<run_id>.jsonl as soon as the case completes,
+so an interrupted run can be resumed without repeating the API calls it
+already paid for.
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .config import get_settings
+from .generators.base import TestCase
+from .runner import TestResult
+
+logger = logging.getLogger(__name__)
+
+
+class RunJournal:
+    """Append-only JSONL record of the test results of one run."""
+
+    def __init__(self, run_id: str, runs_dir: Path | None = None):
+        """
+        Open (or start) the journal for a run.
+
+        Args:
+            run_id: Identifier of the run.
+            runs_dir: Directory holding run journals. Uses settings if not provided.
+        """
+        self.run_id = run_id
+        self.runs_dir = runs_dir or get_settings().get_results_path() / "runs"
+        self.path = self.runs_dir / f"{run_id}.jsonl"
+        self.header: dict[str, Any] = {}
+        self._completed: dict[tuple[str, str, str], TestResult] = {}
+        if self.path.exists():
+            self._load()
+
+    @classmethod
+    def new(cls, runs_dir: Path | None = None) -> "RunJournal":
+        """
+        Create the journal for a new run under an unused, timestamped run ID.
+
+        Args:
+            runs_dir: Directory holding run journals. Uses settings if not provided.
+
+        Returns:
+            RunJournal for the new run.
+        """
+        base = datetime.now().strftime("%Y%m%d-%H%M%S")
+        journal = cls(base, runs_dir)
+        suffix = 1
+        while journal.exists:
+            suffix += 1
+            journal = cls(f"{base}-{suffix}", runs_dir)
+        return journal
+
+    @property
+    def exists(self) -> bool:
+        """Whether this run has been started before."""
+        return self.path.exists()
+
+    def start(self, **info: Any) -> None:
+        """
+        Write the run header (only for a new run).
+
+        Args:
+            **info: Run parameters to record (scaffolds, mode, models, ...).
+        """
+        if self.exists:
+            return
+        self.header = {"type": "run", "run_id": self.run_id, "started_at": datetime.now().isoformat(), **info}
+        self._append(self.header)
+
+    def _load(self) -> None:
+        """Read the header and completed results of an existing run."""
+        with open(self.path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash can leave a partially written last line
+                    logger.warning(f"Skipping unreadable line {line_number} of {self.path}")
+                    continue
+                if entry.get("type") == "run":
+                    self.header = entry
+                elif entry.get("type") == "result":
+                    test_case = TestCase.from_dict(entry["test_case"])
+                    result = TestResult.from_dict(entry["result"], test_case, entry["model"])
+                    self._completed[(entry["scaffold"], test_case.id, entry["model"])] = result
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        """Append one entry and flush it to disk."""
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+
+    def record(self, scaffold: str, model: str, result: TestResult) -> None:
+        """
+        Record a finished test case.
+
+        Args:
+            scaffold: Scaffold the test case belongs to.
+            model: Model the test case ran against.
+            result: The test result.
+        """
+        self._append({
+            "type": "result",
+            "scaffold": scaffold,
+            "model": model,
+            "test_case": result.test_case.to_dict(),
+            "result": result.to_dict(),
+        })
+        self._completed[(scaffold, result.test_case.id, model)] = result
+
+    def completed(self, scaffold: str, test_id: str, model: str) -> TestResult | None:
+        """
+        Get the recorded result of a test case, if it finished without error.
+
+        Test cases that errored (network failures, rate limits, ...) are
+        not considered complete, so a resumed run retries them.
+
+        Args:
+            scaffold: Scaffold name.
+            test_id: Test case ID.
+            model: Model name.
+
+        Returns:
+            The recorded TestResult, or None if the case must (re)run.
+        """
+        result = self._completed.get((scaffold, test_id, model))
+        if result is None or result.error is not None:
+            return None
+        return result
+
+    @property
+    def completed_count(self) -> int:
+        """Number of test cases recorded as finished without error."""
+        return sum(1 for r in self._completed.values() if r.error is None)
+
+
+def list_runs(runs_dir: Path | None = None) -> list[Path]:
+    """List run journals, oldest first."""
+    runs_dir = runs_dir or get_settings().get_results_path() / "runs"
+    if not runs_dir.exists():
+        return []
+    return sorted(runs_dir.glob("*.jsonl"))
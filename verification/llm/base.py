@@ -4,11 +4,16 @@ Abstract base class for LLM providers.
 Defines the interface that all LLM integrations must implement.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from ..tracing import traced
+from .rate_limit import estimate_tokens, get_rate_limiter
+
 
 @dataclass
 class LLMResponse:
@@ -35,6 +40,27 @@ class LLMResponse:
     raw_response: Any = None
     """Raw response object from the provider (for debugging)."""
 
+    cache_creation_input_tokens: int = 0
+    """Prompt tokens written to the provider's prompt cache."""
+
+    cache_read_input_tokens: int = 0
+    """Prompt tokens read from the provider's prompt cache."""
+
+    cached: bool = False
+    """Whether the response was served from the response cache."""
+
+    time_to_first_token_ms: float = 0.0
+    """Time until the first streamed token arrived (0 when not streamed)."""
+
+    time_to_answer_ms: float = 0.0
+    """Time until the final answer was complete (0 when not streamed)."""
+
+    stopped_early: bool = False
+    """Whether the stream was cut off once the final answer was complete."""
+
+    headers: dict[str, str] = field(default_factory=dict)
+    """Rate-limit headers returned with the response (not serialized)."""
+
     @property
     def total_tokens(self) -> int:
         """Total tokens used (input + output)."""
@@ -49,9 +75,33 @@ class LLMResponse:
             "output_tokens": self.output_tokens,
             "total_tokens": self.total_tokens,
             "latency_ms": self.latency_ms,
+            "cache_creation_input_tokens": self.cache_creation_input_tokens,
+            "cache_read_input_tokens": self.cache_read_input_tokens,
             "timestamp": self.timestamp.isoformat(),
+            "cached": self.cached,
+            "time_to_first_token_ms": self.time_to_first_token_ms,
+            "time_to_answer_ms": self.time_to_answer_ms,
+            "stopped_early": self.stopped_early,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "LLMResponse":
+        """Create from dictionary."""
+        return cls(
+            content=data["content"],
+            model=data["model"],
+            input_tokens=data.get("input_tokens", 0),
+            output_tokens=data.get("output_tokens", 0),
+            latency_ms=data.get("latency_ms", 0.0),
+            cache_creation_input_tokens=data.get("cache_creation_input_tokens", 0),
+            cache_read_input_tokens=data.get("cache_read_input_tokens", 0),
+            timestamp=datetime.fromisoformat(data["timestamp"]) if data.get("timestamp") else datetime.now(),
+            cached=data.get("cached", False),
+            time_to_first_token_ms=data.get("time_to_first_token_ms", 0.0),
+            time_to_answer_ms=data.get("time_to_answer_ms", 0.0),
+            stopped_early=data.get("stopped_early", False),
+        )
+
 
 @dataclass
 class LLMRequest:
@@ -69,6 +119,12 @@ class LLMRequest:
     max_tokens: int = 4096
     """Maximum tokens in response."""
 
+    cache_prefix: str = ""
+    """Leading part of the prompt shared across requests, marked for prompt caching."""
+
+    cache_system_prompt: bool = False
+    """Whether to mark the system prompt for prompt caching."""
+
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
         return {
@@ -76,9 +132,37 @@ class LLMRequest:
             "system_prompt": self.system_prompt,
             "temperature": self.temperature,
             "max_tokens": self.max_tokens,
+            "cache_prefix": self.cache_prefix,
+            "cache_system_prompt": self.cache_system_prompt,
         }
 
 
+def trace_generation(name: str) -> Callable:
+    """
+    Decorate an LLMProvider generate method to run inside a tracing span.
+
+    Args:
+        name: Span name (e.g., 'llm.generate').
+
+    Returns:
+        Decorator recording provider, model and token counts.
+    """
+    return traced(
+        name,
+        attributes=lambda provider, request, model=None, *args, **kwargs: {
+            "provider": provider.provider_name,
+            "model": model or provider.default_model,
+            "prompt_chars": len(request.system_prompt) + len(request.prompt),
+        },
+        result_attributes=lambda response: {
+            "input_tokens": response.input_tokens,
+            "output_tokens": response.output_tokens,
+            "cache_read_input_tokens": response.cache_read_input_tokens,
+            "stopped_early": response.stopped_early,
+        },
+    )
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
@@ -94,6 +178,16 @@ class LLMProvider(ABC):
         """Return the default model for this provider."""
         pass
 
+    @property
+    def cache_scope(self) -> str:
+        """
+        Identify the backend answering requests (e.g., 'anthropic').
+
+        Part of the response cache key, so two backends serving the same
+        model name never share cached responses.
+        """
+        return self.provider_name
+
     @abstractmethod
     async def generate(
         self,
@@ -115,7 +209,31 @@ class LLMProvider(ABC):
         """
         pass
 
-    @abstractmethod
+    async def generate_stream(
+        self,
+        request: LLMRequest,
+        model: str | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+    ) -> LLMResponse:
+        """
+        Generate a response by streaming, optionally stopping early.
+
+        Providers without streaming support fall back to generate().
+
+        Args:
+            request: The request containing prompt and parameters.
+            model: Optional model override (uses default if not specified).
+            stop_when: Called with each new chunk of text; the stream is
+                closed as soon as it returns True.
+
+        Returns:
+            LLMResponse containing the generated content and metadata.
+
+        Raises:
+            LLMError: If the API call fails.
+        """
+        return await self.generate(request, model)
+
     async def generate_with_retry(
         self,
         request: LLMRequest,
@@ -126,6 +244,9 @@ class LLMProvider(ABC):
         """
         Generate a response with automatic retry on failure.
 
+        Every attempt is gated by the rate limiter shared by all users of
+        this provider name.
+
         Args:
             request: The request containing prompt and parameters.
             model: Optional model override.
@@ -138,13 +259,37 @@ class LLMProvider(ABC):
         Raises:
             LLMError: If all retries fail.
         """
-        pass
+        limiter = get_rate_limiter(self.provider_name)
+        estimated = estimate_tokens(request.system_prompt + request.prompt)
+        last_error: Exception | None = None
+
+        for attempt in range(max_retries):
+            await limiter.acquire(estimated)
+            try:
+                response = await self.generate(request, model)
+                limiter.record_success(response.headers, response.total_tokens, estimated)
+                return response
+            except RateLimitError as e:
+                last_error = e
+                limiter.record_rate_limit(e.retry_after or retry_delay * (2 ** attempt))
+            except (AuthenticationError, InvalidRequestError):
+                raise
+            except LLMError as e:
+                last_error = e
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(retry_delay * (2 ** attempt))
+
+        raise last_error or LLMError("All retries failed", provider=self.provider_name)
 
     @abstractmethod
     def is_available(self) -> bool:
         """Check if this provider is available (API key configured, etc.)."""
         pass
 
+    async def aclose(self) -> None:
+        """Close any network connections held by this provider."""
+        pass
+
 
 class LLMError(Exception):
     """Base exception for LLM-related errors."""
@@ -164,7 +309,17 @@ class LLMError(Exception):
 
 class RateLimitError(LLMError):
     """Raised when rate limits are hit."""
-    pass
+
+    def __init__(
+        self,
+        message: str,
+        provider: str = "",
+        model: str = "",
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ):
+        super().__init__(message, provider, model, status_code)
+        self.retry_after = retry_after
 
 
 class AuthenticationError(LLMError):
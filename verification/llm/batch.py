@@ -0,0 +1,274 @@
+"""
+Message Batches execution backend.
+
+Submits a whole verification run as one Anthropic Message Batches job
+instead of one messages.create call per test case. Batches trade latency
+(results can take minutes to hours) for much higher throughput and lower
+cost, which suits full-corpus certification runs.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from ..config import get_settings
+from .base import (
+    AuthenticationError,
+    InvalidRequestError,
+    LLMError,
+    LLMProvider,
+    LLMRequest,
+    LLMResponse,
+    RateLimitError,
+)
+from .claude import ClaudeProvider
+
+logger = logging.getLogger(__name__)
+
+
+# Batch error types mapped to our exception classes
+BATCH_ERROR_TYPES: dict[str, type[LLMError]] = {
+    "invalid_request_error": InvalidRequestError,
+    "authentication_error": AuthenticationError,
+    "rate_limit_error": RateLimitError,
+}
+
+
+class BatchBackend:
+    """Runs many LLM requests as a single Message Batches job."""
+
+    def __init__(
+        self,
+        provider: ClaudeProvider | None = None,
+        batches: Any = None,
+        poll_interval: float | None = None,
+    ):
+        """
+        Initialize the batch backend.
+
+        Args:
+            provider: Claude provider used to build request parameters and
+                convert results. Creates default if not provided.
+            batches: Batches API to submit to (client.messages.batches or a
+                LocalBatchClient). Uses the provider's async client if not provided.
+            poll_interval: Seconds between status checks. Uses settings if not provided.
+        """
+        self.provider = provider or ClaudeProvider()
+        self._batches = batches
+        self.poll_interval = (
+            poll_interval if poll_interval is not None
+            else get_settings().batch_poll_interval_seconds
+        )
+
+    def _get_batches(self) -> Any:
+        """Get the batches API to submit to."""
+        if self._batches is None:
+            if not self.provider.is_available():
+                raise AuthenticationError(
+                    "Claude not available: API key not configured",
+                    provider=self.provider.provider_name,
+                )
+            self._batches = self.provider._get_async_client().messages.batches
+        return self._batches
+
+    async def run(
+        self,
+        requests: dict[str, LLMRequest],
+        model: str | None = None,
+        models: dict[str, str] | None = None,
+    ) -> dict[str, LLMResponse | LLMError]:
+        """
+        Submit requests as one batch and wait for every result.
+
+        Args:
+            requests: Requests keyed by custom ID (1-64 chars of [a-zA-Z0-9_-]).
+            model: Model to use for every request. Uses provider default if not specified.
+            models: Per-request model overrides keyed by custom ID, so one
+                batch can cover several models.
+
+        Returns:
+            Mapping of custom ID to LLMResponse, or to the LLMError for
+            requests that failed, expired or were canceled.
+
+        Raises:
+            LLMError: If the batch cannot be submitted or polled.
+        """
+        if not requests:
+            return {}
+
+        model = model or self.provider.default_model
+        models = {custom_id: (models or {}).get(custom_id, model) for custom_id in requests}
+        batches = self._get_batches()
+        start_time = time.perf_counter()
+
+        try:
+            batch = await batches.create(requests=[
+                {"custom_id": custom_id, "params": self.provider.build_params(request, models[custom_id])}
+                for custom_id, request in requests.items()
+            ])
+            logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+
+            while batch.processing_status != "ended":
+                await asyncio.sleep(self.poll_interval)
+                batch = await batches.retrieve(batch.id)
+                counts = batch.request_counts
+                logger.info(
+                    f"Batch {batch.id}: {counts.processing} processing, "
+                    f"{counts.succeeded} succeeded, {counts.errored} errored"
+                )
+
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+            results: dict[str, LLMResponse | LLMError] = {}
+            async for entry in await batches.results(batch.id):
+                results[entry.custom_id] = self._convert_result(
+                    entry.result, models.get(entry.custom_id, model), elapsed_ms,
+                )
+        except LLMError:
+            raise
+        except Exception as e:
+            self.provider._handle_error(e, model)
+
+        # Anything the batch did not report back counts as failed
+        for custom_id in requests:
+            if custom_id not in results:
+                results[custom_id] = LLMError(
+                    f"No result returned for request {custom_id}",
+                    provider=self.provider.provider_name,
+                    model=models[custom_id],
+                )
+
+        return results
+
+    def _convert_result(self, result: Any, model: str, elapsed_ms: float) -> LLMResponse | LLMError:
+        """Convert one batch result entry to a response or error."""
+        if result.type == "succeeded":
+            return self.provider.to_response(result.message, elapsed_ms)
+
+        if result.type == "errored":
+            error = result.error.error
+            error_class = BATCH_ERROR_TYPES.get(error.type, LLMError)
+            return error_class(error.message, provider=self.provider.provider_name, model=model)
+
+        return LLMError(
+            f"Batch request {result.type}",
+            provider=self.provider.provider_name,
+            model=model,
+        )
+
+
+def _text(content: str | list[dict[str, Any]]) -> str:
+    """Flatten a string or list of text content blocks to plain text."""
+    if isinstance(content, str):
+        return content
+    return "".join(block["text"] for block in content)
+
+
+class LocalBatchClient:
+    """
+    In-process stand-in for the Message Batches endpoint.
+
+    Mirrors the create/retrieve/results surface of client.messages.batches
+    but executes each request through a regular LLMProvider, so the batch
+    backend can be exercised without network access or an API key.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, provider: LLMProvider, concurrency: int = 4):
+        """
+        Initialize the local batch client.
+
+        Args:
+            provider: Provider that answers the individual requests.
+            concurrency: Maximum requests processed at once.
+        """
+        self.provider = provider
+        self.concurrency = concurrency
+        self._jobs: dict[str, dict[str, Any]] = {}
+
+    async def create(self, requests: list[dict[str, Any]]) -> Any:
+        """Accept a batch and start processing it in the background."""
+        batch_id = f"msgbatch_local_{next(self._ids)}"
+        job = {"requests": requests, "results": {}}
+        job["task"] = asyncio.create_task(self._process(job))
+        self._jobs[batch_id] = job
+        return self._status(batch_id)
+
+    async def retrieve(self, batch_id: str) -> Any:
+        """Get the current status of a batch."""
+        return self._status(batch_id)
+
+    async def results(self, batch_id: str) -> Any:
+        """Stream the results of an ended batch."""
+        job = self._jobs[batch_id]
+        await job["task"]
+
+        async def entries():
+            for request in job["requests"]:
+                yield SimpleNamespace(
+                    custom_id=request["custom_id"],
+                    result=job["results"][request["custom_id"]],
+                )
+
+        return entries()
+
+    def _status(self, batch_id: str) -> Any:
+        """Build a MessageBatch-like status object."""
+        job = self._jobs[batch_id]
+        results = job["results"].values()
+        succeeded = sum(1 for r in results if r.type == "succeeded")
+        return SimpleNamespace(
+            id=batch_id,
+            processing_status="ended" if job["task"].done() else "in_progress",
+            request_counts=SimpleNamespace(
+                processing=len(job["requests"]) - len(results),
+                succeeded=succeeded,
+                errored=len(results) - succeeded,
+                canceled=0,
+                expired=0,
+            ),
+        )
+
+    async def _process(self, job: dict[str, Any]) -> None:
+        """Answer every request in a batch through the provider."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def answer(request: dict[str, Any]) -> None:
+            params = request["params"]
+            llm_request = LLMRequest(
+                prompt=_text(params["messages"][0]["content"]),
+                system_prompt=_text(params.get("system", "")),
+                temperature=params.get("temperature", 0.0),
+                max_tokens=params["max_tokens"],
+            )
+            async with semaphore:
+                try:
+                    response = await self.provider.generate(llm_request, params["model"])
+                except LLMError as e:
+                    error_type = next(
+                        (name for name, cls in BATCH_ERROR_TYPES.items() if isinstance(e, cls)),
+                        "api_error",
+                    )
+                    job["results"][request["custom_id"]] = SimpleNamespace(
+                        type="errored",
+                        error=SimpleNamespace(error=SimpleNamespace(type=error_type, message=str(e))),
+                    )
+                    return
+
+            job["results"][request["custom_id"]] = SimpleNamespace(
+                type="succeeded",
+                message=SimpleNamespace(
+                    content=[SimpleNamespace(text=response.content)],
+                    model=response.model,
+                    usage=SimpleNamespace(
+                        input_tokens=response.input_tokens,
+                        output_tokens=response.output_tokens,
+                    ),
+                ),
+            )
+
+        await asyncio.gather(*(answer(r) for r in job["requests"]))
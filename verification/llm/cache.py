@@ -0,0 +1,258 @@
+"""
+On-disk cache of LLM responses.
+
+Responses are content-addressed by a hash of everything that determines
+the completion, so re-running verification after editing one scaffold
+only calls the LLM for the prompts that actually changed.
+
+Entries live in a single SQLite file rather than one file per response,
+and the cache is kept within an entry/byte budget by evicting the least
+recently used entries.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from ..config import get_settings
+from .base import LLMRequest, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Content-addressed, size-bounded LRU cache of LLM responses."""
+
+    DB_NAME = "responses.sqlite3"
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory holding the cache database. Uses settings if not provided.
+            max_entries: Maximum number of entries (0 for unlimited). Uses settings if not provided.
+            max_bytes: Maximum total size of cached responses in bytes (0 for unlimited).
+                Uses settings if not provided.
+        """
+        settings = get_settings()
+        self.cache_dir = cache_dir or settings.get_cache_path()
+        self.max_entries = settings.cache_max_entries if max_entries is None else max_entries
+        self.max_bytes = settings.cache_max_bytes if max_bytes is None else max_bytes
+        self._conn: sqlite3.Connection | None = None
+        self._entries = 0
+        self._bytes = 0
+
+    @property
+    def db_path(self) -> Path:
+        """Path to the cache database file."""
+        return self.cache_dir / self.DB_NAME
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get or open the database connection."""
+        if self._conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)"
+            )
+            self._entries, self._bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def make_key(request: LLMRequest, model: str, scope: str = "") -> str:
+        """
+        Compute the cache key for a request.
+
+        Args:
+            request: The request being sent.
+            model: The model the request is sent to.
+            scope: Backend answering the request (LLMProvider.cache_scope).
+                Empty gives the unscoped key of older cassettes.
+
+        Returns:
+            Hex SHA-256 digest of the request parameters.
+        """
+        params = {
+            "model": model,
+            "system_prompt": request.system_prompt,
+            "prompt": request.prompt,
+            "temperature": request.temperature,
+            "max_tokens": request.max_tokens,
+        }
+        if scope:
+            params["scope"] = scope
+        payload = json.dumps(params, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, request: LLMRequest, model: str, scope: str = "") -> LLMResponse | None:
+        """
+        Look up a cached response and mark it as recently used.
+
+        Args:
+            request: The request being sent.
+            model: The model the request is sent to.
+            scope: Backend answering the request (LLMProvider.cache_scope).
+
+        Returns:
+            The cached LLMResponse, or None on a miss.
+        """
+        conn = self._connect()
+        key = self.make_key(request, model, scope)
+        row = conn.execute("SELECT data FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        try:
+            response = LLMResponse.from_dict(json.loads(row[0]))
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {key[:12]}: {e}")
+            return None
+
+        conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+        response.cached = True
+        return response
+
+    def put(self, request: LLMRequest, model: str, response: LLMResponse, scope: str = "") -> None:
+        """
+        Store a response, evicting old entries if over budget.
+
+        Args:
+            request: The request that produced the response.
+            model: The model the request was sent to.
+            response: The response to cache.
+            scope: Backend that answered the request (LLMProvider.cache_scope).
+        """
+        conn = self._connect()
+        key = self.make_key(request, model, scope)
+        data = json.dumps(response.to_dict())
+        size = len(data.encode("utf-8"))
+        now = time.time()
+
+        old = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, model, data, size, created_at, last_access) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, model, data, size, now, now),
+        )
+        if old is None:
+            self._entries += 1
+            self._bytes += size
+        else:
+            self._bytes += size - old[0]
+
+        if self._exceeds(self._entries, self._bytes, self.max_entries, self.max_bytes):
+            self.prune()
+
+    @staticmethod
+    def _exceeds(entries: int, total_bytes: int, max_entries: int, max_bytes: int) -> bool:
+        """Check whether totals exceed an entry/byte budget (0 means unlimited)."""
+        return (
+            (max_entries > 0 and entries > max_entries)
+            or (max_bytes > 0 and total_bytes > max_bytes)
+        )
+
+    def prune(self, max_entries: int | None = None, max_bytes: int | None = None) -> int:
+        """
+        Evict least recently used entries until the cache is within budget.
+
+        Args:
+            max_entries: Entry budget override (0 for unlimited).
+            max_bytes: Byte budget override (0 for unlimited).
+
+        Returns:
+            Number of entries evicted.
+        """
+        conn = self._connect()
+        max_entries = self.max_entries if max_entries is None else max_entries
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+
+        # Refresh totals in case another process has written to the cache
+        entries, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+        evict = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC"):
+            if not self._exceeds(entries, total, max_entries, max_bytes):
+                break
+            evict.append((key,))
+            entries -= 1
+            total -= size
+
+        if evict:
+            conn.execute("BEGIN")
+            conn.executemany("DELETE FROM responses WHERE key = ?", evict)
+            conn.execute("COMMIT")
+            logger.info(f"Evicted {len(evict)} cached responses")
+        self._entries, self._bytes = entries, total
+
+        return len(evict)
+
+    def compact(self) -> None:
+        """Rebuild the database file to reclaim space freed by evictions."""
+        conn = self._connect()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Summarize cache contents.
+
+        Returns:
+            Dictionary with entry/byte totals, budgets, file size and per-model counts.
+        """
+        conn = self._connect()
+        entries, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        by_model = dict(conn.execute(
+            "SELECT model, COUNT(*) FROM responses GROUP BY model ORDER BY COUNT(*) DESC"
+        ).fetchall())
+        oldest, newest = conn.execute(
+            "SELECT MIN(last_access), MAX(last_access) FROM responses"
+        ).fetchone()
+
+        return {
+            "path": str(self.db_path),
+            "entries": entries,
+            "bytes": total,
+            "file_bytes": self.db_path.stat().st_size if self.db_path.exists() else 0,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "by_model": by_model,
+            "oldest_access": oldest,
+            "newest_access": newest,
+        }
@@ -3,7 +3,10 @@ Claude (Anthropic) LLM provider implementation.
 """
 
 import asyncio
+import importlib.util
+import logging
 import time
+from collections.abc import Callable
 from typing import Any
 
 from tenacity import (
@@ -22,7 +25,9 @@ from .base import (
     LLMRequest,
     LLMResponse,
     RateLimitError,
+    trace_generation,
 )
+from .rate_limit import parse_retry_after, rate_limit_headers
 
 try:
     import anthropic
@@ -32,6 +37,15 @@ except ImportError:
     ANTHROPIC_AVAILABLE = False
     anthropic = None
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
 
 class ClaudeProvider(LLMProvider):
     """Anthropic Claude LLM provider."""
@@ -65,13 +79,82 @@ class ClaudeProvider(LLMProvider):
         return self._client
 
     def _get_async_client(self) -> Any:
-        """Get or create the async client."""
+        """
+        Get or create the async client.
+
+        The client is created once and reused, so concurrent calls share a
+        pool of kept-alive connections instead of opening a new TLS
+        connection per request. Retries are left to the caller, which
+        paces them through the shared rate limiter.
+        """
         if not ANTHROPIC_AVAILABLE:
             raise LLMError("anthropic package not installed", provider=self.provider_name)
         if not self._async_client:
-            self._async_client = anthropic.AsyncAnthropic(api_key=self._api_key)
+            settings = get_settings()
+            kwargs: dict[str, Any] = {
+                "api_key": self._api_key,
+                "timeout": float(settings.timeout_seconds),
+                "max_retries": 0,
+            }
+            if HTTPX_AVAILABLE:
+                options = self._http_options()
+                kwargs["timeout"] = httpx.Timeout(
+                    options["timeout"],
+                    connect=options["connect_timeout"],
+                    pool=options["pool_timeout"],
+                )
+                kwargs["http_client"] = self._build_http_client(kwargs["timeout"])
+            else:
+                logger.debug("httpx is not importable; using the Anthropic client's default connection pool")
+            self._async_client = anthropic.AsyncAnthropic(**kwargs)
         return self._async_client
 
+    def _http_options(self) -> dict[str, Any]:
+        """
+        Connection pool and timeout settings for the pooled HTTP client.
+
+        Returns:
+            Read/connect/pool timeouts, pool size, keepalive expiry and
+            whether to use HTTP/2.
+        """
+        settings = get_settings()
+        max_connections = settings.http_max_connections or settings.parallel_llm_calls
+        return {
+            "timeout": float(settings.timeout_seconds),
+            "connect_timeout": settings.connect_timeout_seconds,
+            "pool_timeout": settings.pool_timeout_seconds,
+            "max_connections": max_connections,
+            "keepalive_expiry": settings.http_keepalive_expiry_seconds,
+            "http2": settings.http2,
+        }
+
+    def _build_http_client(self, timeout: Any) -> Any:
+        """Build the pooled HTTP client used by the async Anthropic client."""
+        options = self._http_options()
+        http2 = options["http2"]
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1")
+            http2 = False
+
+        return anthropic.DefaultAsyncHttpxClient(
+            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=options["max_connections"],
+                max_keepalive_connections=options["max_connections"],
+                keepalive_expiry=options["keepalive_expiry"],
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close the clients and their pooled connections."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
     def is_available(self) -> bool:
         """Check if Claude is available."""
         return ANTHROPIC_AVAILABLE and bool(self._api_key)
@@ -87,6 +170,7 @@ class ClaudeProvider(LLMProvider):
                 provider=self.provider_name,
                 model=model,
                 status_code=429,
+                retry_after=parse_retry_after(e.response.headers),
             )
         elif isinstance(e, APIStatusError):
             if e.status_code == 401:
@@ -115,6 +199,7 @@ class ClaudeProvider(LLMProvider):
         else:
             raise LLMError(str(e), provider=self.provider_name, model=model)
 
+    @trace_generation("llm.generate")
     async def generate(
         self,
         request: LLMRequest,
@@ -129,9 +214,105 @@ class ClaudeProvider(LLMProvider):
 
         model = model or self.default_model
         client = self._get_async_client()
+        kwargs = self.build_params(request, model)
 
-        messages = [{"role": "user", "content": request.prompt}]
-        kwargs: dict[str, Any] = {
+        start_time = time.perf_counter()
+        try:
+            raw = await client.messages.with_raw_response.create(**kwargs)
+            message = await raw.parse()
+        except Exception as e:
+            self._handle_error(e, model)
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        response = self.to_response(message, elapsed_ms)
+        response.headers = rate_limit_headers(raw.headers)
+        return response
+
+    @trace_generation("llm.generate_stream")
+    async def generate_stream(
+        self,
+        request: LLMRequest,
+        model: str | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+    ) -> LLMResponse:
+        """
+        Stream a response from Claude, closing the stream once stop_when is satisfied.
+
+        When the stream is cut off the API never reports final usage, so
+        output_tokens is estimated from the text received.
+        """
+        if not self.is_available():
+            raise AuthenticationError(
+                "Claude not available: API key not configured",
+                provider=self.provider_name,
+            )
+
+        model = model or self.default_model
+        client = self._get_async_client()
+        kwargs = self.build_params(request, model)
+
+        chunks: list[str] = []
+        first_token_ms = 0.0
+        answer_ms = 0.0
+        stopped_early = False
+
+        start_time = time.perf_counter()
+        try:
+            async with client.messages.stream(**kwargs) as stream:
+                async for text in stream.text_stream:
+                    if not chunks:
+                        first_token_ms = (time.perf_counter() - start_time) * 1000
+                    chunks.append(text)
+                    if stop_when is not None and stop_when(text):
+                        answer_ms = (time.perf_counter() - start_time) * 1000
+                        stopped_early = True
+                        break
+                message = stream.current_message_snapshot
+                headers = stream.response.headers
+        except Exception as e:
+            self._handle_error(e, model)
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        response = self.to_response(message, elapsed_ms)
+        response.content = "".join(chunks)
+        response.headers = rate_limit_headers(headers)
+        response.time_to_first_token_ms = first_token_ms
+        response.time_to_answer_ms = answer_ms or elapsed_ms
+        response.stopped_early = stopped_early
+        if stopped_early:
+            # Roughly four characters per token
+            response.output_tokens = max(response.output_tokens, len(response.content) // 4)
+        return response
+
+    def build_params(self, request: LLMRequest, model: str) -> dict[str, Any]:
+        """
+        Build Messages API parameters for a request.
+
+        Shared by direct calls and Message Batches submissions. The system
+        prompt and the request's cache_prefix are sent as separate content
+        blocks with cache_control when prompt caching is requested, so
+        requests sharing a scaffold reuse the cached prefix.
+
+        Args:
+            request: The request to convert.
+            model: Model to send the request to.
+
+        Returns:
+            Keyword arguments for messages.create.
+        """
+        cache_control = {"type": "ephemeral"}
+
+        content: str | list[dict[str, Any]] = request.prompt
+        prefix = request.cache_prefix
+        if prefix and request.prompt.startswith(prefix):
+            content = [{"type": "text", "text": prefix, "cache_control": cache_control}]
+            if len(request.prompt) > len(prefix):
+                content.append({"type": "text", "text": request.prompt[len(prefix):]})
+
+        messages = [{"role": "user", "content": content}]
+        params: dict[str, Any] = {
             "model": model,
             "max_tokens": request.max_tokens,
             "temperature": request.temperature,
@@ -139,56 +320,41 @@ class ClaudeProvider(LLMProvider):
         }
 
         if request.system_prompt:
-            kwargs["system"] = request.system_prompt
+            if request.cache_system_prompt:
+                params["system"] = [
+                    {"type": "text", "text": request.system_prompt, "cache_control": cache_control}
+                ]
+            else:
+                params["system"] = request.system_prompt
 
-        start_time = time.perf_counter()
-        try:
-            response = await client.messages.create(**kwargs)
-        except Exception as e:
-            self._handle_error(e, model)
+        return params
 
-        elapsed_ms = (time.perf_counter() - start_time) * 1000
+    def to_response(self, message: Any, latency_ms: float = 0.0) -> LLMResponse:
+        """
+        Convert a Messages API message to an LLMResponse.
+
+        Args:
+            message: Message object returned by the API.
+            latency_ms: Time taken to obtain the message.
 
+        Returns:
+            LLMResponse with the message content and usage.
+        """
         content = ""
-        if response.content:
-            content = response.content[0].text
+        if message.content:
+            content = message.content[0].text
 
         return LLMResponse(
             content=content,
-            model=response.model,
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
-            latency_ms=elapsed_ms,
-            raw_response=response,
+            model=message.model,
+            input_tokens=message.usage.input_tokens,
+            output_tokens=message.usage.output_tokens,
+            latency_ms=latency_ms,
+            cache_creation_input_tokens=getattr(message.usage, "cache_creation_input_tokens", None) or 0,
+            cache_read_input_tokens=getattr(message.usage, "cache_read_input_tokens", None) or 0,
+            raw_response=message,
         )
 
-    async def generate_with_retry(
-        self,
-        request: LLMRequest,
-        model: str | None = None,
-        max_retries: int = 3,
-        retry_delay: float = 1.0,
-    ) -> LLMResponse:
-        """Generate a response with automatic retry."""
-        last_error: Exception | None = None
-
-        for attempt in range(max_retries):
-            try:
-                return await self.generate(request, model)
-            except RateLimitError as e:
-                last_error = e
-                delay = retry_delay * (2 ** attempt)
-                await asyncio.sleep(delay)
-            except (AuthenticationError, InvalidRequestError):
-                raise
-            except LLMError as e:
-                last_error = e
-                if attempt < max_retries - 1:
-                    delay = retry_delay * (2 ** attempt)
-                    await asyncio.sleep(delay)
-
-        raise last_error or LLMError("All retries failed", provider=self.provider_name)
-
     def generate_sync(
         self,
         request: LLMRequest,
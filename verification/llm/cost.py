@@ -0,0 +1,242 @@
+"""
+Token and cost accounting for LLM calls.
+
+A CostTracker prices every response by model as it arrives, so the
+running cost of a verification run is known while it is still going.
+With a budget set, each call reserves its estimated cost before it is
+sent; once the reservations would exceed the budget, further calls fail
+fast with BudgetExceededError instead of being sent. Cases already
+answered (and responses served from the cache, which are free) are kept,
+so an interrupted run can be finished later with --resume.
+"""
+
+import logging
+from dataclasses import dataclass
+
+from ..config import get_settings
+from .base import LLMError, LLMRequest, LLMResponse
+from .rate_limit import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ModelPricing:
+    """Prices of a model in USD per million tokens."""
+
+    input: float
+    """Uncached prompt tokens."""
+
+    output: float
+    """Generated tokens."""
+
+    cache_write: float = 0.0
+    """Prompt tokens written to the prompt cache."""
+
+    cache_read: float = 0.0
+    """Prompt tokens read from the prompt cache."""
+
+    def cost(self, response: LLMResponse) -> float:
+        """
+        Price a response.
+
+        Args:
+            response: Response whose token usage to price.
+
+        Returns:
+            Cost in USD.
+        """
+        return (
+            response.input_tokens * self.input
+            + response.output_tokens * self.output
+            + response.cache_creation_input_tokens * self.cache_write
+            + response.cache_read_input_tokens * self.cache_read
+        ) / 1_000_000
+
+
+# Prices by model name prefix; the longest matching prefix wins
+MODEL_PRICING: dict[str, ModelPricing] = {
+    "claude-3-haiku": ModelPricing(input=0.25, output=1.25, cache_write=0.30, cache_read=0.03),
+    "claude-3-sonnet": ModelPricing(input=3.0, output=15.0, cache_write=3.75, cache_read=0.30),
+    "claude-3-opus": ModelPricing(input=15.0, output=75.0, cache_write=18.75, cache_read=1.50),
+    "claude-3-5-haiku": ModelPricing(input=0.80, output=4.0, cache_write=1.0, cache_read=0.08),
+    "claude-3-5-sonnet": ModelPricing(input=3.0, output=15.0, cache_write=3.75, cache_read=0.30),
+}
+
+# Message Batches are billed at half price
+BATCH_DISCOUNT = 0.5
+
+
+def get_pricing(model: str) -> ModelPricing | None:
+    """
+    Look up the prices of a model.
+
+    Args:
+        model: Model name (e.g., 'claude-3-haiku-20240307').
+
+    Returns:
+        ModelPricing, or None if the model is not priced (e.g., a local model).
+    """
+    matches = [prefix for prefix in MODEL_PRICING if model.startswith(prefix)]
+    return MODEL_PRICING[max(matches, key=len)] if matches else None
+
+
+class BudgetExceededError(LLMError):
+    """Raised instead of sending a request that would exceed the run's budget."""
+    pass
+
+
+class CostTracker:
+    """Running token and cost totals for a run, with optional budget enforcement."""
+
+    def __init__(self, max_cost: float | None = None, max_tokens: int | None = None):
+        """
+        Initialize the cost tracker.
+
+        Args:
+            max_cost: Budget in USD. Uses settings.max_cost_usd if not provided;
+                0 means no limit.
+            max_tokens: Token budget. Uses settings.max_run_tokens if not
+                provided; 0 means no limit.
+        """
+        settings = get_settings()
+        self.max_cost = settings.max_cost_usd if max_cost is None else max_cost
+        self.max_tokens = settings.max_run_tokens if max_tokens is None else max_tokens
+
+        self.cost = 0.0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        self.calls = 0
+        self.refused = 0
+
+        self._reserved_cost = 0.0
+        self._reserved_tokens = 0
+        self._unpriced: set[str] = set()
+
+    @property
+    def total_tokens(self) -> int:
+        """Tokens billed so far (input, output and prompt cache)."""
+        return self.input_tokens + self.output_tokens + self.cache_read_tokens + self.cache_write_tokens
+
+    @property
+    def exceeded(self) -> bool:
+        """Whether any call has been refused for lack of budget."""
+        return self.refused > 0
+
+    def _pricing(self, model: str) -> ModelPricing | None:
+        pricing = get_pricing(model)
+        if pricing is None and model not in self._unpriced:
+            self._unpriced.add(model)
+            logger.warning(f"No pricing for model {model}; its calls are counted as free")
+        return pricing
+
+    def estimate(self, request: LLMRequest, model: str) -> tuple[float, int]:
+        """
+        Estimate the cost of a request before it is sent.
+
+        Output is estimated from the average of the responses seen so far,
+        or from the request's max_tokens before any have arrived.
+
+        Args:
+            request: Request to estimate.
+            model: Model it will be sent to.
+
+        Returns:
+            Estimated cost in USD and estimated tokens.
+        """
+        input_tokens = estimate_tokens(request.system_prompt + request.prompt)
+        output_tokens = self.output_tokens // self.calls if self.calls else request.max_tokens
+        output_tokens = min(output_tokens, request.max_tokens)
+
+        pricing = self._pricing(model)
+        cost = (input_tokens * pricing.input + output_tokens * pricing.output) / 1_000_000 if pricing else 0.0
+        return cost, input_tokens + output_tokens
+
+    def reserve(self, request: LLMRequest, model: str) -> tuple[float, int]:
+        """
+        Reserve budget for a request about to be sent.
+
+        Reservations count against the budget until released, so
+        concurrent calls cannot all pass the check and overshoot it together.
+
+        Args:
+            request: Request to send.
+            model: Model it will be sent to.
+
+        Returns:
+            The reservation, to pass to release() once the call finishes.
+
+        Raises:
+            BudgetExceededError: If the request would exceed the budget.
+        """
+        cost, tokens = self.estimate(request, model)
+        over_cost = self.max_cost > 0 and self.cost + self._reserved_cost + cost > self.max_cost
+        over_tokens = self.max_tokens > 0 and self.total_tokens + self._reserved_tokens + tokens > self.max_tokens
+        if over_cost or over_tokens:
+            self.refused += 1
+            limit = f"${self.max_cost:.2f}" if over_cost else f"{self.max_tokens:,} tokens"
+            raise BudgetExceededError(
+                f"Budget of {limit} reached ({self.format()})",
+                provider="budget",
+                model=model,
+            )
+
+        self._reserved_cost += cost
+        self._reserved_tokens += tokens
+        return cost, tokens
+
+    def release(self, reservation: tuple[float, int]) -> None:
+        """Release a reservation made by reserve()."""
+        cost, tokens = reservation
+        self._reserved_cost -= cost
+        self._reserved_tokens -= tokens
+
+    def record(self, model: str, response: LLMResponse, discount: float = 1.0) -> float:
+        """
+        Add a response's usage to the totals.
+
+        Responses served from the response cache cost nothing and are skipped.
+
+        Args:
+            model: Model the request was sent to.
+            response: Response received.
+            discount: Multiplier applied to the price (BATCH_DISCOUNT for batches).
+
+        Returns:
+            Cost of the response in USD.
+        """
+        if response.cached:
+            return 0.0
+
+        pricing = self._pricing(model)
+        cost = pricing.cost(response) * discount if pricing else 0.0
+        self.cost += cost
+        self.input_tokens += response.input_tokens
+        self.output_tokens += response.output_tokens
+        self.cache_read_tokens += response.cache_read_input_tokens
+        self.cache_write_tokens += response.cache_creation_input_tokens
+        self.calls += 1
+        return cost
+
+    def summary(self) -> dict[str, float | int]:
+        """Totals for reports and logs."""
+        return {
+            "cost_usd": self.cost,
+            "calls": self.calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_input_tokens": self.cache_read_tokens,
+            "cache_creation_input_tokens": self.cache_write_tokens,
+            "refused_calls": self.refused,
+        }
+
+    def format(self) -> str:
+        """One-line running total (e.g., '$0.0123, 4,567 tokens')."""
+        text = f"${self.cost:.4f}, {self.total_tokens:,} tokens"
+        if self.max_cost > 0:
+            text += f" of ${self.max_cost:.2f}"
+        elif self.max_tokens > 0:
+            text += f" of {self.max_tokens:,}"
+        return text
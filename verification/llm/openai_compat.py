@@ -0,0 +1,296 @@
+"""
+OpenAI-compatible LLM provider implementation.
+
+Talks to any server exposing the OpenAI /chat/completions API, such as a
+local llama.cpp or vLLM server, so the scaffold corpus can be verified
+against models running on our own hardware.
+"""
+
+import importlib.util
+import json
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from ..config import get_settings
+from .base import (
+    AuthenticationError,
+    InvalidRequestError,
+    LLMError,
+    LLMProvider,
+    LLMRequest,
+    LLMResponse,
+    RateLimitError,
+    trace_generation,
+)
+from .rate_limit import parse_retry_after, rate_limit_headers
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+
+class OpenAICompatibleProvider(LLMProvider):
+    """Provider for servers implementing the OpenAI chat completions API."""
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        api_key: str | None = None,
+        model: str | None = None,
+        transport: Any = None,
+    ):
+        """
+        Initialize the OpenAI-compatible provider.
+
+        Args:
+            base_url: API base URL (e.g., http://localhost:8000/v1). Uses settings if not provided.
+            api_key: API key sent as a bearer token. Uses settings if not provided;
+                local servers usually need none.
+            model: Default model name. Uses settings if not provided.
+            transport: Optional httpx transport (for testing).
+        """
+        settings = get_settings()
+        self.base_url = (base_url or settings.openai_base_url).rstrip("/")
+        self._api_key = api_key if api_key is not None else settings.openai_api_key
+        self._model = model or settings.openai_model
+        self._transport = transport
+        self._client: Any = None
+
+    @property
+    def provider_name(self) -> str:
+        return "openai"
+
+    @property
+    def default_model(self) -> str:
+        return self._model
+
+    @property
+    def cache_scope(self) -> str:
+        """Scope cached responses to the server, since any server can serve any model name."""
+        return f"{self.provider_name}:{self.base_url}"
+
+    def is_available(self) -> bool:
+        """Check if the provider can be used (a server URL is configured)."""
+        return HTTPX_AVAILABLE and bool(self.base_url)
+
+    def _get_client(self) -> Any:
+        """Get or create the pooled async HTTP client."""
+        if not HTTPX_AVAILABLE:
+            raise LLMError("httpx package not installed", provider=self.provider_name)
+        if self._client is None:
+            settings = get_settings()
+            max_connections = settings.http_max_connections or settings.parallel_llm_calls
+            http2 = settings.http2 and importlib.util.find_spec("h2") is not None
+            headers = {"Authorization": f"Bearer {self._api_key}"} if self._api_key else {}
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=headers,
+                timeout=httpx.Timeout(
+                    settings.timeout_seconds,
+                    connect=settings.connect_timeout_seconds,
+                    pool=settings.pool_timeout_seconds,
+                ),
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                    keepalive_expiry=settings.http_keepalive_expiry_seconds,
+                ),
+                http2=http2,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def build_payload(self, request: LLMRequest, model: str, stream: bool = False) -> dict[str, Any]:
+        """
+        Build a chat completions request body.
+
+        Args:
+            request: The request to convert.
+            model: Model to send the request to.
+            stream: Whether to request a streamed response.
+
+        Returns:
+            JSON body for /chat/completions.
+        """
+        messages = []
+        if request.system_prompt:
+            messages.append({"role": "system", "content": request.system_prompt})
+        messages.append({"role": "user", "content": request.prompt})
+
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "temperature": request.temperature,
+            "max_tokens": request.max_tokens,
+        }
+        if stream:
+            payload["stream"] = True
+            payload["stream_options"] = {"include_usage": True}
+        return payload
+
+    def _raise_for_status(self, response: Any, model: str) -> None:
+        """Convert HTTP error responses to our error types."""
+        if response.status_code < 400:
+            return
+
+        try:
+            message = response.json().get("error", {}).get("message") or response.text
+        except (ValueError, AttributeError):
+            message = response.text
+        message = f"HTTP {response.status_code}: {message}"
+
+        if response.status_code == 429:
+            raise RateLimitError(
+                message,
+                provider=self.provider_name,
+                model=model,
+                status_code=429,
+                retry_after=parse_retry_after(response.headers),
+            )
+        elif response.status_code in (401, 403):
+            raise AuthenticationError(
+                message,
+                provider=self.provider_name,
+                model=model,
+                status_code=response.status_code,
+            )
+        elif response.status_code in (400, 404, 422):
+            raise InvalidRequestError(
+                message,
+                provider=self.provider_name,
+                model=model,
+                status_code=response.status_code,
+            )
+        raise LLMError(message, provider=self.provider_name, model=model, status_code=response.status_code)
+
+    @trace_generation("llm.generate")
+    async def generate(
+        self,
+        request: LLMRequest,
+        model: str | None = None,
+    ) -> LLMResponse:
+        """Generate a response from the chat completions endpoint."""
+        model = model or self.default_model
+        client = self._get_client()
+
+        start_time = time.perf_counter()
+        try:
+            response = await client.post("/chat/completions", json=self.build_payload(request, model))
+        except httpx.HTTPError as e:
+            raise LLMError(str(e), provider=self.provider_name, model=model)
+        self._raise_for_status(response, model)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        try:
+            data = response.json()
+        except ValueError:
+            raise LLMError(
+                f"Malformed response body: {response.text[:200]}",
+                provider=self.provider_name,
+                model=model,
+            )
+        usage = data.get("usage") or {}
+        choices = data.get("choices") or [{}]
+        return LLMResponse(
+            content=(choices[0].get("message") or {}).get("content") or "",
+            model=data.get("model", model),
+            input_tokens=usage.get("prompt_tokens", 0),
+            output_tokens=usage.get("completion_tokens", 0),
+            latency_ms=elapsed_ms,
+            raw_response=data,
+            headers=rate_limit_headers(response.headers),
+        )
+
+    @trace_generation("llm.generate_stream")
+    async def generate_stream(
+        self,
+        request: LLMRequest,
+        model: str | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+    ) -> LLMResponse:
+        """Stream a response over server-sent events, closing it once stop_when is satisfied."""
+        model = model or self.default_model
+        client = self._get_client()
+
+        chunks: list[str] = []
+        usage: dict[str, int] = {}
+        first_token_ms = 0.0
+        answer_ms = 0.0
+        stopped_early = False
+
+        start_time = time.perf_counter()
+        try:
+            async with client.stream(
+                "POST", "/chat/completions", json=self.build_payload(request, model, stream=True),
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._raise_for_status(response, model)
+                headers = rate_limit_headers(response.headers)
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        event = json.loads(data)
+                    except ValueError:
+                        raise LLMError(
+                            f"Malformed stream event: {data[:200]}",
+                            provider=self.provider_name,
+                            model=model,
+                        )
+                    usage = event.get("usage") or usage
+                    for choice in event.get("choices") or []:
+                        text = (choice.get("delta") or {}).get("content")
+                        if not text:
+                            continue
+                        if not chunks:
+                            first_token_ms = (time.perf_counter() - start_time) * 1000
+                        chunks.append(text)
+                        if stop_when is not None and stop_when(text):
+                            answer_ms = (time.perf_counter() - start_time) * 1000
+                            stopped_early = True
+                    if stopped_early:
+                        break
+        except httpx.HTTPError as e:
+            raise LLMError(str(e), provider=self.provider_name, model=model)
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        content = "".join(chunks)
+        output_tokens = usage.get("completion_tokens", 0)
+        if stopped_early:
+            # Roughly four characters per token
+            output_tokens = max(output_tokens, len(content) // 4)
+
+        return LLMResponse(
+            content=content,
+            model=model,
+            input_tokens=usage.get("prompt_tokens", 0),
+            output_tokens=output_tokens,
+            latency_ms=elapsed_ms,
+            time_to_first_token_ms=first_token_ms,
+            time_to_answer_ms=answer_ms or elapsed_ms,
+            stopped_early=stopped_early,
+            headers=headers,
+        )
+
+
+def get_openai_compatible_provider(base_url: str | None = None) -> OpenAICompatibleProvider:
+    """Factory function to create an OpenAI-compatible provider."""
+    return OpenAICompatibleProvider(base_url)
@@ -40,20 +40,40 @@ class ParsedScaffold:
 
 
 class ScaffoldParser:
-    """Parser for scaffold markdown files."""
+    """
+    Parser for scaffold markdown files.
 
-    # Regex patterns for extracting sections
+    Parsed scaffolds are memoized by path and modification time, so a
+    test suite parses each scaffold once and an edited file is re-parsed.
+    """
+
+    # Precompiled regex patterns for extracting sections
     SECTION_PATTERNS = {
-        "when_to_use": r"##\s*When to Use\s*\n(.*?)(?=\n##|\n---|\Z)",
-        "instructions": r"##\s*Scaffold Instructions.*?\n```\s*\n(.*?)\n```",
-        "worked_example": r"##\s*Worked Example\s*\n(.*?)(?=\n##\s*Common|\n---\s*\n##|\Z)",
-        "failure_modes": r"##\s*Common Failure Modes\s*\n(.*?)(?=\n##|\n---|\Z)",
+        name: re.compile(pattern, re.DOTALL | re.IGNORECASE)
+        for name, pattern in {
+            "when_to_use": r"##\s*When to Use\s*\n(.*?)(?=\n##|\n---|\Z)",
+            "instructions": r"##\s*Scaffold Instructions.*?\n```\s*\n(.*?)\n```",
+            "worked_example": r"##\s*Worked Example\s*\n(.*?)(?=\n##\s*Common|\n---\s*\n##|\Z)",
+            "failure_modes": r"##\s*Common Failure Modes\s*\n(.*?)(?=\n##|\n---|\Z)",
+        }.items()
     }
 
+    TITLE_PATTERN = re.compile(r"#\s*(.+?)\s*Scaffold")
+
+    def __init__(self):
+        self._cache: dict[Path, tuple[int, ParsedScaffold]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget all memoized scaffolds."""
+        self._cache.clear()
+
     def parse_file(self, file_path: Path) -> ParsedScaffold:
         """
         Parse a scaffold markdown file.
 
+        Returns the memoized result if the file is unchanged since it was
+        last parsed.
+
         Args:
             file_path: Path to the scaffold markdown file.
 
@@ -64,19 +84,32 @@ class ScaffoldParser:
             FileNotFoundError: If the file doesn't exist.
             ValueError: If required sections are missing.
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"Scaffold file not found: {file_path}")
-
+        try:
+            mtime = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._cache.pop(file_path, None)
+            raise FileNotFoundError(f"Scaffold file not found: {file_path}") from None
+
+        cached = self._cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        scaffold = self._parse(file_path)
+        self._cache[file_path] = (mtime, scaffold)
+        return scaffold
+
+    def _parse(self, file_path: Path) -> ParsedScaffold:
+        """Parse a scaffold markdown file without consulting the cache."""
         content = file_path.read_text(encoding="utf-8")
 
         # Extract algorithm name from title
-        title_match = re.search(r"#\s*(.+?)\s*Scaffold", content)
+        title_match = self.TITLE_PATTERN.search(content)
         name = title_match.group(1).strip() if title_match else file_path.stem
 
         # Extract sections
         sections: dict[str, str] = {}
         for section_name, pattern in self.SECTION_PATTERNS.items():
-            match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
+            match = pattern.search(content)
             sections[section_name] = match.group(1).strip() if match else ""
 
         if not sections["instructions"]:
@@ -262,6 +295,13 @@ FINAL_DISTANCE: <minimum edit distance>
         "hill_climbing": "optimization",
     }
 
+    SYSTEM_PROMPT = """You are an algorithm execution assistant. Your task is to:
+1. Follow the algorithm scaffold instructions EXACTLY as written
+2. Show your work step-by-step, including state tables where applicable
+3. Provide your final answer in the EXACT format specified at the end of the prompt
+
+Be precise and systematic. Do not skip steps or make assumptions not stated in the problem."""
+
     def __init__(self):
         self.parser = ScaffoldParser()
 
@@ -318,12 +358,7 @@ FINAL_DISTANCE: <minimum edit distance>
 
     def build_system_prompt(self) -> str:
         """Build the system prompt for verification runs."""
-        return """You are an algorithm execution assistant. Your task is to:
-1. Follow the algorithm scaffold instructions EXACTLY as written
-2. Show your work step-by-step, including state tables where applicable
-3. Provide your final answer in the EXACT format specified at the end of the prompt
-
-Be precise and systematic. Do not skip steps or make assumptions not stated in the problem."""
+        return self.SYSTEM_PROMPT
 
 
 def get_prompt_builder() -> PromptBuilder:
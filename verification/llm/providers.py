@@ -0,0 +1,55 @@
+"""
+Registry of LLM providers.
+
+Maps the provider names accepted by Settings.provider and --provider to
+factories, so the runner and CLI are not tied to one backend.
+"""
+
+from collections.abc import Callable
+
+from ..config import get_settings
+from .base import LLMError, LLMProvider
+from .claude import ClaudeProvider
+from .openai_compat import OpenAICompatibleProvider
+from .replay import ReplayProvider
+
+
+# Provider name to factory mapping
+PROVIDER_REGISTRY: dict[str, Callable[[], LLMProvider]] = {
+    "anthropic": ClaudeProvider,
+    "openai": OpenAICompatibleProvider,
+    "replay": ReplayProvider,
+}
+
+
+def register_provider(name: str, factory: Callable[[], LLMProvider]) -> None:
+    """
+    Register a provider factory under a name.
+
+    Args:
+        name: Provider name used in settings and on the command line.
+        factory: Callable returning a new provider instance.
+    """
+    PROVIDER_REGISTRY[name] = factory
+
+
+def get_provider(name: str | None = None) -> LLMProvider:
+    """
+    Create a provider by name.
+
+    Args:
+        name: Registered provider name. Uses settings.provider if not provided.
+
+    Returns:
+        A new LLMProvider instance.
+
+    Raises:
+        LLMError: If no provider is registered under the name.
+    """
+    name = name or get_settings().provider
+    if name not in PROVIDER_REGISTRY:
+        raise LLMError(
+            f"Unknown provider '{name}'. Available: {', '.join(PROVIDER_REGISTRY)}",
+            provider=name,
+        )
+    return PROVIDER_REGISTRY[name]()
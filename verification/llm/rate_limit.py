@@ -0,0 +1,295 @@
+"""
+Adaptive rate limiting for LLM calls.
+
+A RateLimiter holds two token buckets, one for requests per minute and
+one for tokens per minute, and every call waits on both before it is
+sent. Bucket sizes are taken from the rate-limit headers the API returns,
+capped by the configured limits, and the refill rate backs off
+multiplicatively on 429 responses and recovers additively on success, so
+throughput settles just under the quota instead of alternating between
+bursts and long sleeps.
+
+Limiters are shared per provider name, so every runner in the process
+draws from the same quota.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+from datetime import datetime, timezone
+
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+# Header names carrying (limit, remaining) for each bucket, in order of preference
+REQUEST_LIMIT_HEADERS = [
+    ("anthropic-ratelimit-requests-limit", "anthropic-ratelimit-requests-remaining"),
+    ("x-ratelimit-limit-requests", "x-ratelimit-remaining-requests"),
+]
+TOKEN_LIMIT_HEADERS = [
+    ("anthropic-ratelimit-tokens-limit", "anthropic-ratelimit-tokens-remaining"),
+    ("x-ratelimit-limit-tokens", "x-ratelimit-remaining-tokens"),
+]
+
+
+def rate_limit_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    """
+    Extract the rate-limit related headers from a response.
+
+    Args:
+        headers: Response headers (case-insensitive mapping or plain dict).
+
+    Returns:
+        Dictionary of lower-cased rate-limit and retry-after headers.
+    """
+    return {
+        name.lower(): value
+        for name, value in headers.items()
+        if "ratelimit" in name.lower() or name.lower().startswith("retry-after")
+    }
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """
+    Read the server-requested delay from retry-after headers.
+
+    Args:
+        headers: Response headers.
+
+    Returns:
+        Delay in seconds, or None if the response did not specify one.
+    """
+    headers = rate_limit_headers(headers)
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+
+    # Fall back to the reset time of an exhausted bucket
+    for name, value in headers.items():
+        if not name.endswith("-reset") or headers.get(name[:-len("reset")] + "remaining") != "0":
+            continue
+        try:
+            reset = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        return max(0.0, (reset - datetime.now(timezone.utc)).total_seconds())
+    return None
+
+
+class TokenBucket:
+    """Token bucket refilled continuously up to a per-minute capacity."""
+
+    def __init__(self, per_minute: float = 0.0):
+        """
+        Initialize the bucket.
+
+        Args:
+            per_minute: Capacity and refill amount per minute (0 for unlimited).
+        """
+        self.capacity = per_minute
+        self.tokens = per_minute
+        self.updated = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        """Whether the bucket never blocks."""
+        return self.capacity <= 0
+
+    def refill(self, now: float, scale: float = 1.0) -> None:
+        """Add tokens accrued since the last refill at the scaled rate."""
+        if not self.unlimited:
+            rate = self.capacity / 60 * scale
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, scale: float = 1.0) -> float:
+        """Seconds until amount tokens are available (0 if available now)."""
+        if self.unlimited:
+            return 0.0
+        # A single request larger than the bucket only has to wait for a full bucket
+        deficit = min(amount, self.capacity) - self.tokens
+        if deficit <= 0:
+            return 0.0
+        return deficit / (self.capacity / 60 * scale)
+
+    def take(self, amount: float) -> None:
+        """Remove tokens (may go negative to repay underestimated usage)."""
+        if not self.unlimited:
+            self.tokens -= amount
+
+    def resize(self, capacity: float) -> None:
+        """Change the capacity, keeping the current fill within bounds."""
+        if capacity != self.capacity:
+            if self.unlimited:
+                self.tokens = capacity
+            self.capacity = capacity
+            self.tokens = min(self.tokens, capacity)
+
+
+class RateLimiter:
+    """Adaptive requests/min and tokens/min limiter shared by concurrent calls."""
+
+    MIN_SCALE = 0.1
+    """Lowest fraction of the nominal rate the limiter backs off to."""
+
+    INCREASE = 0.05
+    """Fraction of the nominal rate recovered after each successful call."""
+
+    DECREASE = 0.5
+    """Factor the rate is multiplied by after a rate-limit error."""
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Request cap (0 to use only the API-reported limit).
+                Uses settings if not provided.
+            tokens_per_minute: Token cap (0 to use only the API-reported limit).
+                Uses settings if not provided.
+        """
+        settings = get_settings()
+        self.max_requests_per_minute = (
+            settings.rate_limit_requests_per_minute if requests_per_minute is None
+            else requests_per_minute
+        )
+        self.max_tokens_per_minute = (
+            settings.rate_limit_tokens_per_minute if tokens_per_minute is None
+            else tokens_per_minute
+        )
+        self.requests = TokenBucket(self.max_requests_per_minute)
+        self.tokens = TokenBucket(self.max_tokens_per_minute)
+        self.scale = 1.0
+        self._paused_until = 0.0
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Get the lock for the running event loop (limiters outlive single runs)."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """
+        Wait until a request using the given number of tokens may be sent.
+
+        Waiters are served in arrival order.
+
+        Args:
+            tokens: Estimated tokens the request will use.
+        """
+        async with self._get_lock():
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self.requests.refill(now, self.scale)
+                self.tokens.refill(now, self.scale)
+                wait = max(
+                    self.requests.wait_time(1, self.scale),
+                    self.tokens.wait_time(tokens, self.scale),
+                )
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+            self.requests.take(1)
+            self.tokens.take(tokens)
+
+    def record_success(
+        self,
+        headers: Mapping[str, str] | None = None,
+        tokens_used: int = 0,
+        tokens_estimated: int = 0,
+    ) -> None:
+        """
+        Update the limiter after a successful call.
+
+        Args:
+            headers: Rate-limit headers from the response.
+            tokens_used: Tokens the call actually used.
+            tokens_estimated: Tokens reserved for the call in acquire().
+        """
+        if headers:
+            self.update_from_headers(headers)
+        self.tokens.take(tokens_used - tokens_estimated)
+        self.scale = min(1.0, self.scale + self.INCREASE)
+
+    def record_rate_limit(self, retry_after: float) -> None:
+        """
+        Slow down after a rate-limit error.
+
+        Every caller waiting on this limiter pauses for retry_after seconds,
+        and the refill rate is cut so the quota is not immediately exceeded again.
+
+        Args:
+            retry_after: Seconds to pause all calls.
+        """
+        self.scale = max(self.MIN_SCALE, self.scale * self.DECREASE)
+        self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        logger.info(f"Rate limited: pausing {retry_after:.1f}s, rate scaled to {self.scale:.0%}")
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Resize the buckets to the limits reported by the API.
+
+        Args:
+            headers: Response headers.
+        """
+        headers = rate_limit_headers(headers)
+        now = time.monotonic()
+        for bucket, configured, names in [
+            (self.requests, self.max_requests_per_minute, REQUEST_LIMIT_HEADERS),
+            (self.tokens, self.max_tokens_per_minute, TOKEN_LIMIT_HEADERS),
+        ]:
+            for limit_name, remaining_name in names:
+                if limit_name not in headers:
+                    continue
+                try:
+                    limit = float(headers[limit_name])
+                    remaining = float(headers.get(remaining_name, limit))
+                except ValueError:
+                    break
+                bucket.refill(now, self.scale)
+                bucket.resize(min(limit, configured) if configured > 0 else limit)
+                bucket.tokens = min(bucket.tokens, remaining)
+                break
+
+
+_limiters: dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(name: str) -> RateLimiter:
+    """
+    Get the shared rate limiter for a provider.
+
+    Args:
+        name: Provider name (e.g., 'anthropic').
+
+    Returns:
+        The process-wide RateLimiter for that provider.
+    """
+    if name not in _limiters:
+        _limiters[name] = RateLimiter()
+    return _limiters[name]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for rate-limit reservations (about four characters per token)."""
+    return len(text) // 4 + 1
@@ -0,0 +1,320 @@
+"""
+Record/replay LLM providers for offline runs.
+
+RecordingProvider wraps a real provider and appends every response to a
+cassette (a JSONL file keyed by the same request hash as the response
+cache). ReplayProvider serves those responses back without network
+access, optionally with injected latency, jitter and errors, so the
+runner, parser and validator pipeline can be exercised and benchmarked
+deterministically on machines without an API key.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..config import get_settings
+from .base import LLMError, LLMProvider, LLMRequest, LLMResponse, RateLimitError, trace_generation
+from .cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReplayProfile:
+    """Latency and failure behavior injected into replayed responses."""
+
+    latency_ms: float = 0.0
+    """Fixed delay added to every response."""
+
+    jitter_ms: float = 0.0
+    """Maximum random delay added on top of the fixed delay."""
+
+    latency_scale: float = 0.0
+    """Multiplier applied to the latency recorded with each response."""
+
+    error_rate: float = 0.0
+    """Fraction of calls that fail with a transient LLMError."""
+
+    rate_limit_rate: float = 0.0
+    """Fraction of calls that fail with a RateLimitError."""
+
+
+# Named profiles selectable via settings.replay_profile or --replay-profile
+REPLAY_PROFILES: dict[str, ReplayProfile] = {
+    "instant": ReplayProfile(),
+    "recorded": ReplayProfile(latency_scale=1.0),
+    "fast": ReplayProfile(latency_ms=50.0, jitter_ms=20.0),
+    "flaky": ReplayProfile(latency_scale=1.0, jitter_ms=100.0, error_rate=0.02, rate_limit_rate=0.05),
+}
+
+
+class Cassette:
+    """
+    JSONL file of recorded responses keyed by request hash.
+
+    Keys are scoped to the backend that answered (see
+    LLMProvider.cache_scope), which is stored with each entry so replay
+    can look requests up under the scopes the cassette was recorded with.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open a cassette.
+
+        Args:
+            path: Cassette file (created on first record).
+        """
+        self.path = Path(path)
+        self.entries: dict[str, LLMResponse] = {}
+        self.models: list[str] = []
+        self.scopes: list[str] = []
+        if self.path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        """Read every recorded response."""
+        with open(self.path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping unreadable line {line_number} of {self.path}")
+                    continue
+                self._add(
+                    entry["key"], entry["model"], entry.get("scope", ""), LLMResponse.from_dict(entry["response"]),
+                )
+
+    def _add(self, key: str, model: str, scope: str, response: LLMResponse) -> None:
+        """Index a response in memory."""
+        self.entries[key] = response
+        if model not in self.models:
+            self.models.append(model)
+        if scope not in self.scopes:
+            self.scopes.append(scope)
+
+    def find(self, request: LLMRequest, model: str) -> tuple[str, LLMResponse | None]:
+        """
+        Look up the recorded response to a request under each recorded scope.
+
+        Returns:
+            The matching key and response, or the key under the first
+            recorded scope and None if the request was not recorded.
+        """
+        keys = [ResponseCache.make_key(request, model, scope) for scope in self.scopes or [""]]
+        for key in keys:
+            if key in self.entries:
+                return key, self.entries[key]
+        return keys[0], None
+
+    def get(self, request: LLMRequest, model: str) -> LLMResponse | None:
+        """Look up the recorded response to a request."""
+        return self.find(request, model)[1]
+
+    def record(self, request: LLMRequest, model: str, response: LLMResponse, scope: str = "") -> None:
+        """
+        Append a response and flush it to disk.
+
+        Args:
+            request: The request that was sent.
+            model: The model the request was sent to.
+            response: The response received.
+            scope: Backend that answered the request (LLMProvider.cache_scope).
+        """
+        key = ResponseCache.make_key(request, model, scope)
+        entry = {"key": key, "model": model, "scope": scope, "response": response.to_dict()}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        self._add(key, model, scope, response)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class RecordingProvider(LLMProvider):
+    """Wraps a provider and records each of its responses to a cassette."""
+
+    def __init__(self, provider: LLMProvider, cassette_path: Path | None = None):
+        """
+        Initialize the recording provider.
+
+        Args:
+            provider: Provider that answers the requests.
+            cassette_path: Cassette to append to. Uses settings if not provided.
+        """
+        self.provider = provider
+        self.cassette = Cassette(cassette_path or get_settings().get_cassette_path())
+
+    @property
+    def provider_name(self) -> str:
+        return self.provider.provider_name
+
+    @property
+    def default_model(self) -> str:
+        return self.provider.default_model
+
+    @property
+    def cache_scope(self) -> str:
+        return self.provider.cache_scope
+
+    def is_available(self) -> bool:
+        return self.provider.is_available()
+
+    async def generate(self, request: LLMRequest, model: str | None = None) -> LLMResponse:
+        model = model or self.default_model
+        response = await self.provider.generate(request, model)
+        self.cassette.record(request, model, response, self.cache_scope)
+        return response
+
+    async def generate_stream(
+        self,
+        request: LLMRequest,
+        model: str | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+    ) -> LLMResponse:
+        model = model or self.default_model
+        response = await self.provider.generate_stream(request, model, stop_when)
+        self.cassette.record(request, model, response, self.cache_scope)
+        return response
+
+    async def aclose(self) -> None:
+        await self.provider.aclose()
+
+
+class ReplayProvider(LLMProvider):
+    """Serves recorded responses from a cassette without network access."""
+
+    def __init__(
+        self,
+        cassette_path: Path | None = None,
+        profile: ReplayProfile | str | None = None,
+        seed: int | None = None,
+    ):
+        """
+        Initialize the replay provider.
+
+        Args:
+            cassette_path: Cassette to replay. Uses settings if not provided.
+            profile: Profile or profile name. Uses settings.replay_profile if not provided.
+            seed: Seed for latency jitter and injected errors. Uses settings if not provided.
+        """
+        settings = get_settings()
+        self.cassette = Cassette(cassette_path or settings.get_cassette_path())
+        profile = profile or settings.replay_profile
+        if isinstance(profile, str):
+            if profile not in REPLAY_PROFILES:
+                raise LLMError(
+                    f"Unknown replay profile '{profile}'. Available: {', '.join(REPLAY_PROFILES)}",
+                    provider="replay",
+                )
+            profile = REPLAY_PROFILES[profile]
+        self.profile = profile
+        self.seed = settings.replay_seed if seed is None else seed
+        self._served: dict[str, int] = {}
+
+    @property
+    def provider_name(self) -> str:
+        return "replay"
+
+    @property
+    def default_model(self) -> str:
+        # Replay against the model the cassette was recorded with
+        return self.cassette.models[0] if self.cassette.models else get_settings().active_model
+
+    def is_available(self) -> bool:
+        """Check if the cassette has any recorded responses."""
+        return len(self.cassette) > 0
+
+    def _rng(self, key: str) -> random.Random:
+        """
+        Random source for one call.
+
+        Seeded from the request and how often it has been served, so the
+        injected delays and errors do not depend on task scheduling order.
+        """
+        count = self._served.get(key, 0)
+        self._served[key] = count + 1
+        return random.Random(f"{self.seed}:{key}:{count}")
+
+    async def _replay(self, request: LLMRequest, model: str) -> LLMResponse:
+        """Look up a response, wait out the injected latency and inject errors."""
+        key, recorded = self.cassette.find(request, model)
+        if recorded is None:
+            raise LLMError(
+                f"No recorded response for request {key[:12]} ({model}) in {self.cassette.path}",
+                provider=self.provider_name,
+                model=model,
+            )
+
+        rng = self._rng(key)
+        delay_ms = (
+            self.profile.latency_ms
+            + recorded.latency_ms * self.profile.latency_scale
+            + rng.uniform(0, self.profile.jitter_ms)
+        )
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        roll = rng.random()
+        if roll < self.profile.rate_limit_rate:
+            raise RateLimitError(
+                "Injected rate limit", provider=self.provider_name, model=model, status_code=429,
+            )
+        if roll < self.profile.rate_limit_rate + self.profile.error_rate:
+            raise LLMError("Injected error", provider=self.provider_name, model=model, status_code=500)
+        return recorded
+
+    def _copy(self, recorded: LLMResponse, elapsed_ms: float, **changes: Any) -> LLMResponse:
+        """Build a fresh response from a recorded one."""
+        data = recorded.to_dict()
+        data.pop("timestamp")
+        response = LLMResponse.from_dict(data)
+        response.latency_ms = elapsed_ms
+        response.cached = False
+        for name, value in changes.items():
+            setattr(response, name, value)
+        return response
+
+    @trace_generation("llm.generate")
+    async def generate(self, request: LLMRequest, model: str | None = None) -> LLMResponse:
+        model = model or self.default_model
+        start_time = time.perf_counter()
+        recorded = await self._replay(request, model)
+        return self._copy(recorded, (time.perf_counter() - start_time) * 1000)
+
+    @trace_generation("llm.generate_stream")
+    async def generate_stream(
+        self,
+        request: LLMRequest,
+        model: str | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+    ) -> LLMResponse:
+        """Replay a response line by line, stopping once stop_when is satisfied."""
+        model = model or self.default_model
+        start_time = time.perf_counter()
+        recorded = await self._replay(request, model)
+
+        content = ""
+        stopped_early = False
+        for chunk in recorded.content.splitlines(keepends=True):
+            content += chunk
+            if stop_when is not None and stop_when(chunk):
+                stopped_early = True
+                break
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        return self._copy(
+            recorded,
+            elapsed_ms,
+            content=content,
+            stopped_early=stopped_early,
+            time_to_first_token_ms=elapsed_ms,
+            time_to_answer_ms=elapsed_ms,
+        )
@@ -10,6 +10,9 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
+from ..tracing import traced
+from .prompt_builder import PromptBuilder
+
 
 @dataclass
 class ParsedAnswer:
@@ -72,6 +75,11 @@ class ResponseParser:
         "subset": r"FINAL_SUBSET:\s*\[([^\]]*)\]",
     }
 
+    @traced(
+        "response_parser.parse",
+        attributes=lambda self, response, algorithm: {"algorithm": algorithm, "response_chars": len(response)},
+        result_attributes=lambda parsed: {"is_valid": parsed.is_valid},
+    )
     def parse(self, response: str, algorithm: str) -> ParsedAnswer:
         """
         Parse an LLM response to extract the answer.
@@ -1312,6 +1320,109 @@ class ResponseParser:
         return None
 
 
+class IncrementalResponseParser:
+    """
+    Detects when a streamed response contains a complete final answer.
+
+    Text is fed in as it arrives. The FINAL_* fields an algorithm must
+    report are taken from the output format the prompt asked for, so the
+    two cannot drift apart. A field counts as complete once its line has
+    ended and any brackets in its value are balanced, which allows values
+    such as sudoku grids to span several lines.
+    """
+
+    MARKER_PATTERN = re.compile(r"(FINAL_[A-Z_]+)\s*:\s*(\S*)")
+
+    def __init__(self, algorithm: str):
+        """
+        Initialize the parser for one algorithm.
+
+        Args:
+            algorithm: Algorithm name (scaffold file stem).
+        """
+        format_key = PromptBuilder.ALGORITHM_FORMATS.get(algorithm.lower(), "single_value")
+        self.required: list[str] = []
+        self.alternatives: list[tuple[str, str]] = []
+        for line in PromptBuilder.OUTPUT_FORMATS[format_key].splitlines():
+            match = self.MARKER_PATTERN.search(line)
+            if not match:
+                continue
+            if line.startswith("FINAL_"):
+                self.required.append(match.group(1))
+            else:
+                # e.g. "If no solution exists, write: FINAL_ANSWER: NO_SOLUTION"
+                self.alternatives.append((match.group(1), match.group(2)))
+
+        self.found: set[str] = set()
+        self.complete = False
+        self._line = ""
+        self._open_field: str | None = None
+        self._depth = 0
+
+    def feed(self, text: str) -> bool:
+        """
+        Consume the next chunk of streamed text.
+
+        Args:
+            text: Newly received text.
+
+        Returns:
+            True once every required field (or a no-solution answer) is complete.
+        """
+        if self.complete:
+            return True
+
+        self._line += text
+        *lines, self._line = self._line.split("\n")
+        for line in lines:
+            self._consume_line(line)
+            if self.complete:
+                break
+        return self.complete
+
+    def _consume_line(self, line: str) -> None:
+        """Update field state with one complete line."""
+        if self._open_field is not None:
+            if self._depth == 0 and not line.strip():
+                return  # value starts on a later line
+            self._depth += self._bracket_depth(line)
+            if self._depth <= 0:
+                self._close_field(self._open_field)
+            return
+
+        match = self.MARKER_PATTERN.search(line.upper())
+        if not match:
+            return
+
+        name, value = match.group(1), match.group(2).strip("*`")
+        if (name, value) in self.alternatives:
+            self.complete = True
+            return
+        if name not in self.required or name in self.found:
+            return
+
+        depth = self._bracket_depth(line[match.start(2):])
+        if depth > 0 or not value:
+            self._open_field, self._depth = name, depth
+        else:
+            self._close_field(name)
+
+    def _close_field(self, name: str) -> None:
+        """Record a field as complete."""
+        self._open_field = None
+        self._depth = 0
+        self.found.add(name)
+        self.complete = all(field_name in self.found for field_name in self.required)
+
+    @staticmethod
+    def _bracket_depth(text: str) -> int:
+        """Net number of brackets/braces opened in text."""
+        return (
+            text.count("[") + text.count("{") + text.count("(")
+            - text.count("]") - text.count("}") - text.count(")")
+        )
+
+
 def get_response_parser() -> ResponseParser:
     """Factory function to create a response parser."""
     return ResponseParser()
@@ -50,35 +50,41 @@ def nqueens(
 
     solutions = []
 
-    def is_safe(board: list[int], row: int, col: int) -> bool:
-        """Check if placing queen at (row, col) is safe."""
-        for r in range(row):
-            c = board[r]
-            # Same column
-            if c == col:
-                return False
-            # Diagonal
-            if abs(r - row) == abs(c - col):
-                return False
-        return True
-
-    def solve(board: list[int], row: int) -> bool:
-        """Recursively place queens."""
-        if row == n:
-            solutions.append([(r, board[r]) for r in range(n)])
-            return not find_all  # Return True to stop if not finding all
-
-        for col in range(n):
-            if is_safe(board, row, col):
-                board[row] = col
-                if solve(board, row + 1):
-                    return True
-                board[row] = -1
-
-        return False
-
+    # Columns and diagonals already attacked by a placed queen
+    columns = [False] * n
+    diagonals = [False] * (2 * n - 1)  # row + col
+    anti_diagonals = [False] * (2 * n - 1)  # row - col + n - 1
+
+    def set_queen(row: int, col: int, placed: bool) -> None:
+        columns[col] = placed
+        diagonals[row + col] = placed
+        anti_diagonals[row - col + n - 1] = placed
+
+    # Place queens row by row with an explicit stack (board[row] is the
+    # column tried in each row), trying columns left to right
     board = [-1] * n
-    solve(board, 0)
+    row = 0
+    while row >= 0:
+        col = board[row] + 1
+        if board[row] != -1:
+            set_queen(row, board[row], False)
+        while col < n and (columns[col] or diagonals[row + col] or anti_diagonals[row - col + n - 1]):
+            col += 1
+
+        if col == n:
+            # No column left in this row: backtrack
+            board[row] = -1
+            row -= 1
+            continue
+
+        board[row] = col
+        set_queen(row, col, True)
+        if row == n - 1:
+            solutions.append([(r, board[r]) for r in range(n)])
+            if not find_all:
+                break
+        else:
+            row += 1
 
     if solutions:
         return BacktrackingResult(
@@ -188,22 +194,30 @@ def graph_coloring(
                 return False
         return True
 
-    def solve(idx: int) -> bool:
-        """Recursively assign colors."""
-        if idx == len(vertices):
-            return True
-
-        vertex = vertices[idx]
-        for color in range(1, num_colors + 1):
-            if is_safe(vertex, color):
-                colors[vertex] = color
-                if solve(idx + 1):
-                    return True
+    def solve() -> bool:
+        """Assign colors in vertex order, backtracking with an explicit stack."""
+        tried = [0] * len(vertices)  # Color currently tried at each position
+        idx = 0
+        while 0 <= idx < len(vertices):
+            vertex = vertices[idx]
+            if tried[idx]:
+                # Backtracked into this vertex: undo its color and try the next one
                 colors[vertex] = 0
+            color = tried[idx] + 1
+            while color <= num_colors and not is_safe(vertex, color):
+                color += 1
+
+            if color > num_colors:
+                tried[idx] = 0
+                idx -= 1
+            else:
+                tried[idx] = color
+                colors[vertex] = color
+                idx += 1
 
-        return False
+        return idx == len(vertices)
 
-    if solve(0):
+    if solve():
         return BacktrackingResult(found=True, solution=dict(colors))
     else:
         return BacktrackingResult(found=False)
@@ -227,28 +241,28 @@ def subset_sum(
     """
     solutions = []
 
-    def solve(idx: int, current_sum: int, subset: list[int]) -> bool:
-        """Recursively find subsets."""
+    # Depth-first over (index, sum, subset size), including each number
+    # before excluding it; subset holds the current branch's numbers
+    subset: list[int] = []
+    stack = [(0, 0, 0)]
+    while stack:
+        idx, current_sum, size = stack.pop()
+        del subset[size:]
+
         if current_sum == target:
             solutions.append(subset[:])
-            return not find_all
+            if not find_all:
+                break
+            continue
 
         if idx >= len(numbers) or current_sum > target:
-            return False
+            continue
 
-        # Include current number
+        # Exclude current number (explored after the include branch)
+        stack.append((idx + 1, current_sum, size))
+        # Include current number (explored next)
         subset.append(numbers[idx])
-        if solve(idx + 1, current_sum + numbers[idx], subset):
-            return True
-        subset.pop()
-
-        # Exclude current number
-        if solve(idx + 1, current_sum, subset):
-            return True
-
-        return False
-
-    solve(0, 0, [])
+        stack.append((idx + 1, current_sum + numbers[idx], size + 1))
 
     if solutions:
         return BacktrackingResult(
@@ -0,0 +1,527 @@
+"""
+Compressed sparse row (CSR) graphs for the graph reference implementations.
+
+A CSRGraph interns vertex names to integer ids and stores the out-edges
+of vertex u at targets[offsets[u]:offsets[u + 1]] (with matching
+weights), so large graphs take a few flat arrays instead of a dict per
+vertex. Edges keep their insertion order within each vertex and a
+repeated edge keeps its last weight, matching networkx, so traversal
+orders and tie-breaking agree with the networkx implementations these
+replace.
+
+The algorithms here work on vertex ids; reference.graph maps their
+results back to vertex names.
+"""
+
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class CSRGraph:
+    """Directed graph in compressed sparse row form (undirected edges are stored both ways)."""
+
+    vertices: list[str]
+    """Vertex names, indexed by vertex id."""
+
+    index: dict[str, int]
+    """Vertex id of each name."""
+
+    offsets: np.ndarray
+    """Out-edges of vertex u are at positions offsets[u] to offsets[u + 1] (length V + 1)."""
+
+    targets: np.ndarray
+    """Target vertex id of each edge."""
+
+    weights: np.ndarray
+    """Weight of each edge (int64 if every weight is an integer, float64 if none is, else the weights as given)."""
+
+    directed: bool = True
+    """Whether the graph was built as directed."""
+
+    _lists: tuple[list[int], list[int], list[float]] | None = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_edges(
+        cls,
+        vertices: list[str],
+        edges: list[tuple[str, str, float] | list],
+        directed: bool = True,
+    ) -> "CSRGraph":
+        """
+        Build a graph from vertices and edges.
+
+        Vertices that only appear in edges are added after the listed ones.
+
+        Args:
+            vertices: List of vertex names.
+            edges: List of (source, target, weight) or (source, target) edges.
+                Edges without a weight get weight 1.
+            directed: Whether the graph is directed.
+
+        Returns:
+            CSRGraph with one entry per distinct (source, target) pair.
+        """
+        names = list(dict.fromkeys(vertices))
+        index = {name: i for i, name in enumerate(names)}
+        heads = [edge[0] for edge in edges]
+        tails = [edge[1] for edge in edges]
+        if not index.keys() >= set(heads).union(tails):
+            # Intern vertices that only appear in edges, in order of appearance
+            for edge in zip(heads, tails):
+                for name in edge:
+                    if name not in index:
+                        index[name] = len(names)
+                        names.append(name)
+
+        n = len(names)
+        sources = np.array(list(map(index.__getitem__, heads)), dtype=np.int64)
+        targets = np.array(list(map(index.__getitem__, tails)), dtype=np.int64)
+        given = [edge[2] if len(edge) == 3 else 1 for edge in edges]
+        weights = np.asarray(given or [0])[:len(edges)]
+        if weights.dtype.kind in "biu":
+            weights = weights.astype(np.int64)
+        elif any(isinstance(w, (int, np.integer)) for w in given):
+            # Mixed int and float weights keep their own types, so paths
+            # over integer edges still sum to ints (as they do in networkx)
+            weights = np.array(given, dtype=object)
+        else:
+            weights = weights.astype(np.float64)
+
+        if not directed:
+            # Store u -> v then v -> u for each edge (self-loops once)
+            keep = np.repeat(sources != targets, 2)
+            keep[::2] = True
+            sources, targets = (
+                np.column_stack([sources, targets]).reshape(-1)[keep],
+                np.column_stack([targets, sources]).reshape(-1)[keep],
+            )
+            weights = np.repeat(weights, 2)[keep]
+
+        # A repeated edge keeps its first position and its last weight
+        keys = sources * n + targets
+        by_key = np.argsort(keys, kind="stable")
+        sorted_keys = keys[by_key]
+        starts = np.flatnonzero(np.diff(sorted_keys, prepend=-1))
+        if len(starts) < len(by_key):
+            ends = np.append(starts[1:], len(by_key)) - 1
+            first, last = by_key[starts], by_key[ends]
+            weights[first] = weights[last]
+            first.sort()
+            sources, targets, weights = sources[first], targets[first], weights[first]
+
+        # Group edges by source, keeping their order within each source
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+
+        return cls(
+            vertices=names,
+            index=index,
+            offsets=offsets,
+            targets=targets[order],
+            weights=weights[order],
+            directed=directed,
+        )
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of stored (directed) edges."""
+        return len(self.targets)
+
+    def id(self, name: str) -> int:
+        """
+        Look up the id of a vertex.
+
+        Raises:
+            ValueError: If the vertex is not in the graph.
+        """
+        if name not in self.index:
+            raise ValueError(f"Vertex {name} not in graph")
+        return self.index[name]
+
+    def neighbors(self, u: int) -> list[int]:
+        """Ids of u's out-neighbors, in edge insertion order."""
+        return self.targets[self.offsets[u]:self.offsets[u + 1]].tolist()
+
+    def adjacency(self) -> tuple[list[int], list[int], list[float]]:
+        """
+        Offsets, targets and weights as Python lists (much faster to index in loops).
+
+        The lists are converted once and shared by every search over the graph.
+        """
+        if self._lists is None:
+            self._lists = (self.offsets.tolist(), self.targets.tolist(), self.weights.tolist())
+        return self._lists
+
+
+def path_to(predecessors: list[int], target: int) -> list[int]:
+    """
+    Follow predecessors back from a target.
+
+    Args:
+        predecessors: Predecessor id of each vertex (-1 for none).
+        target: Vertex to reconstruct the path to.
+
+    Returns:
+        Vertex ids from the root of the search to target.
+    """
+    path = []
+    current = target
+    while current != -1:
+        path.append(current)
+        current = predecessors[current]
+    path.reverse()
+    return path
+
+
+def bfs(graph: CSRGraph, source: int) -> tuple[list[int], list[float], list[int]]:
+    """
+    Breadth-first search from a source.
+
+    Args:
+        graph: Graph to search.
+        source: Source vertex id.
+
+    Returns:
+        Visit order, hop distance of each vertex (inf if unreachable) and
+        predecessor of each vertex (-1 for none).
+    """
+    return multi_source_bfs(graph, [source])
+
+
+def multi_source_bfs(graph: CSRGraph, sources: list[int]) -> tuple[list[int], list[float], list[int]]:
+    """
+    Breadth-first search from several sources at once.
+
+    Every source starts at distance 0, so each vertex gets its hop
+    distance from the nearest source. On a graph packed from disjoint
+    graphs with one source each, every component's visit order,
+    distances and predecessors are exactly those of a separate search.
+
+    Args:
+        graph: Graph to search.
+        sources: Source vertex ids (visited in this order).
+
+    Returns:
+        Visit order, hop distance of each vertex (inf if unreachable) and
+        predecessor of each vertex (-1 for none).
+    """
+    offsets, targets, _ = graph.adjacency()
+    n = graph.num_vertices
+    unreached = float("inf")
+    distances: list[float] = [unreached] * n
+    predecessors = [-1] * n
+    order = list(dict.fromkeys(sources))
+    for source in order:
+        distances[source] = 0
+    queue = deque(order)
+
+    while queue:
+        u = queue.popleft()
+        next_distance = distances[u] + 1
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if distances[v] == unreached:
+                distances[v] = next_distance
+                predecessors[v] = u
+                order.append(v)
+                queue.append(v)
+
+    return order, distances, predecessors
+
+
+def dfs(graph: CSRGraph, source: int, target: int | None = None) -> tuple[list[int], list[int], bool]:
+    """
+    Depth-first search from a source, stopping once target is reached.
+
+    Vertices are visited in the order of the recursive search: each
+    vertex's out-edges in insertion order, descending into the first
+    unvisited target.
+
+    Args:
+        graph: Graph to search.
+        source: Source vertex id.
+        target: Vertex id to stop at (optional).
+
+    Returns:
+        Visit order, predecessor of each vertex in the search tree (-1 for
+        none) and whether target was reached.
+    """
+    offsets, targets, _ = graph.adjacency()
+    visited = [False] * graph.num_vertices
+    predecessors = [-1] * graph.num_vertices
+    visited[source] = True
+    order = [source]
+    if source == target:
+        return order, predecessors, True
+
+    # Vertices on the current path and the next out-edge to try from each
+    # (an explicit stack, so long paths cannot hit the recursion limit)
+    stack = [source]
+    positions = [offsets[source]]
+
+    while stack:
+        u = stack[-1]
+        k = positions[-1]
+        end = offsets[u + 1]
+        while k < end and visited[targets[k]]:
+            k += 1
+        if k == end:
+            stack.pop()
+            positions.pop()
+            continue
+
+        positions[-1] = k + 1
+        v = targets[k]
+        visited[v] = True
+        predecessors[v] = u
+        order.append(v)
+        if v == target:
+            return order, predecessors, True
+        stack.append(v)
+        positions.append(offsets[v])
+
+    return order, predecessors, False
+
+
+def dijkstra(
+    graph: CSRGraph,
+    source: int,
+    stop_at: int | None = None,
+) -> tuple[list[int], list[float], list[int]]:
+    """
+    Dijkstra's algorithm from a source (binary heap with lazy deletion).
+
+    Ties are broken as networkx breaks them: among equal distances the
+    vertex pushed first is settled first, and a vertex keeps the first
+    predecessor that reached it at its final distance.
+
+    Args:
+        graph: Graph with non-negative weights.
+        source: Source vertex id.
+        stop_at: Vertex id to stop at once settled. Only vertices settled
+            by then (those in the returned order) have final distances.
+
+    Returns:
+        Settle order, distance of each vertex (inf if unreachable) and
+        predecessor of each vertex (-1 for none).
+
+    Raises:
+        ValueError: If a negative weight makes a settled distance shrink.
+    """
+    return multi_source_dijkstra(graph, [source], stop_at)
+
+
+def multi_source_dijkstra(
+    graph: CSRGraph,
+    sources: list[int],
+    stop_at: int | None = None,
+) -> tuple[list[int], list[float], list[int]]:
+    """
+    Dijkstra's algorithm from several sources at once.
+
+    Every source starts at distance 0, so each vertex gets its distance
+    from the nearest source. Heap entries are ordered by distance, then
+    by push order, and the pushes within one component happen in the
+    same relative order as in a separate search. On a graph packed from
+    disjoint graphs with one source each, every component's settle
+    order, distances and predecessors are therefore exactly those of a
+    separate search, ties included.
+
+    Args:
+        graph: Graph with non-negative weights.
+        sources: Source vertex ids (settled in this order).
+        stop_at: Vertex id to stop at once settled.
+
+    Returns:
+        Settle order, distance of each vertex (inf if unreachable) and
+        predecessor of each vertex (-1 for none).
+
+    Raises:
+        ValueError: If a negative weight makes a settled distance shrink.
+    """
+    offsets, targets, weights = graph.adjacency()
+    n = graph.num_vertices
+    distances: list[float] = [float("inf")] * n
+    predecessors = [-1] * n
+    settled = [False] * n
+    order = []
+    heap = [(0, i, source) for i, source in enumerate(dict.fromkeys(sources))]
+    for _, _, source in heap:
+        distances[source] = 0
+    pushes = len(heap)
+
+    while heap:
+        d, _, u = heapq.heappop(heap)
+        if settled[u]:
+            continue
+        settled[u] = True
+        order.append(u)
+        if u == stop_at:
+            break
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            candidate = d + weights[k]
+            if settled[v]:
+                if candidate < distances[v]:
+                    raise ValueError("Contradictory paths found: negative weights?")
+            elif candidate < distances[v]:
+                distances[v] = candidate
+                predecessors[v] = u
+                heapq.heappush(heap, (candidate, pushes, v))
+                pushes += 1
+
+    return order, distances, predecessors
+
+
+def bellman_ford(graph: CSRGraph, source: int) -> tuple[list[int], list[float], list[int]]:
+    """
+    Queue-based Bellman-Ford from a source (handles negative weights).
+
+    Args:
+        graph: Graph to search.
+        source: Source vertex id.
+
+    Returns:
+        Discovery order, distance of each vertex (inf if unreachable) and
+        predecessor of each vertex (-1 for none).
+
+    Raises:
+        ValueError: If a negative cycle is reachable from the source.
+    """
+    offsets, targets, weights = graph.adjacency()
+    n = graph.num_vertices
+    distances: list[float] = [float("inf")] * n
+    predecessors = [-1] * n
+    hops = [0] * n
+    queued = [False] * n
+    distances[source] = 0
+    order = [source]
+    queue = deque([source])
+    queued[source] = True
+
+    while queue:
+        u = queue.popleft()
+        queued[u] = False
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            candidate = distances[u] + weights[k]
+            if candidate < distances[v]:
+                if distances[v] == float("inf"):
+                    order.append(v)
+                distances[v] = candidate
+                predecessors[v] = u
+                # A shortest path never has more than V - 1 edges
+                hops[v] = hops[u] + 1
+                if hops[v] >= n:
+                    raise ValueError("Negative cycle detected")
+                if not queued[v]:
+                    queue.append(v)
+                    queued[v] = True
+
+    return order, distances, predecessors
+
+
+def topological_sort(graph: CSRGraph) -> list[int]:
+    """
+    Kahn's algorithm, emitting vertices generation by generation.
+
+    Matches networkx.topological_sort: vertices with no incoming edges
+    come first in vertex order, then each generation's children in the
+    order their last incoming edge was removed.
+
+    Args:
+        graph: Directed graph.
+
+    Returns:
+        Vertex ids in topological order.
+
+    Raises:
+        ValueError: If the graph has a cycle.
+    """
+    offsets, targets, _ = graph.adjacency()
+    indegree = np.bincount(graph.targets, minlength=graph.num_vertices).tolist()
+    generation = [v for v, d in enumerate(indegree) if d == 0]
+    order = []
+
+    while generation:
+        order.extend(generation)
+        next_generation = []
+        for u in generation:
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    next_generation.append(v)
+        generation = next_generation
+
+    if len(order) < graph.num_vertices:
+        raise ValueError("Graph contains a cycle, topological sort not possible")
+    return order
+
+
+def distance_matrix(graph: CSRGraph, dtype: type = np.float64) -> np.ndarray:
+    """
+    Dense matrix of direct edge weights.
+
+    Args:
+        graph: Graph to convert.
+        dtype: Floating point type of the matrix.
+
+    Returns:
+        V x V matrix holding each edge's weight, 0 on the diagonal (or a
+        negative self-loop's weight) and inf where there is no edge.
+    """
+    n = graph.num_vertices
+    matrix = np.full((n, n), np.inf, dtype=dtype)
+    np.fill_diagonal(matrix, 0)
+    sources = np.repeat(np.arange(n), np.diff(graph.offsets))
+    matrix[sources, graph.targets] = np.minimum(matrix[sources, graph.targets], graph.weights)
+    return matrix
+
+
+def floyd_warshall(graph: CSRGraph, dtype: type = np.float64, block_size: int = 64) -> np.ndarray:
+    """
+    All-pairs shortest paths over a dense NumPy matrix.
+
+    Each step k relaxes every pair through k at once, as
+    D = min(D, D[:, k, None] + D[None, k, :]). With blocking, the steps
+    of each block of k run over one strip of rows at a time, so the
+    strip stays in cache across the block instead of the whole matrix
+    streaming through memory on every step. Rows k of the block are
+    finished first, after which the other strips only read them.
+
+    Args:
+        graph: Graph to solve (negative cycles are not detected).
+        dtype: Floating point type of the matrix; np.float32 halves memory
+            and roughly doubles speed, but is only exact for integers up to 2**24.
+        block_size: Rows per strip and steps per block (0 for the plain
+            step-by-step loop).
+
+    Returns:
+        V x V matrix of shortest distances (inf where unreachable).
+    """
+    matrix = distance_matrix(graph, dtype)
+    n = len(matrix)
+    block_size = block_size or max(n, 1)
+    scratch = np.empty((min(block_size, n), n), dtype=dtype)
+
+    for start in range(0, n, block_size):
+        block = range(start, min(start + block_size, n))
+        strips = [start] + [s for s in range(0, n, block_size) if s != start]
+        for strip_start in strips:
+            strip = matrix[strip_start:strip_start + block_size]
+            through = scratch[:len(strip)]
+            for k in block:
+                np.add(strip[:, k, None], matrix[None, k, :], out=through)
+                np.minimum(strip, through, out=strip)
+
+    return matrix
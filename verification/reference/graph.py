@@ -1,14 +1,74 @@
 """
 Reference implementations for graph algorithms.
 
-Uses networkx as the trusted library for ground truth.
+BFS, DFS, Dijkstra, Bellman-Ford and topological sort run natively over
+a CSRGraph (see reference.csr), which builds in a fraction of the time
+and memory of a networkx graph. They break ties the same way networkx
+does, and the tests cross-check them against networkx when it is
+installed. Floyd-Warshall runs over a dense NumPy matrix; A* still uses
+networkx.
+
+batch_shortest_paths() runs BFS or Dijkstra from many sources over one
+graph, and packed_shortest_paths() solves many small graphs in a single
+multi-source pass, for generating large numbers of test cases cheaply.
 """
 
-from collections import deque
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from typing import Any, Callable
 
-import networkx as nx
+import numpy as np
+
+from . import csr
+from .csr import CSRGraph
+
+try:
+    import networkx as nx
+    NETWORKX_AVAILABLE = True
+except ImportError:
+    NETWORKX_AVAILABLE = False
+    nx = None
+
+
+class DistanceMatrix(Mapping):
+    """
+    Read-only dict-of-dicts view of a dense all-pairs distance matrix.
+
+    matrix[u][v] looks like the nested dicts validators compare against,
+    but a row is only converted when it is accessed.
+    """
+
+    def __init__(self, vertices: list[str], index: dict[str, int], matrix: np.ndarray, integral: bool = False):
+        """
+        Wrap a distance matrix.
+
+        Args:
+            vertices: Vertices exposed as rows and columns, in order.
+            index: Row/column of each vertex in matrix.
+            matrix: Dense distance matrix.
+            integral: Whether to report finite distances as ints (all weights were integers).
+        """
+        self.vertices = vertices
+        self.index = index
+        self.matrix = matrix
+        self.integral = integral
+        self._columns = np.array([index[v] for v in vertices], dtype=np.int64)
+
+    def __getitem__(self, u: str) -> dict[str, float]:
+        row = self.matrix[self.index[u], self._columns].tolist()
+        if self.integral:
+            row = [int(d) if d != float("inf") else d for d in row]
+        return dict(zip(self.vertices, row))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.vertices)
+
+    def __len__(self) -> int:
+        return len(self.vertices)
+
+    def to_dict(self) -> dict[str, dict[str, float]]:
+        """Materialize every row (e.g., for JSON serialization)."""
+        return {u: self[u] for u in self.vertices}
 
 
 @dataclass
@@ -27,9 +87,12 @@ class GraphResult:
     order: list[str] | None = None
     """Ordering (for topological sort)."""
 
-    distance_matrix: dict[str, dict[str, float]] | None = None
+    distance_matrix: Mapping[str, Mapping[str, float]] | None = None
     """All-pairs distances (for Floyd-Warshall)."""
 
+    distance_array: np.ndarray | None = None
+    """All-pairs distances as a dense matrix indexed like distance_matrix's vertices."""
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for comparison."""
         result = {}
@@ -40,7 +103,7 @@ class GraphResult:
         if self.order is not None:
             result["order"] = self.order
         if self.distance_matrix is not None:
-            result["distance_matrix"] = self.distance_matrix
+            result["distance_matrix"] = {u: dict(row) for u, row in self.distance_matrix.items()}
         return result
 
 
@@ -48,7 +111,7 @@ def build_graph(
     vertices: list[str],
     edges: list[tuple[str, str, float] | list],
     directed: bool = True,
-) -> nx.DiGraph | nx.Graph:
+) -> "nx.DiGraph | nx.Graph":
     """
     Build a networkx graph from vertices and edges.
 
@@ -59,7 +122,13 @@ def build_graph(
 
     Returns:
         networkx graph object.
+
+    Raises:
+        ImportError: If networkx is not installed.
     """
+    if not NETWORKX_AVAILABLE:
+        raise ImportError("networkx package not installed (pip install networkx)")
+
     G = nx.DiGraph() if directed else nx.Graph()
     G.add_nodes_from(vertices)
 
@@ -74,6 +143,41 @@ def build_graph(
     return G
 
 
+def _search_result(
+    names: list,
+    vertices: list[str],
+    order: list[int],
+    dist: list[float],
+    pred: list[int],
+    target_id: int | None = None,
+) -> GraphResult:
+    """
+    Convert a single-source search over a CSR graph to a GraphResult.
+
+    Args:
+        names: Name of each vertex id.
+        vertices: Listed vertices (reported at infinity if not reached).
+        order: Ids of the vertices reached, in visit/settle order.
+        dist: Distance of each vertex id.
+        pred: Predecessor of each vertex id (-1 for none).
+        target_id: Id of the target vertex (optional).
+
+    Returns:
+        GraphResult with distances, predecessors and the path to target if reached.
+    """
+    # Reached vertices in search order, then unreachable ones at infinity
+    distances = {names[v]: dist[v] for v in order}
+    predecessors = {names[v]: names[pred[v]] if pred[v] != -1 else None for v in order}
+    for v in vertices:
+        distances.setdefault(v, float("inf"))
+
+    path = None
+    if target_id is not None and dist[target_id] != float("inf"):
+        path = [names[v] for v in csr.path_to(pred, target_id)]
+
+    return GraphResult(distances=distances, path=path, predecessors=predecessors)
+
+
 def bfs(
     vertices: list[str],
     edges: list[tuple[str, str, float] | list],
@@ -94,41 +198,10 @@ def bfs(
     Returns:
         GraphResult with distances and optional path.
     """
-    G = build_graph(vertices, edges, directed)
-
-    # BFS for shortest paths
-    distances = {source: 0}
-    predecessors = {source: None}
-    queue = deque([source])
-
-    while queue:
-        u = queue.popleft()
-        for v in G.neighbors(u):
-            if v not in distances:
-                distances[v] = distances[u] + 1
-                predecessors[v] = u
-                queue.append(v)
-
-    # Build path to target if specified
-    path = None
-    if target is not None and target in distances:
-        path = []
-        current = target
-        while current is not None:
-            path.append(current)
-            current = predecessors[current]
-        path.reverse()
-
-    # Set unreachable vertices to infinity
-    for v in vertices:
-        if v not in distances:
-            distances[v] = float("inf")
-
-    return GraphResult(
-        distances=distances,
-        path=path,
-        predecessors=predecessors,
-    )
+    graph = CSRGraph.from_edges(vertices, edges, directed)
+    order, dist, pred = csr.bfs(graph, graph.id(source))
+    target_id = graph.index.get(target) if target is not None else None
+    return _search_result(graph.vertices, vertices, order, dist, pred, target_id)
 
 
 def dfs(
@@ -153,32 +226,15 @@ def dfs(
     Returns:
         GraphResult with path if found.
     """
-    G = build_graph(vertices, edges, directed)
-
-    visited = set()
-    predecessors = {source: None}
-
-    def dfs_recursive(u: str) -> bool:
-        visited.add(u)
-        if target is not None and u == target:
-            return True
-        for v in G.neighbors(u):
-            if v not in visited:
-                predecessors[v] = u
-                if dfs_recursive(v):
-                    return True
-        return False
-
-    found = dfs_recursive(source)
+    graph = CSRGraph.from_edges(vertices, edges, directed)
+    target_id = graph.id(target) if target is not None and target in graph.index else None
+    order, pred, found = csr.dfs(graph, graph.id(source), target_id)
+    names = graph.vertices
+    predecessors = {names[v]: names[pred[v]] if pred[v] != -1 else None for v in order}
 
     path = None
-    if target is not None and found:
-        path = []
-        current = target
-        while current is not None:
-            path.append(current)
-            current = predecessors.get(current)
-        path.reverse()
+    if target_id is not None and found:
+        path = [names[v] for v in csr.path_to(pred, target_id)]
 
     return GraphResult(
         path=path,
@@ -192,50 +248,143 @@ def dijkstra(
     source: str,
     target: str | None = None,
     directed: bool = True,
+    path_only: bool = False,
 ) -> GraphResult:
     """
     Dijkstra's algorithm for shortest paths with non-negative weights.
 
+    Distances, predecessors and the path to target all come from a
+    single run.
+
     Args:
         vertices: List of vertex names.
         edges: List of (source, target, weight) edges.
         source: Source vertex.
         target: Target vertex (optional).
         directed: Whether the graph is directed.
+        path_only: Stop as soon as target is settled. Only the path and
+            the predecessors of the vertices settled so far are returned.
 
     Returns:
-        GraphResult with distances and optional path.
+        GraphResult with distances, predecessors and optional path.
     """
-    G = build_graph(vertices, edges, directed)
+    graph = CSRGraph.from_edges(vertices, edges, directed)
+    target_id = graph.index.get(target) if target is not None else None
+    stop_at = target_id if path_only else None
+    order, dist, pred = csr.dijkstra(graph, graph.id(source), stop_at)
 
-    # Use networkx implementation
-    if target is not None:
-        try:
-            path = nx.dijkstra_path(G, source, target, weight="weight")
-            length = nx.dijkstra_path_length(G, source, target, weight="weight")
-            distances = dict(nx.single_source_dijkstra_path_length(G, source, weight="weight"))
-
-            # Set unreachable to infinity
-            for v in vertices:
-                if v not in distances:
-                    distances[v] = float("inf")
-
-            return GraphResult(
-                distances=distances,
-                path=path,
-            )
-        except nx.NetworkXNoPath:
-            distances = dict(nx.single_source_dijkstra_path_length(G, source, weight="weight"))
-            for v in vertices:
-                if v not in distances:
-                    distances[v] = float("inf")
-            return GraphResult(distances=distances, path=None)
-    else:
-        distances = dict(nx.single_source_dijkstra_path_length(G, source, weight="weight"))
-        for v in vertices:
-            if v not in distances:
-                distances[v] = float("inf")
-        return GraphResult(distances=distances)
+    result = _search_result(graph.vertices, vertices, order, dist, pred, target_id)
+    if path_only:
+        result.distances = None
+    return result
+
+
+# Searches available to the batched APIs
+_SEARCHES = {
+    "bfs": csr.multi_source_bfs,
+    "dijkstra": csr.multi_source_dijkstra,
+}
+
+
+def _get_search(algorithm: str) -> Callable:
+    if algorithm not in _SEARCHES:
+        raise ValueError(f"Unknown algorithm for batched search: {algorithm} (use {', '.join(_SEARCHES)})")
+    return _SEARCHES[algorithm]
+
+
+def batch_shortest_paths(
+    vertices: list[str],
+    edges: list[tuple[str, str, float] | list],
+    sources: list[str],
+    targets: list[str | None] | None = None,
+    directed: bool = True,
+    algorithm: str = "dijkstra",
+) -> list[GraphResult]:
+    """
+    Shortest paths from many sources over one graph.
+
+    The graph is built once and every search shares its adjacency lists,
+    instead of rebuilding the graph for each source.
+
+    Args:
+        vertices: List of vertex names.
+        edges: List of (source, target, weight) edges.
+        sources: Source vertices.
+        targets: Target vertex of each source (optional; entries may be None).
+        directed: Whether the graph is directed.
+        algorithm: 'dijkstra' or 'bfs' (weights ignored).
+
+    Returns:
+        One GraphResult per source, identical to calling dijkstra() or bfs()
+        with that source and target.
+
+    Raises:
+        ValueError: If the algorithm is unknown or a source is not in the graph.
+    """
+    search = _get_search(algorithm)
+    graph = CSRGraph.from_edges(vertices, edges, directed)
+    targets = targets or [None] * len(sources)
+
+    results = []
+    for source, target in zip(sources, targets):
+        order, dist, pred = search(graph, [graph.id(source)])
+        target_id = graph.index.get(target) if target is not None else None
+        results.append(_search_result(graph.vertices, vertices, order, dist, pred, target_id))
+    return results
+
+
+def packed_shortest_paths(
+    graphs: list[dict[str, Any]],
+    directed: bool = True,
+    algorithm: str = "dijkstra",
+) -> list[GraphResult]:
+    """
+    Shortest paths over many small graphs in one pass.
+
+    The graphs are packed side by side into one CSR graph (vertex names
+    are tagged with their graph's position) and searched together from
+    all their sources at once. The graphs are disjoint, so each one's
+    results are exactly those of a separate search; packing just pays the
+    graph construction and search setup once instead of once per graph.
+
+    Args:
+        graphs: Graphs as dicts with 'vertices', 'edges', 'source' and
+            optionally 'target' (the shape of a test case input).
+        directed: Whether the graphs are directed.
+        algorithm: 'dijkstra' or 'bfs' (weights ignored).
+
+    Returns:
+        One GraphResult per graph, identical to calling dijkstra() or bfs()
+        on it.
+
+    Raises:
+        ValueError: If the algorithm is unknown or a source is not in its graph.
+    """
+    search = _get_search(algorithm)
+    return _packed_search(graphs, directed, search)
+
+
+def _packed_search(graphs: list[dict[str, Any]], directed: bool, search: Callable) -> list[GraphResult]:
+    """Pack graphs into one CSR graph, search it once and split the results by graph."""
+    graph = CSRGraph.from_edges(
+        [(g, v) for g, spec in enumerate(graphs) for v in spec["vertices"]],
+        [((g, edge[0]), (g, edge[1]), *edge[2:]) for g, spec in enumerate(graphs) for edge in spec["edges"]],
+        directed,
+    )
+    order, dist, pred = search(graph, [graph.id((g, spec["source"])) for g, spec in enumerate(graphs)])
+
+    # Split the combined search order by graph
+    orders: list[list[int]] = [[] for _ in graphs]
+    for v in order:
+        orders[graph.vertices[v][0]].append(v)
+
+    names = [name for _, name in graph.vertices]
+    results = []
+    for g, spec in enumerate(graphs):
+        target = spec.get("target")
+        target_id = graph.index.get((g, target)) if target is not None else None
+        results.append(_search_result(names, spec["vertices"], orders[g], dist, pred, target_id))
+    return results
 
 
 def astar(
@@ -305,32 +454,31 @@ def bellman_ford(
     Raises:
         ValueError: If a negative cycle is detected.
     """
-    G = build_graph(vertices, edges, directed)
-
-    try:
-        distances, predecessors = nx.single_source_bellman_ford(G, source, weight="weight")
+    graph = CSRGraph.from_edges(vertices, edges, directed)
+    order, dist, pred = csr.bellman_ford(graph, graph.id(source))
+    names = graph.vertices
 
-        # Convert predecessors to simple dict
-        pred_dict = {v: predecessors.get(v, [None])[-1] if predecessors.get(v) else None
-                     for v in vertices}
+    distances = {names[v]: dist[v] for v in order}
+    for v in vertices:
+        distances.setdefault(v, float("inf"))
 
-        # Set unreachable to infinity
-        for v in vertices:
-            if v not in distances:
-                distances[v] = float("inf")
+    predecessors = {}
+    for v in vertices:
+        u = pred[graph.index[v]]
+        predecessors[v] = names[u] if u != -1 else None
 
-        return GraphResult(
-            distances=dict(distances),
-            predecessors=pred_dict,
-        )
-    except nx.NetworkXUnbounded:
-        raise ValueError("Negative cycle detected")
+    return GraphResult(
+        distances=distances,
+        predecessors=predecessors,
+    )
 
 
 def floyd_warshall(
     vertices: list[str],
     edges: list[tuple[str, str, float] | list],
     directed: bool = True,
+    dtype: type = np.float64,
+    block_size: int = 64,
 ) -> GraphResult:
     """
     Floyd-Warshall algorithm for all-pairs shortest paths.
@@ -339,26 +487,29 @@ def floyd_warshall(
         vertices: List of vertex names.
         edges: List of (source, target, weight) edges.
         directed: Whether the graph is directed.
+        dtype: Matrix element type (np.float32 halves memory; exact for
+            integer distances up to 2**24).
+        block_size: Rows processed together per block of steps (0 disables blocking).
 
     Returns:
-        GraphResult with distance matrix.
+        GraphResult with the distance matrix as a lazy dict view and as a
+        dense array.
     """
-    G = build_graph(vertices, edges, directed)
-
-    # Use networkx implementation
-    distances = dict(nx.floyd_warshall(G, weight="weight"))
+    graph = CSRGraph.from_edges(vertices, edges, directed)
+    matrix = csr.floyd_warshall(graph, dtype, block_size)
+    vertices = list(dict.fromkeys(vertices))
+    integral = graph.weights.dtype.kind == "i"
 
-    # Convert to nested dict with string keys
-    distance_matrix = {}
-    for u in vertices:
-        distance_matrix[u] = {}
-        for v in vertices:
-            if u in distances and v in distances[u]:
-                distance_matrix[u][v] = distances[u][v]
-            else:
-                distance_matrix[u][v] = float("inf") if u != v else 0
+    # Restrict the array to the listed vertices (edge-only vertices are still used as intermediates)
+    rows = np.array([graph.index[v] for v in vertices], dtype=np.int64)
+    if len(rows) != graph.num_vertices:
+        matrix = matrix[np.ix_(rows, rows)]
+    index = {v: i for i, v in enumerate(vertices)}
 
-    return GraphResult(distance_matrix=distance_matrix)
+    return GraphResult(
+        distance_matrix=DistanceMatrix(vertices, index, matrix, integral),
+        distance_array=matrix,
+    )
 
 
 def topological_sort(
@@ -378,13 +529,9 @@ def topological_sort(
     Raises:
         ValueError: If graph has a cycle.
     """
-    G = build_graph(vertices, edges, directed=True)
-
-    try:
-        order = list(nx.topological_sort(G))
-        return GraphResult(order=order)
-    except nx.NetworkXUnfeasible:
-        raise ValueError("Graph contains a cycle, topological sort not possible")
+    graph = CSRGraph.from_edges(vertices, edges, directed=True)
+    order = csr.topological_sort(graph)
+    return GraphResult(order=[graph.vertices[v] for v in order])
 
 
 # Convenience function to run any graph algorithm
@@ -435,7 +582,9 @@ def run_graph_algorithm(
         return func(vertices, edges)
     elif algorithm == "astar":
         return func(vertices, edges, source, target, kwargs.get("heuristic"), directed)
-    elif algorithm in ("bfs", "dfs", "dijkstra"):
+    elif algorithm == "dijkstra":
+        return func(vertices, edges, source, target, directed, kwargs.get("path_only", False))
+    elif algorithm in ("bfs", "dfs"):
         return func(vertices, edges, source, target, directed)
     elif algorithm == "bellman_ford":
         return func(vertices, edges, source, directed)
@@ -5,6 +5,7 @@ This module provides automatic discovery of test generators and validators
 for each scaffold, enabling fully automated verification.
 """
 
+import logging
 from typing import Any
 
 from .generators.base import TestCaseGenerator, TestCase, TestSuite
@@ -13,6 +14,8 @@ from .validators.exact_match import ExactMatchValidator, DictMatchValidator, Pat
 from .validators.numeric_tolerance import NumericToleranceValidator, RootValidator, OptimizationValidator
 from .validators.set_equivalence import SetEquivalenceValidator, EdgeSetValidator, MSTValidator
 
+logger = logging.getLogger(__name__)
+
 
 # Registry of all scaffolds organized by category
 SCAFFOLD_REGISTRY = {
@@ -171,28 +174,57 @@ class UniversalGenerator(TestCaseGenerator):
         """Generate test cases for a tier using the appropriate reference."""
         cases = []
 
-        # Get generator function based on category
-        generator_func = self._get_generator_func()
-        if generator_func is None:
-            return cases
-
-        for i in range(count):
+        # Graph searches generate every input first, then solve them all in one pass
+        generated = None
+        batch_func = self._get_batch_generator_func()
+        if batch_func is not None:
             try:
-                test_input, expected = generator_func(tier, i)
-                cases.append(TestCase(
-                    id=self._make_id(tier, i + 1),
-                    scaffold=self.scaffold_name,
-                    tier=tier,
-                    input=test_input,
-                    expected=expected,
-                    description=f"{tier.capitalize()} case {i + 1} for {self.scaffold_name}",
-                ))
+                generated = batch_func(tier, count)
             except Exception as e:
-                # Skip cases that fail to generate
-                pass
+                logger.warning(
+                    f"Batch generation of {tier} cases for {self.scaffold_name} failed ({e}); "
+                    "generating them one at a time"
+                )
+
+        if generated is None:
+            # Get generator function based on category
+            generator_func = self._get_generator_func()
+            if generator_func is None:
+                return cases
+
+            generated = []
+            for i in range(count):
+                try:
+                    generated.append(generator_func(tier, i))
+                except Exception:
+                    # Skip cases that fail to generate
+                    generated.append(None)
+
+        for i, case in enumerate(generated):
+            if case is None:
+                continue
+            test_input, expected = case
+            cases.append(TestCase(
+                id=self._make_id(tier, i + 1),
+                scaffold=self.scaffold_name,
+                tier=tier,
+                input=test_input,
+                expected=expected,
+                description=f"{tier.capitalize()} case {i + 1} for {self.scaffold_name}",
+            ))
 
         return cases
 
+    def _get_batch_generator_func(self):
+        """Get the generator for scaffolds whose cases are generated a whole tier at a time."""
+        generators = {
+            "dijkstra": self._gen_dijkstra_batch,
+            "bfs": self._gen_bfs_batch,
+            "dfs": self._gen_bfs_batch,
+            "bellman_ford": self._gen_dijkstra_batch,
+        }
+        return generators.get(self.scaffold_name)
+
     def _get_generator_func(self):
         """Get the appropriate test case generator function."""
         generators = {
@@ -246,64 +278,78 @@ class UniversalGenerator(TestCaseGenerator):
 
     def _gen_dijkstra(self, tier: str, idx: int) -> tuple[dict, dict]:
         """Generate Dijkstra test case."""
+        return self._gen_dijkstra_batch(tier, 1)[0]
+
+    def _gen_dijkstra_batch(self, tier: str, count: int) -> list[tuple[dict, dict]]:
+        """Generate Dijkstra test cases, solving all of them in one packed pass."""
         import random
-        from .reference.graph import dijkstra
+        from .reference.graph import packed_shortest_paths
+
+        inputs = []
+        for _ in range(count):
+            if tier == "simple":
+                n = 4
+            elif tier == "standard":
+                n = random.randint(5, 8)
+            else:
+                n = random.choice([1, 2, 10])  # Edge cases
 
-        if tier == "simple":
-            n = 4
-        elif tier == "standard":
-            n = random.randint(5, 8)
-        else:
-            n = random.choice([1, 2, 10])  # Edge cases
+            vertices = [chr(65 + i) for i in range(n)]  # A, B, C, ...
+            edges = []
 
-        vertices = [chr(65 + i) for i in range(n)]  # A, B, C, ...
-        edges = []
+            # Create connected graph
+            for i in range(n - 1):
+                edges.append([vertices[i], vertices[i + 1], random.randint(1, 10)])
 
-        # Create connected graph
-        for i in range(n - 1):
-            edges.append([vertices[i], vertices[i + 1], random.randint(1, 10)])
+            # Add random edges
+            for _ in range(n // 2):
+                u, v = random.sample(vertices, 2)
+                edges.append([u, v, random.randint(1, 10)])
 
-        # Add random edges
-        for _ in range(n // 2):
-            u, v = random.sample(vertices, 2)
-            edges.append([u, v, random.randint(1, 10)])
+            inputs.append({"vertices": vertices, "edges": edges, "source": vertices[0]})
 
-        result = dijkstra(vertices, edges, vertices[0])
-
-        return (
-            {"vertices": vertices, "edges": edges, "source": vertices[0]},
-            {"distances": result.distances}
-        )
+        results = packed_shortest_paths(inputs, algorithm="dijkstra")
+        return [
+            (test_input, {"distances": result.distances})
+            for test_input, result in zip(inputs, results)
+        ]
 
     def _gen_bfs(self, tier: str, idx: int) -> tuple[dict, dict]:
         """Generate BFS test case."""
-        import random
-        from .reference.graph import bfs
+        return self._gen_bfs_batch(tier, 1)[0]
 
-        if tier == "simple":
-            n = 4
-        elif tier == "standard":
-            n = random.randint(5, 8)
-        else:
-            n = random.choice([1, 2])
+    def _gen_bfs_batch(self, tier: str, count: int) -> list[tuple[dict, dict]]:
+        """Generate BFS test cases, solving all of them in one packed pass."""
+        import random
+        from .reference.graph import packed_shortest_paths
+
+        inputs = []
+        for _ in range(count):
+            if tier == "simple":
+                n = 4
+            elif tier == "standard":
+                n = random.randint(5, 8)
+            else:
+                n = random.choice([1, 2])
 
-        vertices = [chr(65 + i) for i in range(n)]
-        edges = []
+            vertices = [chr(65 + i) for i in range(n)]
+            edges = []
 
-        for i in range(n - 1):
-            edges.append([vertices[i], vertices[i + 1], 1])
+            for i in range(n - 1):
+                edges.append([vertices[i], vertices[i + 1], 1])
 
-        for _ in range(n // 2):
-            u, v = random.sample(vertices, 2)
-            edges.append([u, v, 1])
+            for _ in range(n // 2):
+                u, v = random.sample(vertices, 2)
+                edges.append([u, v, 1])
 
-        target = vertices[-1] if n > 1 else vertices[0]
-        result = bfs(vertices, edges, vertices[0], target)
+            target = vertices[-1] if n > 1 else vertices[0]
+            inputs.append({"vertices": vertices, "edges": edges, "source": vertices[0], "target": target})
 
-        return (
-            {"vertices": vertices, "edges": edges, "source": vertices[0], "target": target},
-            {"path": result.path, "distances": result.distances}
-        )
+        results = packed_shortest_paths(inputs, algorithm="bfs")
+        return [
+            (test_input, {"path": result.path, "distances": result.distances})
+            for test_input, result in zip(inputs, results)
+        ]
 
     def _gen_floyd_warshall(self, tier: str, idx: int) -> tuple[dict, dict]:
         """Generate Floyd-Warshall test case."""
@@ -323,7 +369,7 @@ class UniversalGenerator(TestCaseGenerator):
 
         return (
             {"vertices": vertices, "edges": edges},
-            {"distance_matrix": result.distance_matrix}
+            {"distance_matrix": result.to_dict()["distance_matrix"]}
         )
 
     def _gen_topological(self, tier: str, idx: int) -> tuple[dict, dict]:
@@ -10,7 +10,7 @@ from typing import Any
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-from ..runner import ScaffoldResults
+from ..runner import LATENCY_STAGES, ScaffoldResults
 
 
 class ReportGenerator:
@@ -110,6 +110,57 @@ class ReportGenerator:
             total_passed=total_passed,
             overall_pass_rate=overall_pass_rate * 100,
             scaffolds=sorted(all_results, key=lambda r: -r.pass_rate),
+            latency=[(r.scaffold, r.latency_percentiles()) for r in all_results if r.latency_percentiles()],
+            latency_stages=LATENCY_STAGES,
+            generated_at=datetime.now().isoformat(),
+        )
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(report, encoding="utf-8")
+
+        return output_path
+
+    def generate_model_comparison(
+        self,
+        all_results: list[ScaffoldResults],
+        output_path: Path,
+    ) -> Path:
+        """
+        Generate a side-by-side comparison of several models.
+
+        Args:
+            all_results: Scaffold results for every (scaffold, model) pair.
+            output_path: Path to write report.
+
+        Returns:
+            Path to generated report.
+        """
+        template = self.env.get_template("model_comparison.md.j2")
+
+        models = list(dict.fromkeys(r.model for r in all_results))
+        matrix: dict[str, dict[str, ScaffoldResults]] = {}
+        for r in sorted(all_results, key=lambda r: r.scaffold):
+            matrix.setdefault(r.scaffold, {})[r.model] = r
+
+        model_stats = []
+        for model in models:
+            results = [r for r in all_results if r.model == model]
+            total = sum(r.total_tests for r in results)
+            passed = sum(r.passed_tests for r in results)
+            model_stats.append({
+                "model": model,
+                "scaffolds": len(results),
+                "certified": sum(1 for r in results if r.pass_rate >= 0.9),
+                "total": total,
+                "passed": passed,
+                "pass_rate": passed / total * 100 if total > 0 else 0,
+                "tokens": sum(r.total_tokens for r in results),
+            })
+
+        report = template.render(
+            models=models,
+            model_stats=model_stats,
+            matrix=matrix,
             generated_at=datetime.now().isoformat(),
         )
 
@@ -185,7 +236,19 @@ Generated with [Claude Code](https://claude.com/claude-code) on {{ generated_at
 {% for scaffold in scaffolds %}
 | {{ scaffold.scaffold }} | {{ "%.1f"|format(scaffold.pass_rate * 100) }}% | {% if scaffold.pass_rate >= 0.9 %}CERTIFIED{% elif scaffold.pass_rate >= 0.5 %}PARTIAL{% else %}FAILED{% endif %} |
 {% endfor %}
+{% if latency %}
+## Latency
+
+Time per test case in milliseconds (p50 / p95 / p99). Queue is time spent waiting
+for a concurrency slot, the rate limiter and retry backoff; Request is time inside
+API calls (0 for cached responses).
 
+| Scaffold | Queue | Prompt | Request | First Token | Parse | Validate | Total |
+|----------|-------|--------|---------|-------------|-------|----------|-------|
+{% for scaffold, stages in latency -%}
+| {{ scaffold }} |{% for stage in latency_stages %} {{ "%.1f / %.1f / %.1f"|format(stages[stage].p50, stages[stage].p95, stages[stage].p99) }} |{% endfor %}
+{% endfor %}
+{% endif %}
 ## Methodology
 
 Tests were conducted using:
@@ -205,10 +268,36 @@ Tests were conducted using:
 ---
 
 Generated with [Claude Code](https://claude.com/claude-code) on {{ generated_at }}
+"""
+
+    comparison_template = """# Model Comparison Report
+
+- **Date:** {{ generated_at[:10] }}
+- **Models:** {{ models|join(", ") }}
+- **Scaffolds:** {{ matrix|length }}
+
+## Overall
+
+| Model | Passed | Pass Rate | Certified | Total Tokens |
+|-------|--------|-----------|-----------|--------------|
+{% for m in model_stats -%}
+| {{ m.model }} | {{ m.passed }}/{{ m.total }} | {{ "%.1f"|format(m.pass_rate) }}% | {{ m.certified }}/{{ m.scaffolds }} | {{ m.tokens }} |
+{% endfor %}
+## Pass Rate by Scaffold
+
+| Scaffold |{% for model in models %} {{ model }} |{% endfor %}
+|----------|{% for model in models %}------|{% endfor %}
+{% for scaffold, row in matrix.items() -%}
+| {{ scaffold }} |{% for model in models %} {% if model in row %}{{ "%.1f"|format(row[model].pass_rate * 100) }}%{% else %}-{% endif %} |{% endfor %}
+{% endfor %}
+---
+
+Generated on {{ generated_at }}
 """
 
     (templates_dir / "scaffold_report.md.j2").write_text(scaffold_template, encoding="utf-8")
     (templates_dir / "summary.md.j2").write_text(summary_template, encoding="utf-8")
+    (templates_dir / "model_comparison.md.j2").write_text(comparison_template, encoding="utf-8")
 
 
 def get_report_generator() -> ReportGenerator:
@@ -5,24 +5,105 @@ Orchestrates LLM calls, validation, and result collection.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
 from .config import get_settings
 from .generators.base import TestCase, TestSuite
-from .llm.base import LLMRequest, LLMResponse
-from .llm.claude import ClaudeProvider
+from .llm.base import (
+    AuthenticationError,
+    InvalidRequestError,
+    LLMError,
+    LLMProvider,
+    LLMRequest,
+    LLMResponse,
+    RateLimitError,
+)
+from .llm.batch import BatchBackend
+from .llm.cache import ResponseCache
+from .llm.cost import BATCH_DISCOUNT, BudgetExceededError, CostTracker, get_pricing
 from .llm.prompt_builder import PromptBuilder, ScaffoldParser
-from .llm.response_parser import ParsedAnswer, ResponseParser
+from .llm.providers import get_provider
+from .llm.rate_limit import RateLimiter, estimate_tokens, get_rate_limiter
+from .llm.response_parser import IncrementalResponseParser, ParsedAnswer, ResponseParser
+from .tracing import get_tracer
 from .validators.base import ValidationResult
 
+if TYPE_CHECKING:
+    from .journal import RunJournal
+
 logger = logging.getLogger(__name__)
 
 
+# Per-stage latencies aggregated in ScaffoldResults.latency_percentiles(), in pipeline order
+LATENCY_STAGES = ["queue_ms", "prompt_ms", "request_ms", "first_token_ms", "parse_ms", "validate_ms", "total_ms"]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Compute a percentile by linear interpolation between closest ranks.
+
+    Args:
+        values: Sample values.
+        pct: Percentile to compute (0-100).
+
+    Returns:
+        The percentile, or 0.0 for an empty sample.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+@dataclass
+class StageTimings:
+    """Where the time of a single test case went, in milliseconds."""
+
+    queue_ms: float = 0.0
+    """Waiting for a concurrency slot, the rate limiter and retry backoff."""
+
+    prompt_ms: float = 0.0
+    """Building the prompt from the scaffold and test input."""
+
+    request_ms: float = 0.0
+    """Inside LLM API calls, summed over retries (0 for cached responses)."""
+
+    first_token_ms: float = 0.0
+    """Time to first token of a streamed response (0 when not streamed)."""
+
+    parse_ms: float = 0.0
+    """Parsing the final answer out of the response."""
+
+    validate_ms: float = 0.0
+    """Checking the parsed answer against the expected value."""
+
+    def to_dict(self) -> dict[str, float]:
+        """Convert to dictionary for serialization."""
+        return {
+            "queue_ms": self.queue_ms,
+            "prompt_ms": self.prompt_ms,
+            "request_ms": self.request_ms,
+            "first_token_ms": self.first_token_ms,
+            "parse_ms": self.parse_ms,
+            "validate_ms": self.validate_ms,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, float]) -> "StageTimings":
+        """Create from dictionary."""
+        return cls(**{name: data.get(name, 0.0) for name in cls().to_dict()})
+
+
 @dataclass
 class TestResult:
     """Result of running a single test case."""
@@ -45,6 +126,9 @@ class TestResult:
     duration_ms: float = 0.0
     """Time taken for this test."""
 
+    timings: StageTimings | None = None
+    """Per-stage breakdown of duration_ms (None for results saved before timings were recorded)."""
+
     @property
     def passed(self) -> bool:
         """Check if test passed."""
@@ -61,13 +145,64 @@ class TestResult:
             "passed": self.passed,
             "error": self.error,
             "duration_ms": self.duration_ms,
+            "latency_ms": self.llm_response.latency_ms if self.llm_response else 0.0,
+            "timings": self.timings.to_dict() if self.timings else None,
+            "cached": self.llm_response.cached if self.llm_response else False,
+            "time_to_first_token_ms": self.llm_response.time_to_first_token_ms if self.llm_response else 0.0,
+            "time_to_answer_ms": self.llm_response.time_to_answer_ms if self.llm_response else 0.0,
+            "stopped_early": self.llm_response.stopped_early if self.llm_response else False,
             "validation": self.validation_result.to_dict() if self.validation_result else None,
             "llm_tokens": {
                 "input": self.llm_response.input_tokens if self.llm_response else 0,
                 "output": self.llm_response.output_tokens if self.llm_response else 0,
+                "cache_creation": self.llm_response.cache_creation_input_tokens if self.llm_response else 0,
+                "cache_read": self.llm_response.cache_read_input_tokens if self.llm_response else 0,
             },
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], test_case: TestCase, model: str = "") -> "TestResult":
+        """
+        Rebuild a result from its serialized form.
+
+        The LLM response text is not serialized, so the rebuilt result only
+        carries the response's token usage.
+
+        Args:
+            data: Dictionary produced by to_dict().
+            test_case: The test case the result belongs to.
+            model: Model that produced the result.
+
+        Returns:
+            TestResult with validation outcome, error and token usage.
+        """
+        validation = data.get("validation")
+        tokens = data.get("llm_tokens") or {}
+        llm_response = None
+        if any(tokens.values()):
+            llm_response = LLMResponse(
+                content="",
+                model=model,
+                input_tokens=tokens.get("input", 0),
+                output_tokens=tokens.get("output", 0),
+                latency_ms=data.get("latency_ms", 0.0),
+                cache_creation_input_tokens=tokens.get("cache_creation", 0),
+                cache_read_input_tokens=tokens.get("cache_read", 0),
+                cached=data.get("cached", False),
+                time_to_first_token_ms=data.get("time_to_first_token_ms", 0.0),
+                time_to_answer_ms=data.get("time_to_answer_ms", 0.0),
+                stopped_early=data.get("stopped_early", False),
+            )
+
+        return cls(
+            test_case=test_case,
+            llm_response=llm_response,
+            validation_result=ValidationResult.from_dict(validation) if validation else None,
+            error=data.get("error"),
+            duration_ms=data.get("duration_ms", 0.0),
+            timings=StageTimings.from_dict(data["timings"]) if data.get("timings") else None,
+        )
+
 
 @dataclass
 class ScaffoldResults:
@@ -88,6 +223,9 @@ class ScaffoldResults:
     completed_at: datetime | None = None
     """When testing completed."""
 
+    fingerprint: str = ""
+    """Hash of everything that determines the results (see VerificationRunner.fingerprint)."""
+
     @property
     def total_tests(self) -> int:
         return len(self.test_results)
@@ -109,6 +247,44 @@ class ScaffoldResults:
             for r in self.test_results
         )
 
+    @property
+    def total_cost(self) -> float:
+        """Cost in USD of the responses not served from the response cache, at list price."""
+        pricing = get_pricing(self.model)
+        if pricing is None:
+            return 0.0
+        return sum(
+            pricing.cost(r.llm_response)
+            for r in self.test_results
+            if r.llm_response and not r.llm_response.cached
+        )
+
+    def latency_percentiles(self) -> dict[str, dict[str, float]]:
+        """
+        Aggregate per-stage latencies across test cases.
+
+        Only test cases that ran without error and recorded timings count,
+        so cached results from older runs do not skew the figures.
+
+        Returns:
+            Mapping of each stage in LATENCY_STAGES to its p50, p95 and p99
+            in milliseconds (empty if no test case recorded timings).
+        """
+        timed = [r for r in self.test_results if r.timings is not None and r.error is None]
+        if not timed:
+            return {}
+
+        samples = {stage: [] for stage in LATENCY_STAGES}
+        for result in timed:
+            for stage, value in result.timings.to_dict().items():
+                samples[stage].append(value)
+            samples["total_ms"].append(result.duration_ms)
+
+        return {
+            stage: {f"p{pct}": percentile(values, pct) for pct in (50, 95, 99)}
+            for stage, values in samples.items()
+        }
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -119,39 +295,230 @@ class ScaffoldResults:
                 "passed_tests": self.passed_tests,
                 "pass_rate": self.pass_rate,
                 "total_tokens": self.total_tokens,
+                "cost_usd": self.total_cost,
+                "latency_ms": self.latency_percentiles(),
             },
             "started_at": self.started_at.isoformat(),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "fingerprint": self.fingerprint,
             "results": [r.to_dict() for r in self.test_results],
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScaffoldResults":
+        """
+        Rebuild results from their serialized form.
+
+        Test inputs are not serialized, so the rebuilt test cases carry
+        only their ID, tier and expected value.
+
+        Args:
+            data: Dictionary produced by to_dict().
+
+        Returns:
+            ScaffoldResults with one TestResult per serialized result.
+        """
+        results = cls(
+            scaffold=data["scaffold"],
+            model=data["model"],
+            started_at=datetime.fromisoformat(data.get("started_at", datetime.now().isoformat())),
+            completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
+            fingerprint=data.get("fingerprint", ""),
+        )
+
+        for r in data.get("results", []):
+            # Determine tier from test case ID (e.g., "bfs_simple_01" -> "simple")
+            test_id = r.get("test_case_id", "unknown")
+            tier = "standard"
+            for t in ["simple", "standard", "edge"]:
+                if f"_{t}_" in test_id:
+                    tier = t
+                    break
+
+            test_case = TestCase(
+                id=test_id,
+                scaffold=data["scaffold"],
+                tier=tier,
+                input={},
+                expected=(r.get("validation") or {}).get("expected", {}),
+                description=f"Test case {test_id}",
+            )
+            results.test_results.append(TestResult.from_dict(r, test_case, data["model"]))
+
+        return results
+
+
+@dataclass
+class ScaffoldJob:
+    """A scaffold test suite queued for verification."""
+
+    scaffold: str
+    """Scaffold name."""
+
+    test_suite: TestSuite
+    """Test suite to run."""
+
+    validator: Any
+    """Validator for checking results."""
+
+    model: str = ""
+    """Model to run against (empty for the provider's default model)."""
+
 
 class VerificationRunner:
     """Runs verification tests for scaffolds."""
 
     def __init__(
         self,
-        llm_provider: ClaudeProvider | None = None,
+        llm_provider: LLMProvider | None = None,
         scaffolds_dir: Path | None = None,
+        max_concurrency: int | None = None,
+        cache: ResponseCache | Literal[False] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cost_tracker: CostTracker | None = None,
     ):
         """
         Initialize the verification runner.
 
         Args:
-            llm_provider: LLM provider to use. Creates default if not provided.
+            llm_provider: LLM provider to use. Creates the provider named by
+                settings.provider if not provided.
             scaffolds_dir: Directory containing scaffolds.
+            max_concurrency: Maximum in-flight LLM calls. Uses
+                settings.parallel_llm_calls if not provided.
+            cache: Response cache to use. Creates default if not provided
+                and settings.enable_cache is set; False disables caching.
+            rate_limiter: Rate limiter gating LLM calls. Uses the limiter
+                shared by all runners for this provider if not provided.
+            cost_tracker: Tracks token usage and cost, and enforces the run's
+                budget. Creates one from settings if not provided.
         """
         self.settings = get_settings()
-        self.llm = llm_provider or ClaudeProvider()
+        self.llm = llm_provider or get_provider()
         self.scaffolds_dir = scaffolds_dir or self.settings.get_scaffolds_path()
         self.prompt_builder = PromptBuilder()
         self.response_parser = ResponseParser()
+        self.max_concurrency = max_concurrency or self.settings.parallel_llm_calls
+        if cache is None and self.settings.enable_cache:
+            cache = ResponseCache()
+        self.cache = cache or None
+        self.rate_limiter = rate_limiter or get_rate_limiter(self.llm.provider_name)
+        self.cost_tracker = cost_tracker or CostTracker()
+        self.in_flight = 0
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def aclose(self) -> None:
+        """Close the LLM provider's connections and the response cache."""
+        await self.llm.aclose()
+        if self.cache is not None:
+            self.cache.close()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get or create the semaphore bounding concurrent LLM calls."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _call_llm(
+        self,
+        request: LLMRequest,
+        algorithm: str | None = None,
+        model: str | None = None,
+        timings: StageTimings | None = None,
+    ) -> LLMResponse:
+        """
+        Call the LLM under the shared concurrency limit.
+
+        Responses are served from the response cache when possible. Every
+        call waits on the shared rate limiter, and a rate-limit error pauses
+        all calls drawing from it, not just the one that hit it, so
+        concurrent calls back off together instead of each retrying into
+        the same limit. With streaming enabled, the stream is closed as
+        soon as the algorithm's final answer is complete. Calls that would
+        exceed the run's budget are refused without being sent.
+
+        Args:
+            request: Request to send.
+            algorithm: Algorithm the request is for, used to detect the
+                final answer when streaming.
+            model: Model to send the request to. Uses provider default if not specified.
+            timings: Receives the time spent queueing and in API calls.
+
+        Returns:
+            LLMResponse from the provider.
+
+        Raises:
+            BudgetExceededError: If the call would exceed the run's budget.
+            LLMError: If all retries fail.
+        """
+        model = model or self.llm.default_model
+        if self.cache is not None:
+            cached = self.cache.get(request, model, self.llm.cache_scope)
+            if cached is not None:
+                return cached
+
+        max_retries = self.settings.max_retries
+        retry_delay = self.settings.retry_delay_seconds
+        estimated = estimate_tokens(request.system_prompt + request.prompt)
+        last_error: Exception | None = None
+        timings = timings or StageTimings()
+        start_time = time.perf_counter()
+
+        async with self._get_semaphore():
+            reservation = self.cost_tracker.reserve(request, model)
+            try:
+                for attempt in range(max_retries):
+                    await self.rate_limiter.acquire(estimated)
+                    try:
+                        response = await self._send(request, algorithm, model, timings)
+                        # Everything outside API calls (slot, rate limiter, backoff) counts as queueing
+                        timings.queue_ms = (time.perf_counter() - start_time) * 1000 - timings.request_ms
+                        timings.first_token_ms = response.time_to_first_token_ms
+                        self.rate_limiter.record_success(response.headers, response.total_tokens, estimated)
+                        self.cost_tracker.record(model, response)
+                        if self.cache is not None:
+                            self.cache.put(request, model, response, self.llm.cache_scope)
+                        return response
+                    except RateLimitError as e:
+                        last_error = e
+                        self.rate_limiter.record_rate_limit(e.retry_after or retry_delay * (2 ** attempt))
+                    except (AuthenticationError, InvalidRequestError):
+                        raise
+                    except LLMError as e:
+                        last_error = e
+                        if attempt < max_retries - 1:
+                            await asyncio.sleep(retry_delay * (2 ** attempt))
+            finally:
+                self.cost_tracker.release(reservation)
+
+        timings.queue_ms = (time.perf_counter() - start_time) * 1000 - timings.request_ms
+        raise last_error or LLMError("All retries failed", provider=self.llm.provider_name)
+
+    async def _send(
+        self,
+        request: LLMRequest,
+        algorithm: str | None,
+        model: str,
+        timings: StageTimings,
+    ) -> LLMResponse:
+        """Make one API call, adding its duration to timings.request_ms."""
+        sent_at = time.perf_counter()
+        self.in_flight += 1
+        try:
+            if self.settings.stream_responses and algorithm:
+                parser = IncrementalResponseParser(algorithm)
+                return await self.llm.generate_stream(request, model, stop_when=parser.feed)
+            return await self.llm.generate(request, model)
+        finally:
+            self.in_flight -= 1
+            timings.request_ms += (time.perf_counter() - sent_at) * 1000
 
     async def run_test_case(
         self,
         scaffold_path: Path,
         test_case: TestCase,
         validator: Any,
+        model: str | None = None,
     ) -> TestResult:
         """
         Run a single test case.
@@ -160,70 +527,191 @@ class VerificationRunner:
             scaffold_path: Path to scaffold markdown file.
             test_case: Test case to run.
             validator: Validator to use for checking results.
+            model: Model to run against. Uses provider default if not specified.
 
         Returns:
             TestResult with outcome.
         """
-        import time
-
         start_time = time.perf_counter()
+        timings = StageTimings()
+        attributes = {
+            "scaffold": test_case.scaffold,
+            "test_case": test_case.id,
+            "tier": test_case.tier,
+            "model": model or self.llm.default_model,
+        }
 
-        try:
-            # Parse scaffold and build prompt
-            scaffold = self.prompt_builder.parser.parse_file(scaffold_path)
-            prompt = self.prompt_builder.build_prompt(scaffold, test_case.input)
-            system_prompt = self.prompt_builder.build_system_prompt()
-
-            # Call LLM
-            request = LLMRequest(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                temperature=self.settings.temperature,
-                max_tokens=self.settings.max_tokens,
-            )
+        with get_tracer().start_as_current_span("runner.run_test_case", attributes) as span:
+            try:
+                request = self.build_request(scaffold_path, test_case)
+                timings.prompt_ms = (time.perf_counter() - start_time) * 1000
+                response = await self._call_llm(request, test_case.scaffold, model, timings)
+                result = self.evaluate_response(test_case, response, validator, start_time, timings)
+
+            except Exception as e:
+                result = self._error_result(test_case, e, start_time, timings)
+
+            span.set_attributes({
+                "passed": result.passed,
+                "error": result.error or "",
+                "cached": bool(result.llm_response and result.llm_response.cached),
+                "input_tokens": result.llm_response.input_tokens if result.llm_response else 0,
+                "output_tokens": result.llm_response.output_tokens if result.llm_response else 0,
+                "queue_ms": timings.queue_ms,
+            })
+            return result
+
+    def build_request(self, scaffold_path: Path, test_case: TestCase) -> LLMRequest:
+        """
+        Build the LLM request for a test case.
 
-            response = await self.llm.generate_with_retry(
-                request,
-                max_retries=self.settings.max_retries,
-            )
+        Args:
+            scaffold_path: Path to scaffold markdown file.
+            test_case: Test case to build the prompt for.
+
+        Returns:
+            LLMRequest ready to send.
+        """
+        # Parse scaffold and build prompt
+        scaffold = self.prompt_builder.parser.parse_file(scaffold_path)
+        prompt = self.prompt_builder.build_prompt(scaffold, test_case.input)
+        system_prompt = self.prompt_builder.build_system_prompt()
+
+        # The prompt starts with the scaffold instructions, which every
+        # test case for this scaffold shares
+        prompt_cache = self.settings.enable_prompt_cache
+        return LLMRequest(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=self.settings.temperature,
+            max_tokens=self.settings.max_tokens,
+            cache_prefix=scaffold.instructions if prompt_cache else "",
+            cache_system_prompt=prompt_cache,
+        )
 
-            # Parse response
-            parsed = self.response_parser.parse(response.content, test_case.scaffold)
+    def evaluate_response(
+        self,
+        test_case: TestCase,
+        response: LLMResponse,
+        validator: Any,
+        start_time: float,
+        timings: StageTimings | None = None,
+    ) -> TestResult:
+        """
+        Parse and validate an LLM response for a test case.
 
-            # Validate
-            if parsed.is_valid:
+        Args:
+            test_case: Test case the response answers.
+            response: LLM response to check.
+            validator: Validator to use for checking results.
+            start_time: perf_counter() value when the test case started.
+            timings: Timings of the earlier stages, completed with parse
+                and validation times.
+
+        Returns:
+            TestResult with outcome.
+        """
+        timings = timings or StageTimings()
+
+        # Parse response
+        parse_start = time.perf_counter()
+        parsed = self.response_parser.parse(response.content, test_case.scaffold)
+        timings.parse_ms = (time.perf_counter() - parse_start) * 1000
+
+        # Validate
+        validate_start = time.perf_counter()
+        if parsed.is_valid:
+            with get_tracer().start_as_current_span(
+                "validator.validate", {"validator": validator.name, "scaffold": test_case.scaffold},
+            ) as span:
                 validation = validator.validate(
                     test_case.expected,
                     parsed.answer,
                 )
-            else:
-                validation = ValidationResult(
-                    is_valid=False,
-                    score=0.0,
-                    message=f"Failed to parse LLM response: {parsed.parse_error}",
-                    expected=test_case.expected,
-                    actual=None,
-                )
+                span.set_attributes({"is_valid": validation.is_valid, "score": validation.score})
+        else:
+            validation = ValidationResult(
+                is_valid=False,
+                score=0.0,
+                message=f"Failed to parse LLM response: {parsed.parse_error}",
+                expected=test_case.expected,
+                actual=None,
+            )
 
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
+        timings.validate_ms = (time.perf_counter() - validate_start) * 1000
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
 
-            return TestResult(
-                test_case=test_case,
-                llm_response=response,
-                parsed_answer=parsed,
-                validation_result=validation,
-                duration_ms=elapsed_ms,
-            )
+        return TestResult(
+            test_case=test_case,
+            llm_response=response,
+            parsed_answer=parsed,
+            validation_result=validation,
+            duration_ms=elapsed_ms,
+            timings=timings,
+        )
+
+    def _error_result(
+        self,
+        test_case: TestCase,
+        error: Exception,
+        start_time: float,
+        timings: StageTimings | None = None,
+    ) -> TestResult:
+        """Build the result for a test case that failed to run."""
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        logger.error(f"Error running test case {test_case.id}: {error}")
+
+        return TestResult(
+            test_case=test_case,
+            error=str(error),
+            duration_ms=elapsed_ms,
+            timings=timings,
+        )
 
-        except Exception as e:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            logger.error(f"Error running test case {test_case.id}: {e}")
+    def fingerprint(self, job: "ScaffoldJob") -> str:
+        """
+        Hash everything that determines a scaffold's results.
 
-            return TestResult(
-                test_case=test_case,
-                error=str(e),
-                duration_ms=elapsed_ms,
-            )
+        Covers the model, the full scaffold markdown, every request sent
+        (test inputs, output format, system prompt and sampling parameters), the
+        expected answers produced by the generator, and the validator type
+        and configuration. Unchanged fingerprints mean a re-run would ask
+        the same questions and grade them the same way.
+
+        Args:
+            job: The scaffold job to fingerprint.
+
+        Returns:
+            Hex SHA-256 digest, or an empty string if the scaffold file is missing.
+        """
+        scaffold_path = self._find_scaffold_file(job.scaffold)
+        if scaffold_path is None:
+            return ""
+
+        model = job.model or self.llm.default_model
+        validator = job.validator
+        scaffold = self.prompt_builder.parser.parse_file(scaffold_path)
+        payload = json.dumps(
+            {
+                "model": model,
+                "scaffold": scaffold.raw_content,
+                "cases": [
+                    {
+                        "id": test_case.id,
+                        "request": ResponseCache.make_key(
+                            self.build_request(scaffold_path, test_case), model, self.llm.cache_scope,
+                        ),
+                        "expected": test_case.expected,
+                    }
+                    for test_case in job.test_suite.test_cases
+                ],
+                "validator": f"{type(validator).__module__}.{type(validator).__qualname__}",
+                "validator_config": vars(validator),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
     async def run_test_suite(
         self,
@@ -242,36 +730,218 @@ class VerificationRunner:
         Returns:
             ScaffoldResults with all test outcomes.
         """
-        # Find scaffold file
-        scaffold_path = self._find_scaffold_file(scaffold_name)
-        if scaffold_path is None:
-            results = ScaffoldResults(
-                scaffold=scaffold_name,
-                model=self.settings.active_model,
-            )
-            for tc in test_suite.test_cases:
-                results.test_results.append(TestResult(
-                    test_case=tc,
-                    error=f"Scaffold file not found: {scaffold_name}",
-                ))
-            results.completed_at = datetime.now()
-            return results
+        job = ScaffoldJob(scaffold_name, test_suite, validator)
+        return (await self.run_jobs([job]))[0]
 
-        results = ScaffoldResults(
-            scaffold=scaffold_name,
-            model=self.settings.active_model,
-        )
+    async def run_jobs(
+        self,
+        jobs: list["ScaffoldJob"],
+        on_complete: Callable[[ScaffoldResults], None] | None = None,
+        journal: "RunJournal | None" = None,
+        on_result: Callable[[TestResult], None] | None = None,
+    ) -> list[ScaffoldResults]:
+        """
+        Run several test suites through one shared work queue.
 
-        # Run tests (sequentially to avoid rate limits)
-        for test_case in test_suite.test_cases:
-            result = await self.run_test_case(scaffold_path, test_case, validator)
-            results.test_results.append(result)
-            logger.info(
-                f"Test {test_case.id}: {'PASS' if result.passed else 'FAIL'}"
-            )
+        Every (scaffold, test case) pair is queued up front and dispatched
+        under the runner's concurrency limit, so a slow scaffold only holds
+        the slots its own cases occupy instead of blocking the scaffolds
+        queued behind it.
 
-        results.completed_at = datetime.now()
-        return results
+        With prompt caching enabled, a scaffold's first case runs alone to
+        warm the cached prefix before its remaining cases are dispatched,
+        so they read the prefix from the cache instead of all writing it.
+
+        Args:
+            jobs: Test suites to run.
+            on_complete: Called with each scaffold's results as soon as its
+                last test case finishes.
+            journal: Run journal to record each finished test case in. Test
+                cases it already holds a result for are not run again.
+            on_result: Called with each test case's result as soon as it
+                finishes (e.g., to update a progress display).
+
+        Returns:
+            ScaffoldResults for each job, in job order.
+        """
+        models = [job.model or self.llm.default_model for job in jobs]
+        all_results = [
+            ScaffoldResults(scaffold=job.scaffold, model=model)
+            for job, model in zip(jobs, models)
+        ]
+        slots: list[list[TestResult | None]] = [[None] * len(job.test_suite.test_cases) for job in jobs]
+        remaining = [len(job.test_suite.test_cases) for job in jobs]
+        warmed = [asyncio.Event() for _ in jobs]
+        if not self.settings.enable_prompt_cache or self.max_concurrency == 1:
+            for event in warmed:
+                event.set()
+
+        def finish(i: int) -> None:
+            all_results[i].test_results = list(slots[i])
+            all_results[i].completed_at = datetime.now()
+            all_results[i].fingerprint = self.fingerprint(jobs[i])
+            if on_complete is not None:
+                on_complete(all_results[i])
+
+        # Build the work queue in job order
+        work = []
+        for i, job in enumerate(jobs):
+            scaffold_path = self._find_scaffold_file(job.scaffold)
+            if scaffold_path is None:
+                slots[i] = [
+                    TestResult(test_case=tc, error=f"Scaffold file not found: {job.scaffold}")
+                    for tc in job.test_suite.test_cases
+                ]
+                remaining[i] = 0
+            else:
+                # The first case queued for a scaffold warms its prompt cache
+                warms = True
+                for j, test_case in enumerate(job.test_suite.test_cases):
+                    done = journal.completed(job.scaffold, test_case.id, models[i]) if journal else None
+                    if done is not None:
+                        slots[i][j] = done
+                        remaining[i] -= 1
+                    else:
+                        work.append((i, j, scaffold_path, test_case, job.validator, warms))
+                        warms = False
+            if remaining[i] == 0:
+                finish(i)
+
+        async def run_one(
+            i: int, j: int, scaffold_path: Path, test_case: TestCase, validator: Any, warms: bool,
+        ) -> None:
+            if warms:
+                try:
+                    result = await self.run_test_case(scaffold_path, test_case, validator, models[i])
+                finally:
+                    warmed[i].set()
+            else:
+                await warmed[i].wait()
+                result = await self.run_test_case(scaffold_path, test_case, validator, models[i])
+            logger.info(f"Test {test_case.id} ({models[i]}): {'PASS' if result.passed else 'FAIL'}")
+            if journal is not None:
+                journal.record(jobs[i].scaffold, models[i], result)
+            if on_result is not None:
+                on_result(result)
+            slots[i][j] = result
+            remaining[i] -= 1
+            if remaining[i] == 0:
+                finish(i)
+
+        # Tasks reach _call_llm's semaphore in queue order, which then
+        # hands out slots first-come first-served
+        await asyncio.gather(*(run_one(*item) for item in work))
+
+        return all_results
+
+    async def run_jobs_batch(
+        self,
+        jobs: list[ScaffoldJob],
+        backend: BatchBackend,
+        on_complete: Callable[[ScaffoldResults], None] | None = None,
+        journal: "RunJournal | None" = None,
+    ) -> list[ScaffoldResults]:
+        """
+        Run test suites as a single Message Batches job.
+
+        Every request not already in the response cache is submitted in
+        one batch; responses are parsed and validated once it ends.
+        Requests that would exceed the run's budget are not submitted.
+
+        Args:
+            jobs: Test suites to run.
+            backend: Batch backend to submit through.
+            on_complete: Called with each scaffold's results.
+            journal: Run journal to record each finished test case in. Test
+                cases it already holds a result for are not submitted.
+
+        Returns:
+            ScaffoldResults for each job, in job order.
+        """
+        start_time = time.perf_counter()
+        models = [job.model or backend.provider.default_model for job in jobs]
+        scope = backend.provider.cache_scope
+        slots: list[list[TestResult | None]] = [[None] * len(job.test_suite.test_cases) for job in jobs]
+        responses: dict[tuple[int, int], LLMResponse | Exception] = {}
+        batch_requests: dict[str, LLMRequest] = {}
+        batch_models: dict[str, str] = {}
+        batch_slots: dict[str, tuple[int, int]] = {}
+        reservations: list[tuple[float, int]] = []
+
+        for i, job in enumerate(jobs):
+            model = models[i]
+            scaffold_path = self._find_scaffold_file(job.scaffold)
+            for j, test_case in enumerate(job.test_suite.test_cases):
+                if scaffold_path is None:
+                    slots[i][j] = TestResult(
+                        test_case=test_case,
+                        error=f"Scaffold file not found: {job.scaffold}",
+                    )
+                    continue
+                done = journal.completed(job.scaffold, test_case.id, model) if journal else None
+                if done is not None:
+                    slots[i][j] = done
+                    continue
+                try:
+                    request = self.build_request(scaffold_path, test_case)
+                except Exception as e:
+                    slots[i][j] = self._error_result(test_case, e, start_time)
+                    continue
+
+                cached = self.cache.get(request, model, scope) if self.cache is not None else None
+                if cached is not None:
+                    responses[(i, j)] = cached
+                    continue
+                try:
+                    reservations.append(self.cost_tracker.reserve(request, model))
+                except BudgetExceededError as e:
+                    responses[(i, j)] = e
+                else:
+                    custom_id = f"case-{len(batch_requests)}"
+                    batch_requests[custom_id] = request
+                    batch_models[custom_id] = model
+                    batch_slots[custom_id] = (i, j)
+
+        logger.info(f"Submitting {len(batch_requests)} requests ({len(responses)} cached)")
+        try:
+            batch_results = await backend.run(batch_requests, models=batch_models)
+        except LLMError as e:
+            batch_results = dict.fromkeys(batch_requests, e)
+        for reservation in reservations:
+            self.cost_tracker.release(reservation)
+
+        for custom_id, outcome in batch_results.items():
+            if isinstance(outcome, LLMResponse):
+                self.cost_tracker.record(batch_models[custom_id], outcome, discount=BATCH_DISCOUNT)
+                if self.cache is not None:
+                    self.cache.put(batch_requests[custom_id], batch_models[custom_id], outcome, scope)
+            responses[batch_slots[custom_id]] = outcome
+
+        all_results = []
+        for i, job in enumerate(jobs):
+            results = ScaffoldResults(scaffold=job.scaffold, model=models[i])
+            for j, test_case in enumerate(job.test_suite.test_cases):
+                if slots[i][j] is not None:
+                    continue
+                outcome = responses[(i, j)]
+                try:
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    # Batch requests share one submission, so its duration stands in for each request
+                    timings = StageTimings(request_ms=0.0 if outcome.cached else outcome.latency_ms)
+                    slots[i][j] = self.evaluate_response(test_case, outcome, job.validator, start_time, timings)
+                except Exception as e:
+                    slots[i][j] = self._error_result(test_case, e, start_time)
+                if journal is not None:
+                    journal.record(job.scaffold, models[i], slots[i][j])
+            results.test_results = list(slots[i])
+            results.completed_at = datetime.now()
+            results.fingerprint = self.fingerprint(job)
+            all_results.append(results)
+            if on_complete is not None:
+                on_complete(results)
+
+        return all_results
 
     def _find_scaffold_file(self, scaffold_name: str) -> Path | None:
         """Find scaffold file by name."""
@@ -311,5 +981,11 @@ def run_verification(
     Returns:
         ScaffoldResults with all test outcomes.
     """
-    runner = VerificationRunner()
-    return asyncio.run(runner.run_test_suite(scaffold_name, test_suite, validator))
+    async def run() -> ScaffoldResults:
+        runner = VerificationRunner()
+        try:
+            return await runner.run_test_suite(scaffold_name, test_suite, validator)
+        finally:
+            await runner.aclose()
+
+    return asyncio.run(run())
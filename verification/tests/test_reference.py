@@ -5,13 +5,22 @@ These tests verify the reference implementations are correct
 before using them to validate LLM outputs.
 """
 
+import importlib
+import random
+import sys
+
+import numpy as np
 import pytest
 
-from verification.reference.graph import dijkstra, bfs, bellman_ford, floyd_warshall, topological_sort
+from verification.reference.csr import CSRGraph
+from verification.reference.graph import (
+    dijkstra, bfs, dfs, bellman_ford, floyd_warshall, topological_sort,
+    batch_shortest_paths, packed_shortest_paths,
+)
 from verification.reference.dynamic_programming import knapsack_01, lcs, edit_distance, lis
 from verification.reference.divide_conquer import binary_search, merge_sort, quickselect
 from verification.reference.greedy import activity_selection, fractional_knapsack, kruskal_mst
-from verification.reference.backtracking import nqueens, subset_sum
+from verification.reference.backtracking import nqueens, subset_sum, graph_coloring
 from verification.reference.string_algo import kmp_search, rabin_karp_search
 from verification.reference.numerical import newton_raphson, bisection
 
@@ -31,6 +40,18 @@ class TestGraphAlgorithms:
         assert result.distances["C"] == 2
         assert result.distances["D"] == 5  # A->C->D = 2+3
 
+    def test_distance_types_follow_weights(self):
+        """Paths over integer weights give int distances, as networkx does, even beside float weights."""
+        vertices = ["A", "B", "C"]
+        for edges, expected in (
+            ([["A", "B", 3], ["B", "C", 2]], {"A": 0, "B": 3, "C": 5}),
+            ([["A", "B", 3], ["B", "C", 2.5]], {"A": 0, "B": 3, "C": 5.5}),
+            ([["A", "B", 3.0], ["B", "C", 2.0]], {"A": 0, "B": 3.0, "C": 5.0}),
+        ):
+            for search in (dijkstra, bellman_ford):
+                distances = search(vertices, edges, "A").distances
+                assert [(d, type(d)) for d in distances.values()] == [(d, type(d)) for d in expected.values()]
+
     def test_dijkstra_with_target(self):
         """Test Dijkstra with target vertex."""
         vertices = ["A", "B", "C"]
@@ -41,6 +62,19 @@ class TestGraphAlgorithms:
         assert result.path == ["A", "B", "C"]
         assert result.distances["C"] == 3
 
+    def test_dijkstra_path_only(self):
+        """Dijkstra returns predecessors, and can stop once the target is settled."""
+        vertices = ["A", "B", "C", "D"]
+        edges = [["A", "B", 1], ["B", "C", 2], ["A", "C", 5], ["C", "D", 10]]
+
+        full = dijkstra(vertices, edges, "A", "C")
+        result = dijkstra(vertices, edges, "A", "C", path_only=True)
+
+        assert full.predecessors == {"A": None, "B": "A", "C": "B", "D": "C"}
+        assert result.path == full.path == ["A", "B", "C"]
+        assert result.distances is None
+        assert "D" not in result.predecessors
+
     def test_bfs_shortest_path(self):
         """Test BFS finds shortest path in unweighted graph."""
         vertices = ["A", "B", "C", "D"]
@@ -51,6 +85,73 @@ class TestGraphAlgorithms:
         assert result.path in [["A", "B", "D"], ["A", "C", "D"]]
         assert result.distances["D"] == 2
 
+    def test_dfs_long_chain(self):
+        """DFS follows paths far deeper than the recursion limit, in edge order."""
+        vertices = [f"v{i}" for i in range(5000)]
+        edges = [[vertices[i], vertices[i + 1]] for i in range(len(vertices) - 1)]
+        edges.insert(0, ["v0", "v4999"])
+
+        assert dfs(vertices, edges, "v0", "v4999").path == ["v0", "v4999"]
+        assert len(dfs(vertices, edges[1:], "v0", "v4999").path) == 5000
+
+    def test_batched_shortest_paths(self):
+        """Batched searches give the same results as one call per source or graph."""
+        rng = random.Random(5)
+        graphs = []
+        for _ in range(20):
+            vertices = [chr(65 + i) for i in range(rng.randint(1, 8))]
+            weight = rng.choice([lambda: rng.randint(1, 5), lambda: rng.uniform(0, 5)])
+            edges = [[*rng.choices(vertices, k=2), weight()] for _ in range(2 * len(vertices))]
+            graphs.append({"vertices": vertices, "edges": edges, "source": vertices[0], "target": vertices[-1]})
+
+        for algorithm, single in (("dijkstra", dijkstra), ("bfs", bfs)):
+            for graph, result in zip(graphs, packed_shortest_paths(graphs, algorithm=algorithm)):
+                expected = single(graph["vertices"], graph["edges"], graph["source"], graph["target"])
+                assert list(result.distances.items()) == list(expected.distances.items())
+                assert result.predecessors == expected.predecessors
+                assert result.path == expected.path
+
+        vertices, edges = graphs[-1]["vertices"], graphs[-1]["edges"]
+        for source, result in zip(vertices, batch_shortest_paths(vertices, edges, vertices)):
+            assert result.distances == dijkstra(vertices, edges, source).distances
+
+    def test_failed_batch_falls_back_to_single_cases(self, monkeypatch, caplog):
+        """If a tier fails to generate as a batch, its cases are generated one at a time."""
+        from verification.registry import UniversalGenerator
+
+        def fail(tier, count):
+            raise ValueError("bad input")
+
+        generator = UniversalGenerator("dijkstra")
+        monkeypatch.setattr(generator, "_gen_dijkstra_batch", fail)
+        monkeypatch.setattr(generator, "_gen_dijkstra", lambda tier, idx: ({"n": idx}, {"distances": {}}))
+
+        cases = generator.generate_simple(3)
+
+        assert [case.input for case in cases] == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert "bad input" in caplog.text
+
+    def test_floyd_warshall(self):
+        """Blocked and float32 runs agree with the plain loop, and rows read like nested dicts."""
+        rng = random.Random(3)
+        vertices = [f"v{i}" for i in range(40)]
+        edges = [[rng.choice(vertices), rng.choice(vertices), rng.randint(1, 9)] for _ in range(120)]
+
+        result = floyd_warshall(vertices, edges, block_size=0)
+        blocked = floyd_warshall(vertices, edges, block_size=16)
+        single = floyd_warshall(vertices, edges, dtype=np.float32, block_size=16)
+
+        assert (blocked.distance_array == result.distance_array).all()
+        assert (single.distance_array == result.distance_array).all()
+        assert result.distance_matrix["v0"]["v0"] == 0
+        assert blocked.to_dict() == result.to_dict()
+
+        small = floyd_warshall(["A", "B", "C"], [["A", "B", 2], ["B", "C", 3]], directed=False)
+        assert small.to_dict()["distance_matrix"]["C"] == {"A": 5, "B": 3, "C": 0}
+
+        for block_size in (0, 16):
+            assert floyd_warshall([], [], block_size=block_size).to_dict() == {"distance_matrix": {}}
+
     def test_topological_sort_dag(self):
         """Test topological sort on DAG."""
         vertices = ["A", "B", "C", "D"]
@@ -66,6 +167,72 @@ class TestGraphAlgorithms:
         assert order.index("C") < order.index("D")
 
 
+class TestCSRGraph:
+    """Test the CSR graph core against networkx."""
+
+    def test_from_edges(self):
+        """Edges are grouped by source in insertion order; repeats keep their last weight."""
+        graph = CSRGraph.from_edges(["A", "B"], [["A", "C", 4], ["B", "A"], ["A", "B", 2], ["A", "C", 1]])
+
+        assert graph.vertices == ["A", "B", "C"]
+        assert graph.offsets.tolist() == [0, 2, 3, 3]
+        assert [graph.vertices[v] for v in graph.neighbors(0)] == ["C", "B"]
+        assert graph.weights.tolist() == [1, 2, 1]
+
+        undirected = CSRGraph.from_edges(["A", "B"], [["A", "B", 3], ["B", "B", 1]], directed=False)
+        assert undirected.num_edges == 3
+
+    def test_works_without_networkx(self, monkeypatch):
+        """The CSR algorithms import and run when networkx is not installed."""
+        monkeypatch.setitem(sys.modules, "networkx", None)
+        # Re-import the module, restoring the original afterwards
+        monkeypatch.setattr(sys.modules["verification.reference"], "graph", sys.modules["verification.reference.graph"])
+        monkeypatch.delitem(sys.modules, "verification.reference.graph")
+        graph = importlib.import_module("verification.reference.graph")
+
+        assert not graph.NETWORKX_AVAILABLE
+        assert graph.dijkstra(["A", "B"], [["A", "B", 2]], "A").distances == {"A": 0, "B": 2}
+        with pytest.raises(ImportError):
+            graph.build_graph(["A"], [])
+
+    def test_matches_networkx(self):
+        """Results, including tie-breaking and ordering, match the networkx implementations."""
+        nx = pytest.importorskip("networkx")
+        rng = random.Random(7)
+
+        for _ in range(200):
+            n = rng.randint(1, 10)
+            vertices = [f"v{i}" for i in range(n)]
+            edges = [
+                [rng.choice(vertices), rng.choice(vertices), rng.randint(0, 5)]
+                for _ in range(rng.randint(0, 3 * n))
+            ]
+            directed = rng.random() < 0.5
+            source, target = rng.choice(vertices), rng.choice(vertices)
+            G = nx.DiGraph() if directed else nx.Graph()
+            G.add_nodes_from(vertices)
+            G.add_weighted_edges_from(edges)
+
+            result = dijkstra(vertices, edges, source, target, directed)
+            expected = dict(nx.single_source_dijkstra_path_length(G, source))
+            assert list(result.distances.items())[:len(expected)] == list(expected.items())
+            if target in expected:
+                assert result.path == nx.dijkstra_path(G, source, target)
+
+            distances = bellman_ford(vertices, edges, source, directed).distances
+            assert {v: d for v, d in distances.items() if d != float("inf")} == \
+                nx.single_source_bellman_ford_path_length(G, source)
+
+            if directed:
+                try:
+                    order = list(nx.topological_sort(G))
+                except nx.NetworkXUnfeasible:
+                    with pytest.raises(ValueError):
+                        topological_sort(vertices, edges)
+                else:
+                    assert topological_sort(vertices, edges).order == order
+
+
 class TestDynamicProgramming:
     """Test DP algorithm reference implementations."""
 
@@ -179,6 +346,16 @@ class TestBacktracking:
         assert result.found
         assert sum(result.solution) == 9
 
+    def test_deep_search(self):
+        """Solvers backtrack without recursion, so deep searches do not overflow the stack."""
+        assert len(subset_sum([1] * 3000, 2500).solution) == 2500
+        assert nqueens(6, find_all=True).all_solutions[0] == [(0, 1), (1, 3), (2, 5), (3, 0), (4, 2), (5, 4)]
+
+        vertices = [str(i) for i in range(3000)]
+        edges = [(vertices[i], vertices[i + 1]) for i in range(len(vertices) - 1)]
+        coloring = graph_coloring(vertices, edges, 2).solution
+        assert [coloring[v] for v in vertices[:4]] == [1, 2, 1, 2]
+
 
 class TestStringAlgorithms:
     """Test string algorithm reference implementations."""
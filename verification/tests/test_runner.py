@@ -0,0 +1,824 @@
+"""
+Tests for the verification runner.
+
+These use an in-process stub provider, so they run without an API key.
+"""
+
+import asyncio
+import io
+import json
+import time
+
+import pytest
+
+from verification.bench.pipeline import compare, run_benchmarks
+from verification.dashboard import Dashboard
+from verification.journal import RunJournal
+from verification.llm.base import LLMError, LLMProvider, LLMRequest, LLMResponse, RateLimitError
+from verification.llm.batch import BatchBackend, LocalBatchClient
+from verification.llm.cache import ResponseCache
+from verification.llm.claude import ClaudeProvider
+from verification.llm.cost import CostTracker, get_pricing
+from verification.llm.openai_compat import OpenAICompatibleProvider
+from verification.llm.prompt_builder import ScaffoldParser
+from verification.llm.providers import get_provider
+from verification.llm.replay import RecordingProvider, ReplayProfile, ReplayProvider
+from verification.llm.rate_limit import RateLimiter, parse_retry_after
+from verification.llm.response_parser import IncrementalResponseParser
+from verification.registry import UniversalGenerator, get_validator_for_scaffold
+from verification.runner import ScaffoldJob, ScaffoldResults, VerificationRunner, percentile
+from verification.tracing import RecordingTracer, Tracer, set_tracer
+
+
+class StubProvider(LLMProvider):
+    """Provider that returns a fixed response after a short delay."""
+
+    def __init__(self, content: str = "FINAL_ANSWER: 0", delay: float = 0.01, rate_limited: int = 0):
+        self.content = content
+        self.delay = delay
+        self.rate_limited = rate_limited
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    @property
+    def provider_name(self) -> str:
+        return "stub"
+
+    @property
+    def default_model(self) -> str:
+        return "stub-model"
+
+    async def generate(self, request: LLMRequest, model: str | None = None) -> LLMResponse:
+        self.calls += 1
+        if self.rate_limited > 0:
+            self.rate_limited -= 1
+            raise RateLimitError("rate limited", provider="stub", status_code=429)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return LLMResponse(content=self.content, model=model or self.default_model)
+
+    async def generate_with_retry(self, request, model=None, max_retries=3, retry_delay=1.0):
+        return await self.generate(request, model)
+
+    def is_available(self) -> bool:
+        return True
+
+
+@pytest.fixture(autouse=True)
+def no_default_cache(monkeypatch):
+    """Keep tests from reading or writing the real response cache."""
+    from verification.config import get_settings
+    monkeypatch.setattr(get_settings(), "enable_cache", False)
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    """Shrink retry delays so backoff tests run quickly."""
+    from verification.config import get_settings
+    monkeypatch.setattr(get_settings(), "retry_delay_seconds", 0.01)
+
+
+class TestConcurrentExecution:
+    """Test bounded-concurrency execution of test suites."""
+
+    async def test_results_keep_test_case_order(self, scaffolds_dir):
+        """Concurrent execution preserves test case ordering."""
+        provider = StubProvider()
+        runner = VerificationRunner(provider, scaffolds_dir, max_concurrency=4)
+        suite = UniversalGenerator("binary_search").generate_suite()
+
+        results = await runner.run_test_suite(
+            "binary_search", suite, get_validator_for_scaffold("binary_search"),
+        )
+
+        assert [r.test_case.id for r in results.test_results] == [
+            tc.id for tc in suite.test_cases
+        ]
+
+    async def test_concurrency_is_bounded(self, scaffolds_dir):
+        """No more than max_concurrency calls are in flight at once."""
+        provider = StubProvider()
+        runner = VerificationRunner(provider, scaffolds_dir, max_concurrency=3)
+        suite = UniversalGenerator("binary_search").generate_suite()
+
+        await runner.run_test_suite(
+            "binary_search", suite, get_validator_for_scaffold("binary_search"),
+        )
+
+        assert provider.peak_in_flight == 3
+
+    async def test_rate_limit_is_retried(self, scaffolds_dir, fast_retries):
+        """Rate-limited calls back off and are retried."""
+        provider = StubProvider(rate_limited=2)
+        runner = VerificationRunner(provider, scaffolds_dir, max_concurrency=2)
+        suite = UniversalGenerator("binary_search").generate_suite()
+
+        results = await runner.run_test_suite(
+            "binary_search", suite, get_validator_for_scaffold("binary_search"),
+        )
+
+        assert all(r.error is None for r in results.test_results)
+        assert provider.calls == len(suite.test_cases) + 2
+
+    async def test_run_jobs_reports_each_scaffold(self, scaffolds_dir):
+        """Jobs share one queue and each scaffold is reported when done."""
+        provider = StubProvider()
+        runner = VerificationRunner(provider, scaffolds_dir, max_concurrency=4)
+        jobs = [
+            ScaffoldJob(name, UniversalGenerator(name).generate_suite(), get_validator_for_scaffold(name))
+            for name in ["binary_search", "merge_sort"]
+        ]
+        completed = []
+
+        results = await runner.run_jobs(jobs, on_complete=lambda r: completed.append(r.scaffold))
+
+        assert [r.scaffold for r in results] == ["binary_search", "merge_sort"]
+        assert sorted(completed) == ["binary_search", "merge_sort"]
+        assert all(r.completed_at is not None for r in results)
+        assert provider.calls == sum(len(job.test_suite.test_cases) for job in jobs)
+
+    async def test_jobs_run_against_their_own_model(self, scaffolds_dir):
+        """Model matrix jobs share a suite but report their own model."""
+        provider = StubProvider()
+        runner = VerificationRunner(provider, scaffolds_dir, max_concurrency=4)
+        suite = UniversalGenerator("merge_sort").generate_suite()
+        validator = get_validator_for_scaffold("merge_sort")
+        jobs = [ScaffoldJob("merge_sort", suite, validator, model) for model in ["model-a", "model-b"]]
+
+        results = await runner.run_jobs(jobs)
+
+        assert [r.model for r in results] == ["model-a", "model-b"]
+        assert runner.fingerprint(jobs[0]) != runner.fingerprint(jobs[1])
+        assert provider.calls == 2 * len(suite.test_cases)
+
+
+class TestRunJournal:
+    """Test journaling and resuming of verification runs."""
+
+    async def test_resume_skips_finished_cases(self, scaffolds_dir, tmp_path):
+        """A resumed run only calls the LLM for cases not finished before."""
+        suite = UniversalGenerator("merge_sort").generate_suite()
+        job = ScaffoldJob("merge_sort", suite, get_validator_for_scaffold("merge_sort"))
+        journal = RunJournal("run-1", tmp_path)
+        journal.start(scaffolds=["merge_sort"])
+
+        first = await VerificationRunner(StubProvider(), scaffolds_dir).run_jobs([job], journal=journal)
+
+        # Drop the last two results, as if the run had been interrupted
+        lines = journal.path.read_text().splitlines()
+        journal.path.write_text("\n".join(lines[:-2]) + "\n")
+
+        provider = StubProvider()
+        resumed = RunJournal("run-1", tmp_path)
+        [results] = await VerificationRunner(provider, scaffolds_dir).run_jobs([job], journal=resumed)
+
+        assert resumed.header["scaffolds"] == ["merge_sort"]
+        assert provider.calls == 2
+        assert [r.passed for r in results.test_results] == [r.passed for r in first[0].test_results]
+        assert RunJournal("run-1", tmp_path).completed_count == len(suite.test_cases)
+
+
+class TestFingerprint:
+    """Test change detection for incremental verification."""
+
+    def test_fingerprint_tracks_scaffold_and_validator(self, scaffolds_dir, tmp_path):
+        """Editing the scaffold or swapping the validator changes the fingerprint."""
+        import shutil
+
+        shutil.copytree(scaffolds_dir / "01_graph", tmp_path / "01_graph")
+        runner = VerificationRunner(StubProvider(), tmp_path)
+        suite = UniversalGenerator("bfs").generate_suite()
+        job = ScaffoldJob("bfs", suite, get_validator_for_scaffold("bfs"))
+        fingerprint = runner.fingerprint(job)
+
+        assert runner.fingerprint(ScaffoldJob("bfs", UniversalGenerator("bfs").generate_suite(), job.validator)) == fingerprint
+        assert runner.fingerprint(ScaffoldJob("bfs", suite, get_validator_for_scaffold("dijkstra"))) != fingerprint
+
+        scaffold_file = tmp_path / "01_graph" / "bfs.md"
+        scaffold_file.write_text(scaffold_file.read_text(encoding="utf-8") + "\nExtra step.\n", encoding="utf-8")
+        runner.prompt_builder.parser.clear_cache()
+        assert runner.fingerprint(job) != fingerprint
+
+
+class TestResponseCache:
+    """Test the on-disk LLM response cache."""
+
+    def test_key_depends_on_request_model_and_backend(self):
+        """Any change to the request parameters, model or backend changes the key."""
+        request = LLMRequest(prompt="p", system_prompt="s")
+        key = ResponseCache.make_key(request, "m")
+
+        assert key == ResponseCache.make_key(LLMRequest(prompt="p", system_prompt="s"), "m")
+        assert key != ResponseCache.make_key(request, "other")
+        assert key != ResponseCache.make_key(LLMRequest(prompt="p", system_prompt="s", temperature=0.5), "m")
+        assert key != ResponseCache.make_key(LLMRequest(prompt="p2", system_prompt="s"), "m")
+
+        servers = [OpenAICompatibleProvider(url).cache_scope for url in ["http://a/v1", "http://b/v1"]]
+        scoped = {ResponseCache.make_key(request, "m", scope) for scope in ["anthropic", *servers]}
+        assert len(scoped) == 3 and key not in scoped
+
+    async def test_rerun_is_served_from_cache(self, scaffolds_dir, tmp_path):
+        """A second run of the same suite makes no LLM calls."""
+        provider = StubProvider()
+        cache = ResponseCache(tmp_path / "cache")
+        suite = UniversalGenerator("merge_sort").generate_suite()
+        validator = get_validator_for_scaffold("merge_sort")
+
+        first = await VerificationRunner(provider, scaffolds_dir, cache=cache).run_test_suite(
+            "merge_sort", suite, validator,
+        )
+        calls = provider.calls
+        second = await VerificationRunner(provider, scaffolds_dir, cache=cache).run_test_suite(
+            "merge_sort", suite, validator,
+        )
+
+        assert provider.calls == calls
+        assert all(r.llm_response.cached for r in second.test_results)
+        assert [r.llm_response.content for r in second.test_results] == [
+            r.llm_response.content for r in first.test_results
+        ]
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path):
+        """Entries beyond the budget are evicted least recently used first."""
+        cache = ResponseCache(tmp_path / "cache", max_entries=2, max_bytes=0)
+        requests = [LLMRequest(prompt=f"p{i}") for i in range(3)]
+
+        cache.put(requests[0], "m", LLMResponse(content="r0", model="m"))
+        cache.put(requests[1], "m", LLMResponse(content="r1", model="m"))
+        assert cache.get(requests[0], "m") is not None  # refresh r0
+        cache.put(requests[2], "m", LLMResponse(content="r2", model="m"))
+
+        assert cache.get(requests[1], "m") is None
+        assert cache.get(requests[0], "m").content == "r0"
+        assert cache.get(requests[2], "m").content == "r2"
+        assert cache.stats()["entries"] == 2
+
+
+class TestRateLimiter:
+    """Test the adaptive token-bucket rate limiter."""
+
+    def test_headers_resize_buckets_within_configured_caps(self):
+        """API-reported limits size the buckets unless a lower cap is configured."""
+        limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=1000)
+
+        limiter.update_from_headers({
+            "Anthropic-RateLimit-Requests-Limit": "50",
+            "Anthropic-RateLimit-Requests-Remaining": "10",
+            "Anthropic-RateLimit-Tokens-Limit": "80000",
+            "Anthropic-RateLimit-Tokens-Remaining": "80000",
+        })
+
+        assert limiter.requests.capacity == 50
+        assert limiter.requests.tokens == 10
+        assert limiter.tokens.capacity == 1000
+        assert parse_retry_after({"retry-after": "3"}) == 3.0
+
+    async def test_requests_are_paced_to_the_limit(self):
+        """An empty bucket admits requests at the refill rate."""
+        limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=0)
+        limiter.requests.tokens = 0
+
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+
+        assert time.monotonic() - start >= 0.25
+
+    def test_rate_limit_backs_off_and_recovers(self):
+        """429s cut the rate multiplicatively; successes restore it gradually."""
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=0)
+
+        limiter.record_rate_limit(0.0)
+        limiter.record_rate_limit(0.0)
+        assert limiter.scale == 0.25
+
+        limiter.record_success()
+        assert limiter.scale == pytest.approx(0.3)
+
+
+class TestScaffoldParser:
+    """Test memoized scaffold parsing."""
+
+    def test_parse_is_memoized_until_file_changes(self, scaffolds_dir, tmp_path):
+        """Unchanged files are parsed once; edits invalidate the cache."""
+        import os
+
+        scaffold_file = tmp_path / "bfs.md"
+        scaffold_file.write_text((scaffolds_dir / "01_graph" / "bfs.md").read_text(encoding="utf-8"))
+        parser = ScaffoldParser()
+
+        first = parser.parse_file(scaffold_file)
+        assert parser.parse_file(scaffold_file) is first
+
+        scaffold_file.write_text(scaffold_file.read_text().replace("Breadth-First", "Level-Order"))
+        stat = scaffold_file.stat()
+        os.utime(scaffold_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = parser.parse_file(scaffold_file)
+        assert second is not first
+        assert "Level-Order" in second.raw_content
+
+
+class TestBatchExecution:
+    """Test the Message Batches backend against the local stand-in."""
+
+    async def test_batch_results_map_back_to_test_cases(self, scaffolds_dir):
+        """Each batch result lands on the test case that produced it."""
+        provider = StubProvider(content="FINAL_ANSWER: [1, 2, 3]")
+        backend = BatchBackend(ClaudeProvider(api_key=""), LocalBatchClient(provider), poll_interval=0)
+        runner = VerificationRunner(provider, scaffolds_dir)
+        jobs = [
+            ScaffoldJob(name, UniversalGenerator(name).generate_suite(), get_validator_for_scaffold(name))
+            for name in ["merge_sort", "binary_search"]
+        ]
+
+        results = await runner.run_jobs_batch(jobs, backend)
+
+        for job, scaffold_results in zip(jobs, results):
+            assert [r.test_case.id for r in scaffold_results.test_results] == [
+                tc.id for tc in job.test_suite.test_cases
+            ]
+            assert all(r.error is None for r in scaffold_results.test_results)
+        assert provider.calls == sum(len(job.test_suite.test_cases) for job in jobs)
+
+    async def test_batch_errors_become_test_errors(self, scaffolds_dir):
+        """Requests that error inside the batch fail only their test case."""
+        provider = StubProvider(rate_limited=1)
+        backend = BatchBackend(ClaudeProvider(api_key=""), LocalBatchClient(provider, concurrency=1), poll_interval=0)
+        runner = VerificationRunner(provider, scaffolds_dir)
+        suite = UniversalGenerator("merge_sort").generate_suite()
+        job = ScaffoldJob("merge_sort", suite, get_validator_for_scaffold("merge_sort"))
+
+        [results] = await runner.run_jobs_batch([job], backend)
+
+        errors = [r for r in results.test_results if r.error is not None]
+        assert len(errors) == 1
+        assert "rate limited" in errors[0].error
+
+
+class TestPromptCaching:
+    """Test prompt-cache prefix marking and warm-up ordering."""
+
+    def test_build_params_marks_cacheable_prefix(self):
+        """The shared prefix and system prompt become cache_control blocks."""
+        request = LLMRequest(
+            prompt="INSTRUCTIONS\nproblem",
+            system_prompt="system",
+            cache_prefix="INSTRUCTIONS",
+            cache_system_prompt=True,
+        )
+
+        params = ClaudeProvider(api_key="").build_params(request, "m")
+
+        content = params["messages"][0]["content"]
+        assert content[0] == {"type": "text", "text": "INSTRUCTIONS", "cache_control": {"type": "ephemeral"}}
+        assert content[1] == {"type": "text", "text": "\nproblem"}
+        assert params["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+    async def test_first_case_warms_prefix_before_the_rest(self, scaffolds_dir, monkeypatch):
+        """A scaffold's other cases wait until its first case has finished."""
+        from verification.config import get_settings
+        monkeypatch.setattr(get_settings(), "enable_prompt_cache", True)
+        provider = StubProvider()
+        runner = VerificationRunner(provider, scaffolds_dir, max_concurrency=4)
+        suite = UniversalGenerator("merge_sort").generate_suite()
+        calls_when_started = []
+        original = provider.generate
+
+        async def generate(request, model=None):
+            calls_when_started.append(provider.in_flight)
+            return await original(request, model)
+
+        monkeypatch.setattr(provider, "generate", generate)
+        await runner.run_test_suite("merge_sort", suite, get_validator_for_scaffold("merge_sort"))
+
+        assert calls_when_started[0] == 0
+        assert calls_when_started[1] == 0
+        assert provider.peak_in_flight == 4
+
+
+class TestStreaming:
+    """Test early termination of streamed responses."""
+
+    def test_complete_once_every_field_is_closed(self):
+        """Multi-field and multi-line answers complete only when fully received."""
+        parser = IncrementalResponseParser("bfs")
+
+        assert not parser.feed("FINAL_DISTANCE: 2\nFINAL_PATH: [A, B")
+        assert not parser.feed(", C]")
+        assert parser.feed("\nSome closing remarks")
+
+        grid = IncrementalResponseParser("sudoku")
+        assert not grid.feed("FINAL_GRID: [[1, 2],\n")
+        assert grid.feed("[3, 4]]\n")
+
+    def test_no_solution_completes_answer(self):
+        """A no-solution answer ends the stream for algorithms that allow it."""
+        assert IncrementalResponseParser("subset_sum").feed("FINAL_ANSWER: NO_SOLUTION\n")
+
+    async def test_runner_stops_stream_at_final_answer(self, scaffolds_dir, monkeypatch):
+        """The runner stops reading once the answer is complete."""
+        from verification.config import get_settings
+        monkeypatch.setattr(get_settings(), "stream_responses", True)
+
+        class StreamingProvider(StubProvider):
+            async def generate_stream(self, request, model=None, stop_when=None):
+                text = ""
+                for chunk in ["Working...\n", "FINAL_ANSWER: [1, 2, 3]\n", "Let me double check"]:
+                    text += chunk
+                    if stop_when(chunk):
+                        return LLMResponse(content=text, model="stub-model", stopped_early=True)
+                return LLMResponse(content=text, model="stub-model")
+
+        runner = VerificationRunner(StreamingProvider(), scaffolds_dir)
+        suite = UniversalGenerator("merge_sort").generate_suite()
+
+        results = await runner.run_test_suite("merge_sort", suite, get_validator_for_scaffold("merge_sort"))
+
+        assert all(r.llm_response.stopped_early for r in results.test_results)
+        assert all("double check" not in r.llm_response.content for r in results.test_results)
+
+
+class TestProviders:
+    """Test the provider registry and the OpenAI-compatible backend."""
+
+    def test_registry_creates_providers_by_name(self):
+        """Providers are looked up by name, and unknown names are rejected."""
+        assert isinstance(get_provider("anthropic"), ClaudeProvider)
+        assert isinstance(get_provider("openai"), OpenAICompatibleProvider)
+        with pytest.raises(LLMError):
+            get_provider("nonexistent")
+
+    def test_claude_http_pool_settings(self, monkeypatch):
+        """The pool is sized to parallel_llm_calls by default, and keepalive and timeouts reach the client."""
+        from verification.config import get_settings
+        settings = get_settings()
+        monkeypatch.setattr(settings, "http_max_connections", 0)
+        monkeypatch.setattr(settings, "parallel_llm_calls", 7)
+        monkeypatch.setattr(settings, "http_keepalive_expiry_seconds", 12.0)
+        monkeypatch.setattr(settings, "connect_timeout_seconds", 3.0)
+        monkeypatch.setattr(settings, "pool_timeout_seconds", 9.0)
+        provider = ClaudeProvider(api_key="test-key")
+
+        options = provider._http_options()
+        assert options["max_connections"] == 7
+        assert (options["keepalive_expiry"], options["connect_timeout"], options["pool_timeout"]) == (12.0, 3.0, 9.0)
+        monkeypatch.setattr(settings, "http_max_connections", 3)
+        assert provider._http_options()["max_connections"] == 3
+
+        pytest.importorskip("httpx")
+        pytest.importorskip("anthropic")
+        client = provider._get_async_client()
+        pool = client._client._transport._pool
+        assert (pool._max_connections, pool._keepalive_expiry) == (3, 12.0)
+        assert (client.timeout.connect, client.timeout.pool) == (3.0, 9.0)
+
+    async def test_claude_generate_and_stream(self, monkeypatch):
+        """Both Claude paths read text, token usage and rate-limit headers back from the SDK client."""
+        from types import SimpleNamespace
+
+        from verification.llm import claude
+        monkeypatch.setattr(claude, "ANTHROPIC_AVAILABLE", True)
+        headers = {"anthropic-ratelimit-requests-remaining": "41", "content-type": "application/json"}
+        message = SimpleNamespace(
+            content=[SimpleNamespace(text="FINAL_ANSWER: [1, 2]\nDone")],
+            model="claude-test",
+            usage=SimpleNamespace(input_tokens=30, output_tokens=8, cache_read_input_tokens=20),
+        )
+
+        class RawResponse:
+            def __init__(self):
+                self.headers = headers
+
+            async def parse(self):
+                return message
+
+        class Stream:
+            text_stream_chunks = ["FINAL_ANSWER: [1, 2]\n", "Done"]
+            current_message_snapshot = message
+            response = SimpleNamespace(headers=headers)
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            @property
+            async def text_stream(self):
+                for chunk in self.text_stream_chunks:
+                    yield chunk
+
+        async def create(**kwargs):
+            return RawResponse()
+
+        provider = ClaudeProvider(api_key="test-key")
+        provider._async_client = SimpleNamespace(messages=SimpleNamespace(
+            with_raw_response=SimpleNamespace(create=create),
+            stream=lambda **kwargs: Stream(),
+        ))
+
+        response = await provider.generate(LLMRequest(prompt="question"))
+        assert response.content == "FINAL_ANSWER: [1, 2]\nDone"
+        assert (response.input_tokens, response.output_tokens, response.cache_read_input_tokens) == (30, 8, 20)
+        assert response.headers == {"anthropic-ratelimit-requests-remaining": "41"}
+
+        streamed = await provider.generate_stream(
+            LLMRequest(prompt="question"), stop_when=lambda chunk: "FINAL_ANSWER" in chunk,
+        )
+        assert streamed.content == "FINAL_ANSWER: [1, 2]\n"
+        assert streamed.stopped_early and streamed.input_tokens == 30
+        assert streamed.headers == {"anthropic-ratelimit-requests-remaining": "41"}
+
+    async def test_openai_compatible_fake_client(self, monkeypatch):
+        """Both paths map responses through a fake client, and malformed JSON surfaces as LLMError."""
+        from types import SimpleNamespace
+
+        from verification.llm import openai_compat
+        monkeypatch.setattr(openai_compat, "HTTPX_AVAILABLE", True)
+        monkeypatch.setattr(openai_compat, "httpx", SimpleNamespace(HTTPError=type("HTTPError", (Exception,), {})))
+        headers = {"x-ratelimit-remaining-requests": "9"}
+
+        class Response:
+            status_code = 200
+
+            def __init__(self, body):
+                self.text = body
+                self.headers = headers
+
+            def json(self):
+                return json.loads(self.text)
+
+            async def aread(self):
+                return self.text.encode()
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def aiter_lines(self):
+                for line in self.text.splitlines():
+                    yield line
+
+        bodies = []
+
+        async def post(url, json):
+            return Response(bodies.pop(0))
+
+        provider = OpenAICompatibleProvider("http://test/v1")
+        provider._client = SimpleNamespace(post=post, stream=lambda method, url, json: Response(bodies.pop(0)))
+        event = lambda **fields: "data: " + json.dumps(fields)
+
+        bodies.append(json.dumps({
+            "model": "local-model",
+            "choices": [{"message": {"content": "FINAL_ANSWER: 42"}}],
+            "usage": {"prompt_tokens": 12, "completion_tokens": 5},
+        }))
+        response = await provider.generate(LLMRequest(prompt="question"))
+        assert (response.content, response.input_tokens, response.output_tokens) == ("FINAL_ANSWER: 42", 12, 5)
+        assert response.headers == headers
+
+        bodies.append("\n".join([
+            event(choices=[{"delta": {"content": "FINAL_ANSWER: 4"}}]),
+            event(choices=[{"delta": {"content": "2"}}]),
+            event(choices=[], usage={"prompt_tokens": 12, "completion_tokens": 5}),
+            "data: [DONE]",
+        ]))
+        streamed = await provider.generate_stream(LLMRequest(prompt="question"))
+        assert (streamed.content, streamed.input_tokens, streamed.output_tokens) == ("FINAL_ANSWER: 42", 12, 5)
+        assert streamed.headers == headers
+
+        bodies.extend(["<html>Bad gateway</html>", event(choices=[{"delta": {"content": "FIN"}}])[:-5]])
+        with pytest.raises(LLMError, match="Malformed response body"):
+            await provider.generate(LLMRequest(prompt="question"))
+        with pytest.raises(LLMError, match="Malformed stream event"):
+            await provider.generate_stream(LLMRequest(prompt="question"))
+
+    async def test_openai_compatible_round_trip(self):
+        """Chat completions requests and responses map onto LLMRequest/LLMResponse."""
+        httpx = pytest.importorskip("httpx")
+        sent = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            sent.append(body)
+            if body["messages"][-1]["content"] == "too fast":
+                return httpx.Response(429, json={"error": {"message": "slow down"}}, headers={"retry-after": "2"})
+            return httpx.Response(200, json={
+                "model": "local-model",
+                "choices": [{"message": {"content": "FINAL_ANSWER: 42"}}],
+                "usage": {"prompt_tokens": 12, "completion_tokens": 5},
+            })
+
+        provider = OpenAICompatibleProvider("http://test/v1", transport=httpx.MockTransport(handler))
+        response = await provider.generate(LLMRequest(prompt="question", system_prompt="scaffold"))
+
+        assert response.content == "FINAL_ANSWER: 42"
+        assert (response.input_tokens, response.output_tokens) == (12, 5)
+        assert sent[0]["messages"] == [
+            {"role": "system", "content": "scaffold"},
+            {"role": "user", "content": "question"},
+        ]
+        with pytest.raises(RateLimitError) as e:
+            await provider.generate(LLMRequest(prompt="too fast"))
+        assert e.value.retry_after == 2.0
+        await provider.aclose()
+
+
+class TestReplay:
+    """Test recording responses and replaying them offline."""
+
+    async def test_replay_reproduces_recorded_run(self, scaffolds_dir, tmp_path):
+        """A replayed run gets the recorded answers without calling the provider."""
+        cassette = tmp_path / "cassette.jsonl"
+        suite = UniversalGenerator("merge_sort").generate_suite()
+        validator = get_validator_for_scaffold("merge_sort")
+        provider = StubProvider(content="FINAL_ANSWER: [1, 2, 3]")
+
+        recorded = await VerificationRunner(RecordingProvider(provider, cassette), scaffolds_dir).run_test_suite(
+            "merge_sort", suite, validator,
+        )
+        replay = ReplayProvider(cassette)
+        replayed = await VerificationRunner(replay, scaffolds_dir).run_test_suite("merge_sort", suite, validator)
+
+        assert replay.default_model == "stub-model"
+        assert provider.calls == len(suite.test_cases)
+        assert [r.passed for r in replayed.test_results] == [r.passed for r in recorded.test_results]
+        assert [r.llm_response.content for r in replayed.test_results] == ["FINAL_ANSWER: [1, 2, 3]"] * len(suite.test_cases)
+
+    async def test_injected_errors_are_deterministic(self, scaffolds_dir, tmp_path, fast_retries):
+        """Error injection depends only on the seed, not on scheduling."""
+        cassette = tmp_path / "cassette.jsonl"
+        suite = UniversalGenerator("merge_sort").generate_suite()
+        validator = get_validator_for_scaffold("merge_sort")
+        await VerificationRunner(RecordingProvider(StubProvider(), cassette), scaffolds_dir).run_test_suite(
+            "merge_sort", suite, validator,
+        )
+
+        async def errors(max_concurrency):
+            profile = ReplayProfile(error_rate=0.8)
+            runner = VerificationRunner(ReplayProvider(cassette, profile, seed=7), scaffolds_dir, max_concurrency)
+            results = await runner.run_test_suite("merge_sort", suite, validator)
+            # Identical requests share one sequence of outcomes, so compare per request
+            return sorted(
+                (json.dumps(case.input), r.error or "") for case, r in zip(suite.test_cases, results.test_results)
+            )
+
+        assert await errors(1) == await errors(4)
+        assert any(error for _, error in await errors(4))
+
+
+class TestBenchmarks:
+    """Test the pipeline benchmark harness."""
+
+    def test_benchmark_report_and_compare(self):
+        """Every stage is timed, synthesized answers pass, and slowdowns are flagged."""
+        report = run_benchmarks(["merge_sort"], repeat=1, latency_ms=1.0)
+
+        stages = report["scaffolds"]["merge_sort"]
+        assert stages["test_cases"] > 0
+        assert all(stages[stage] >= 0 for stage in ["generate_ms", "prompt_ms", "parse_ms", "validate_ms"])
+        assert report["throughput"]["pass_rate"] == 1.0
+        assert compare(report, report) == []
+
+        faster = {**report, "scaffolds": {"merge_sort": {**stages, "parse_ms": stages["parse_ms"] / 2}}}
+        assert [r.split(":")[0] for r in compare(report, faster)] == ["merge_sort parse_ms"]
+
+    def test_benchmark_leaves_response_cache_untouched(self, monkeypatch, tmp_path):
+        """Synthesized answers are never written to (or served from) the response cache."""
+        from verification.config import get_settings
+        monkeypatch.setattr(get_settings(), "enable_cache", True)
+        monkeypatch.setattr(get_settings(), "cache_dir", tmp_path / "cache")
+
+        run_benchmarks(["merge_sort"], repeat=1, latency_ms=1.0)
+
+        assert not (tmp_path / "cache" / ResponseCache.DB_NAME).exists()
+
+
+class TestStageTimings:
+    """Test per-stage latency instrumentation."""
+
+    async def test_stages_recorded_and_aggregated(self, scaffolds_dir):
+        """Each result records where its time went, and scaffolds report percentiles."""
+        provider = StubProvider(delay=0.02)
+        runner = VerificationRunner(provider, scaffolds_dir, max_concurrency=1)
+        suite = UniversalGenerator("merge_sort").generate_suite()
+
+        results = await runner.run_test_suite("merge_sort", suite, get_validator_for_scaffold("merge_sort"))
+
+        timings = results.test_results[-1].timings
+        assert timings.request_ms >= 20
+        assert timings.queue_ms >= 15  # waited for the previous case's slot
+        assert timings.prompt_ms > 0 and timings.parse_ms > 0
+
+        latency = results.to_dict()["summary"]["latency_ms"]
+        assert latency["request_ms"]["p50"] <= latency["request_ms"]["p99"] <= latency["total_ms"]["p99"]
+        restored = ScaffoldResults.from_dict(results.to_dict())
+        assert restored.latency_percentiles() == results.latency_percentiles()
+
+    def test_percentile(self):
+        assert percentile([], 50) == 0.0
+        assert percentile([4, 1, 3, 2], 50) == 2.5
+        assert percentile(list(range(101)), 95) == 95
+
+
+class TestTracing:
+    """Test tracing spans around the pipeline stages."""
+
+    async def test_spans_nest_per_test_case(self, scaffolds_dir):
+        """Each test case gets a lane holding its parse and validation spans."""
+        tracer = RecordingTracer()
+        set_tracer(tracer)
+        try:
+            runner = VerificationRunner(StubProvider(content="FINAL_ANSWER: [1]"), scaffolds_dir)
+            suite = UniversalGenerator("merge_sort").generate_suite()
+            await runner.run_test_suite("merge_sort", suite, get_validator_for_scaffold("merge_sort"))
+        finally:
+            set_tracer(Tracer())
+
+        roots = [s for s in tracer.spans if s.name == "runner.run_test_case"]
+        assert len(roots) == len(suite.test_cases)
+        assert {s.attributes["tier"] for s in roots} == {"simple", "standard", "edge"}
+
+        by_id = {s.span_id: s for s in tracer.spans}
+        parses = [s for s in tracer.spans if s.name == "response_parser.parse"]
+        assert len(parses) == len(roots)
+        assert all(by_id[s.parent_id].name == "runner.run_test_case" for s in parses)
+        assert all(by_id[s.parent_id].lane == s.lane for s in parses)
+
+        trace = tracer.to_chrome_trace()
+        assert {e["ph"] for e in trace["traceEvents"]} == {"X"}
+
+
+class MeteredProvider(StubProvider):
+    """Stub provider reporting fixed token usage for a priced model."""
+
+    @property
+    def default_model(self) -> str:
+        return "claude-3-haiku-20240307"
+
+    async def generate(self, request: LLMRequest, model: str | None = None) -> LLMResponse:
+        response = await super().generate(request, model)
+        response.input_tokens = 400
+        response.output_tokens = 600
+        return response
+
+
+class TestCostTracking:
+    """Test cost accounting and budget enforcement."""
+
+    async def test_budget_stops_new_requests(self, scaffolds_dir):
+        """Once the token budget would be exceeded, remaining cases are refused, not sent."""
+        provider = MeteredProvider()
+        tracker = CostTracker(max_cost=0, max_tokens=5000)
+        runner = VerificationRunner(provider, scaffolds_dir, max_concurrency=1, cost_tracker=tracker)
+        suite = UniversalGenerator("merge_sort").generate_suite()
+
+        results = await runner.run_test_suite("merge_sort", suite, get_validator_for_scaffold("merge_sort"))
+
+        refused = [r for r in results.test_results if r.error and "Budget" in r.error]
+        assert 0 < provider.calls < len(suite.test_cases)
+        assert len(refused) == tracker.refused == len(suite.test_cases) - provider.calls
+        assert tracker.total_tokens == provider.calls * 1000 <= 5000
+
+        expected = provider.calls * (400 * 0.25 + 600 * 1.25) / 1_000_000
+        assert tracker.cost == pytest.approx(expected)
+        assert results.to_dict()["summary"]["cost_usd"] == pytest.approx(expected)
+        assert get_pricing("local-model") is None
+
+
+class TestDashboard:
+    """Test the live progress dashboard."""
+
+    async def test_tracks_results_while_running(self, scaffolds_dir):
+        """The dashboard sees calls in flight and counts every finished case."""
+        provider = StubProvider(content="FINAL_ANSWER: [1]", delay=0.05)
+        runner = VerificationRunner(provider, scaffolds_dir, max_concurrency=3)
+        suite = UniversalGenerator("merge_sort").generate_suite()
+        job = ScaffoldJob("merge_sort", suite, get_validator_for_scaffold("merge_sort"))
+        stream = io.StringIO()
+        dashboard = Dashboard(runner, len(suite.test_cases), stream=stream)
+        seen_in_flight = []
+
+        async def watch():
+            while dashboard.completed < dashboard.total:
+                seen_in_flight.append(dashboard.stats()["in_flight"])
+                await asyncio.sleep(0.01)
+
+        dashboard.start()
+        _, results = await asyncio.gather(watch(), runner.run_jobs([job], on_result=dashboard.record))
+        await dashboard.stop()
+
+        stats = dashboard.stats()
+        assert max(seen_in_flight) == 3
+        assert stats["completed"] == stats["total"] == len(suite.test_cases)
+        assert stats["in_flight"] == 0 and stats["eta_seconds"] == 0
+        assert stats["pass_rate"] == results[0].pass_rate
+        assert f"{len(suite.test_cases)}/{len(suite.test_cases)} cases" in stream.getvalue()
@@ -0,0 +1,276 @@
+"""
+Lightweight tracing for verification runs.
+
+Spans follow the OpenTelemetry shape (a name, start/end times,
+attributes and a parent) and are opened with
+get_tracer().start_as_current_span(). The default tracer records
+nothing, so instrumented code costs next to nothing unless a run opts
+in with --trace. RecordingTracer keeps spans in memory and exports them
+in the Chrome trace event format. Load the file in chrome://tracing or
+https://ui.perfetto.dev to see concurrency and stragglers on a timeline.
+"""
+
+import asyncio
+import functools
+import inspect
+import itertools
+import json
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+class Span:
+    """A span that records nothing."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+        pass
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        """Attach several attributes to the span."""
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+
+class Tracer:
+    """Tracer that records nothing (the default)."""
+
+    recording = False
+    """Whether spans are kept; traced() skips building attributes when not."""
+
+    @contextmanager
+    def start_as_current_span(self, name: str, attributes: dict[str, Any] | None = None) -> Iterator[Span]:
+        """
+        Open a span for the duration of a with block.
+
+        Args:
+            name: Operation name (e.g., 'llm.generate').
+            attributes: Initial attributes.
+
+        Yields:
+            The span, for attaching attributes known only at the end.
+        """
+        yield _NOOP_SPAN
+
+
+_NOOP_SPAN = Span()
+
+
+@dataclass
+class RecordedSpan(Span):
+    """A finished or in-progress span kept by a RecordingTracer."""
+
+    name: str
+    """Operation name."""
+
+    span_id: int
+    """Identifier unique within the tracer."""
+
+    parent_id: int | None
+    """Identifier of the enclosing span, if any."""
+
+    lane: int
+    """Timeline row; concurrent operations get separate lanes."""
+
+    start_us: float
+    """Start time in microseconds since the tracer was created."""
+
+    end_us: float = 0.0
+    """End time in microseconds since the tracer was created."""
+
+    attributes: dict[str, Any] = field(default_factory=dict)
+    """Span attributes (scaffold, model, token counts, ...)."""
+
+    task: Any = None
+    """asyncio task the span was opened in (not exported)."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration_us(self) -> float:
+        return self.end_us - self.start_us
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_us": self.start_us,
+            "duration_us": self.duration_us,
+            "attributes": self.attributes,
+        }
+
+
+# The innermost open span of the current task, across all recording tracers
+_current_span: ContextVar[RecordedSpan | None] = ContextVar("current_span", default=None)
+
+
+class RecordingTracer(Tracer):
+    """Tracer that keeps every span in memory for export."""
+
+    recording = True
+
+    def __init__(self):
+        self.spans: list[RecordedSpan] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._ids = itertools.count(1)
+        self._busy_lanes: set[int] = set()
+
+    def _now_us(self) -> float:
+        return (time.perf_counter_ns() - self._origin_ns) / 1000
+
+    def _take_lane(self) -> int:
+        """Reserve the lowest free timeline lane."""
+        lane = next(i for i in itertools.count() if i not in self._busy_lanes)
+        self._busy_lanes.add(lane)
+        return lane
+
+    @contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: dict[str, Any] | None = None,
+    ) -> Iterator[RecordedSpan]:
+        parent = _current_span.get()
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+
+        # Spans nest within their task; a span opened in another task
+        # (e.g., one of many concurrent test cases) starts its own lane
+        owns_lane = parent is None or parent.task is not task
+        span = RecordedSpan(
+            name=name,
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent else None,
+            lane=self._take_lane() if owns_lane else parent.lane,
+            start_us=self._now_us(),
+            attributes=dict(attributes or {}),
+            task=task,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_attribute("error", f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            span.end_us = self._now_us()
+            _current_span.reset(token)
+            self.spans.append(span)
+            if owns_lane:
+                self._busy_lanes.discard(span.lane)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Convert the recorded spans to Chrome trace event format.
+
+        Returns:
+            Trace document with one complete ('X') event per span.
+        """
+        return {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": span.name.split(".")[0],
+                    "ph": "X",
+                    "ts": span.start_us,
+                    "dur": span.duration_us,
+                    "pid": 1,
+                    "tid": span.lane,
+                    "args": span.attributes,
+                }
+                for span in sorted(self.spans, key=lambda s: s.start_us)
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def export_chrome(self, path: Path) -> Path:
+        """Write the spans as a Chrome trace (chrome://tracing, Perfetto)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, default=str)
+        return path
+
+    def export_json(self, path: Path) -> Path:
+        """Write the spans as a flat JSON list."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([span.to_dict() for span in self.spans], f, indent=2, default=str)
+        return path
+
+
+_tracer: Tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer."""
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> None:
+    """
+    Replace the process-wide tracer.
+
+    Args:
+        tracer: Tracer to use (Tracer() turns tracing off again).
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def traced(
+    name: str,
+    attributes: Callable[..., dict[str, Any]] | None = None,
+    result_attributes: Callable[[Any], dict[str, Any]] | None = None,
+) -> Callable:
+    """
+    Decorate a function or coroutine function to run inside a span.
+
+    Args:
+        name: Span name.
+        attributes: Called with the function's arguments; returns the
+            span's initial attributes.
+        result_attributes: Called with the return value; returns
+            attributes added when the call finishes.
+
+    Returns:
+        Decorator.
+    """
+    def decorator(fn: Callable) -> Callable:
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                tracer = get_tracer()
+                if not tracer.recording:
+                    return await fn(*args, **kwargs)
+                with tracer.start_as_current_span(
+                    name, attributes(*args, **kwargs) if attributes else None,
+                ) as span:
+                    result = await fn(*args, **kwargs)
+                    if result_attributes:
+                        span.set_attributes(result_attributes(result))
+                    return result
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            tracer = get_tracer()
+            if not tracer.recording:
+                return fn(*args, **kwargs)
+            with tracer.start_as_current_span(
+                name, attributes(*args, **kwargs) if attributes else None,
+            ) as span:
+                result = fn(*args, **kwargs)
+                if result_attributes:
+                    span.set_attributes(result_attributes(result))
+                return result
+        return wrapper
+
+    return decorator
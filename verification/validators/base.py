@@ -40,6 +40,18 @@ class ValidationResult:
             "details": self.details,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ValidationResult":
+        """Create from dictionary."""
+        return cls(
+            is_valid=data.get("is_valid", False),
+            score=data.get("score", 0.0),
+            message=data.get("message", ""),
+            expected=data.get("expected"),
+            actual=data.get("actual"),
+            details=data.get("details", {}),
+        )
+
 
 class Validator(ABC):
     """Abstract base class for validators."""
@@ -25,11 +25,28 @@ COMMANDS:
     python verify.py --category graph      # Verify all graph algorithms
     python verify.py --mode cert           # Use Opus for final certification
     python verify.py report                # Regenerate reports from results
+    python verify.py cache stats           # Show response cache usage
+    python verify.py cache prune           # Evict least recently used responses
+    python verify.py cache compact         # Reclaim cache disk space
 
 OPTIONS:
     --mode dev   Use Claude Haiku (faster, cheaper) - DEFAULT
     --mode cert  Use Claude Opus (final certification)
     --category   Verify all scaffolds in a category
+    --no-cache   Ignore cached LLM responses
+    --stream     Stop each response once its FINAL_* answer is complete
+    --no-dashboard  Print a line per scaffold instead of the live progress dashboard
+    --batch      Submit everything as one Message Batches job (cheaper, slower)
+    --resume ID  Continue an interrupted run, skipping finished test cases
+    --incremental  Only re-verify scaffolds whose inputs changed since the last run
+    --models a,b   Verify against several models in one run and compare them
+    --provider openai  Verify against an OpenAI-compatible server (e.g. local vLLM)
+    --base-url URL     Server URL for --provider openai
+    --record FILE      Record every LLM response to a cassette file
+    --replay FILE      Replay a cassette offline instead of calling an API
+    --trace FILE       Write a Chrome/Perfetto timeline of the run
+    --max-cost USD     Stop sending requests once the run would cost more than this
+    --max-tokens N     Stop sending requests once the run would use more tokens than this
 
 CATEGORIES:
     graph, divide_conquer, greedy, backtracking,
@@ -39,6 +56,7 @@ OUTPUT:
     Results are saved to verification_results/
     - data/          JSON results for each scaffold
     - reports/       Markdown certification reports
+    - runs/          Per-run journals of finished test cases (for --resume)
 
 EXAMPLES:
     # Quick test with one scaffold
@@ -50,6 +68,25 @@ EXAMPLES:
     # Full certification with Opus
     python verify.py --mode cert
 
+    # Full certification, spending at most $5
+    python verify.py --mode cert --max-cost 5
+
+    # Full certification via the (cheaper) Message Batches API
+    python verify.py --mode cert --batch
+
+    # Compare Haiku and Opus side by side (results in data/models/<model>/)
+    python verify.py --models claude-3-haiku-20240307,claude-3-opus-20240229
+
+    # Verify against a model served locally by llama.cpp or vLLM
+    python verify.py --provider openai --base-url http://localhost:8000/v1 dijkstra
+
+    # Record a run once, then replay it offline with realistic latency
+    python verify.py --category graph --record graph.jsonl
+    python verify.py --category graph --replay graph.jsonl --replay-profile recorded
+
+    # Continue a run that was interrupted (run ID is printed at start)
+    python verify.py --resume 20250101-120000
+
     # Regenerate reports from existing results
     python verify.py report
 """
@@ -82,6 +119,7 @@ USAGE:
   python verify.py --category graph   Verify a category
   python verify.py --mode cert        Use Opus (final certification)
   python verify.py report             Generate reports
+  python verify.py cache stats        Show response cache usage
 
 For full help: python verify.py --help
 """)